@@ -1,80 +1,58 @@
 import numpy as np
 
 def is_dual_feasible(tableau):
-    # Check if all RHS values (excluding the objective row) are non-negative
-    return np.all(tableau[1:, -1] >= 0)
-
-def dual_simplex(objective_coeffs, constraint_matrix, rhs_values, senses, verbose=True):
-    # 1. Convert to Standard Form (all constraints as <= for the dual)
-    A = np.array(constraint_matrix)
-    b = np.array(rhs_values)
-    c = np.array(objective_coeffs)
-
-    # 2. Create the Dual Problem
-    # Dual objective: maximize b^T y
-    dual_objective_coeffs = b
-    # Dual constraints: A^T y <= c
-    dual_constraint_matrix = A.T
-    dual_rhs_values = c
-    dual_senses = ['<='] * len(c)  # All dual constraints are <=
-
-    # 3. Solve the Dual using tabular_simplex (which handles maximization)
-    status, dual_solution, dual_optimal = tabular_simplex(dual_objective_coeffs, dual_constraint_matrix, dual_rhs_values, dual_senses, problem_type='max', verbose=verbose)
-
-    if status == 'optimal':
-        # Strong duality: dual optimal = primal optimal
-        primal_optimal = dual_optimal
-
-        # Find primal solution using complementary slackness
-        primal_solution = find_primal_solution(dual_solution, constraint_matrix, objective_coeffs)
-
-        return status, primal_solution, primal_optimal # Return primal optimal value
-    else:  # Dual is infeasible or unbounded, meaning primal is infeasible or unbounded.
-        return status, None, None
-
-def find_primal_solution(dual_solution, constraint_matrix, objective_coeffs):
-    """
-    Finds the primal solution using complementary slackness.
-
-    Args:
-        dual_solution (np.array): Optimal solution of the dual problem.
-        constraint_matrix (np.array): Constraint matrix of the primal problem.
-        objective_coeffs (np.array): Objective coefficients of the primal problem.
-
-    Returns:
-        np.array: Primal solution.
-    """
-    num_original_vars = len(objective_coeffs)
-    num_constraints = constraint_matrix.shape[0]
-    primal_solution = np.zeros(num_original_vars)
-
-    # Identify binding constraints in the dual
-    binding_constraints_dual = np.where(dual_solution > 1e-6)[0]  # Use a small tolerance
-
-    # Set corresponding primal variables to zero
-    non_binding_constraints_dual = np.setdiff1d(np.arange(num_constraints), binding_constraints_dual)
-    for i in non_binding_constraints_dual:
-        # Find columns in constraint matrix corresponding to non-binding constraints
-        # and set corresponding primal variables to zero
-        primal_solution[i] = 0
-
-    # For binding constraints, solve a reduced system of equations
-    A_reduced = constraint_matrix[binding_constraints_dual, :]
-    b_reduced = objective_coeffs[binding_constraints_dual]
-
-    # Check if the reduced system is solvable
-    if A_reduced.shape[1] >= A_reduced.shape[0]:
-        try:
-            # Solve the reduced system using least squares
-            primal_solution, _, _, _ = np.linalg.lstsq(A_reduced, b_reduced, rcond=None)
-        except np.linalg.LinAlgError:
-            print("Singular matrix encountered. Cannot solve for primal variables.")
-            return None
-    else:
-        print("Underdetermined system. Cannot uniquely solve for primal variables.")
-        return None
+    # Check if all coefficients in the objective row (excluding the RHS) are non-negative
+    return np.all(tableau[0, :-1] >= 0)
+
+def dual_simplex(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type='min', verbose=True):
+    # 1. Write every constraint as '<=': negate '>=' rows and split '=' rows into two,
+    #    so the slack basis needs no artificial variables (its RHS may be negative).
+    A_rows, b_rows = [], []
+    for i, sense in enumerate(senses):
+        if sense in ('<=', '='):
+            A_rows.append(constraint_matrix[i, :])
+            b_rows.append(rhs_values[i])
+        if sense in ('>=', '='):
+            A_rows.append(-constraint_matrix[i, :])
+            b_rows.append(-rhs_values[i])
+    A = np.array(A_rows, dtype=float)
+    b = np.array(b_rows, dtype=float)
+    num_constraints, num_original_vars = A.shape
+    tableau, basis = setup_tableau(np.asarray(objective_coeffs, dtype=float), A, b, ['<='] * num_constraints, problem_type)
+
+    # 2. Dual simplex keeps the objective row nonnegative and removes negative RHS values
+    if not is_dual_feasible(tableau):
+        if verbose:
+            print("The initial tableau is not dual feasible; use the primal simplex method instead.")
+        return 'not_dual_feasible', None, None
+
+    iteration = 0
+    while True:
+        iteration += 1
+        if verbose:
+            print_tableau(tableau, iteration)
 
-    return primal_solution
+        leaving_row = select_leaving_variable_dual(tableau)
+        if leaving_row is None:
+            # Every RHS is nonnegative: the basis is primal feasible and therefore optimal
+            optimal_solution, optimal_objective_value = extract_solution(tableau, basis, num_original_vars, problem_type)
+            if verbose:
+                print("All right-hand side values are nonnegative: the current solution is optimal.")
+                print("Solution:", np.round(optimal_solution, 3))
+                print("Objective value:", round(optimal_objective_value, 3))
+            return 'optimal', optimal_solution, optimal_objective_value
+
+        entering_col_index = select_entering_variable_dual(tableau, leaving_row)
+        if entering_col_index is None:
+            if verbose:
+                print(f"Row {leaving_row} has a negative RHS but no negative entry. The problem is infeasible!")
+            return 'infeasible', None, None
+
+        if verbose:
+            print(f"Leaving row (most negative RHS): {leaving_row}")
+            print(f"Entering column (dual ratio test): {entering_col_index}")
+        tableau = pivot(tableau, entering_col_index, leaving_row)
+        basis[leaving_row - 1] = entering_col_index
 
 def select_leaving_variable_dual(tableau):
     rhs = tableau[1:, -1]
@@ -103,35 +81,13 @@ def print_tableau(tableau, iteration=None):
     print(np.array_str(tableau, precision=3, suppress_small=True))
     print("-" * 50)
 
-def solve_dual_problem(objective_coeffs, constraint_matrix, rhs_values, senses, verbose=True):
-    # Transform primal constraints
-    tcm, trhs = transform_constraints(constraint_matrix, rhs_values, senses)
-    # For a primal minimization problem:
-    # Dual objective: maximize b^T y, so use transformed RHS as dual objective coefficients.
-    dual_objective_coeffs = trhs.copy()
-    # Dual constraints: A^T y <= c, where c is the original objective coefficients.
-    dual_constraint_matrix = tcm.T
-    dual_rhs_values = objective_coeffs.copy()
-    dual_senses = ['<='] * len(objective_coeffs)  # assume all dual variables are nonnegative
-    
-    if verbose:
-        print("Constructed dual problem from primal minimization problem.")
-    # Solve the dual as a maximization problem using tabular_simplex.
-    status, dual_solution, dual_optimal = tabular_simplex(dual_objective_coeffs, dual_constraint_matrix, dual_rhs_values, dual_senses, problem_type='max', verbose=verbose)
-    if verbose and status == 'optimal':
-        print("Dual problem solved optimally.")
-        print("Dual solution:", np.round(dual_solution, 3))
-        print("Dual optimal objective value:", round(dual_optimal, 3))
-    # Under strong duality, the dual optimal value equals the primal optimal value.
-    return status, dual_solution, dual_optimal
-
-# Modify tabular_simplex to use the dual formulation for minimization problems.
+# tabular_simplex uses the dual simplex method for minimization problems that start dual feasible.
 def tabular_simplex(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type='max', verbose=True):
     num_constraints, num_original_vars = constraint_matrix.shape
 
     # Transform constraints if needed
     transformed_constraint_matrix, transformed_rhs_values = transform_constraints(constraint_matrix, rhs_values, senses)
-    tableau = setup_tableau(objective_coeffs, transformed_constraint_matrix, transformed_rhs_values, senses, problem_type)
+    tableau, basis = setup_tableau(objective_coeffs, transformed_constraint_matrix, transformed_rhs_values, senses, problem_type)
 
     if verbose:
         print("\nInitial Tableau:")
@@ -139,18 +95,11 @@ def tabular_simplex(objective_coeffs, constraint_matrix, rhs_values, senses, pro
         print("Explanation: We reach the solution when all coefficients in the objective row (first row) "
               "are nonnegative. This means that no further improvements can be achieved.")
 
-    # If it's a minimization problem, create and solve the dual problem.
-    if problem_type == 'min':
-        if verbose:
-            print("Converting minimization problem to its dual formulation for solution.")
-        return solve_dual_problem(objective_coeffs, constraint_matrix, rhs_values, senses, verbose)
-
-    # Initial infeasibility check (e.g., checking artificial variables)
-    status = check_infeasibility(tableau, num_original_vars, senses, num_constraints)
-    if status == 'infeasible':
+    # If it's a minimization problem with a dual feasible start, pivot with the dual simplex method.
+    if problem_type == 'min' and np.all(np.asarray(objective_coeffs) >= 0):
         if verbose:
-            print("The problem is infeasible at the initial tableau.")
-        return status, None, None
+            print("The objective row is nonnegative, so the dual simplex method is used.")
+        return dual_simplex(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, verbose)
 
     iteration = 0
     while True:
@@ -165,7 +114,12 @@ def tabular_simplex(objective_coeffs, constraint_matrix, rhs_values, senses, pro
             if verbose:
                 print("All coefficients in the objective row are now nonnegative.")
                 print("Explanation: No further improvement is possible so the current solution is optimal.")
-            optimal_solution, optimal_objective_value = extract_solution(tableau, num_original_vars, num_constraints, problem_type)
+            # Infeasibility check: an artificial variable still basic at a nonzero value violates its constraint
+            if check_infeasibility(tableau, basis, num_original_vars, senses) == 'infeasible':
+                if verbose:
+                    print("An artificial variable is still basic with a nonzero value: the problem is infeasible!")
+                return 'infeasible', None, None
+            optimal_solution, optimal_objective_value = extract_solution(tableau, basis, num_original_vars, problem_type)
             if np.any(np.dot(transformed_constraint_matrix, optimal_solution) > transformed_rhs_values + 1e-6):
                 if verbose:
                     print("After checking, there is a violation in the constraints (infeasible basic variable)!")
@@ -187,7 +141,7 @@ def tabular_simplex(objective_coeffs, constraint_matrix, rhs_values, senses, pro
         if verbose:
             print("Calculating ratios for the pivot operation (RHS divided by pivot column coefficient):")
             for idx, ratio in enumerate(ratios, start=1):
-                if tableau[idx, entering_col_index] > 0:
+                if np.isfinite(ratio):
                     print(f"Row {idx}: RHS = {tableau[idx, -1]:.3f}, Coefficient = {tableau[idx, entering_col_index]:.3f}, Ratio = {tableau[idx, -1]:.3f} / {tableau[idx, entering_col_index]:.3f} = {ratio:.3f}")
                 else:
                     print(f"Row {idx}: Coefficient = {tableau[idx, entering_col_index]:.3f} (Not eligible for pivot, ratio = inf)")
@@ -202,38 +156,35 @@ def tabular_simplex(objective_coeffs, constraint_matrix, rhs_values, senses, pro
         if verbose:
             print(f"Leaving variable (minimum ratio) is at row index: {leaving_row}")
 
-        # Perform the pivot operation.
+        # Perform the pivot operation and record the new basic variable of the leaving row.
         tableau = pivot(tableau, entering_col_index, leaving_row)
+        basis[leaving_row - 1] = entering_col_index
         if verbose:
             print("After pivot operation, the tableau is updated as follows:")
             print_tableau(tableau, iteration)
 
-def check_infeasibility(tableau, num_original_vars, senses, num_constraints):
+def check_infeasibility(tableau, basis, num_original_vars, senses):
     # This check looks for artificial basic variables with nonzero values.
+    # basis[i] is the column that is basic in row i + 1, so no row has to be scanned.
     num_slack_vars = senses.count('<=')
     artificial_vars_start = num_original_vars + num_slack_vars
 
-    for i in range(num_constraints):
-        basic_variable_cols = np.where(tableau[i+1, :num_original_vars + num_slack_vars + num_constraints] == 1)[0]
-        if len(basic_variable_cols) > 0:
-            basic_var = basic_variable_cols[0]
-            if basic_var >= artificial_vars_start and tableau[i+1, -1] != 0:
-                return 'infeasible'
+    artificial_rows = np.flatnonzero(basis >= artificial_vars_start)
+    if np.any(tableau[artificial_rows + 1, -1] != 0):
+        return 'infeasible'
     return None
 
 def select_entering_variable(tableau):
     # Identify the most negative coefficient in the objective row (excluding the RHS).
     return np.argmin(tableau[0, :-1])
 
-def calculate_ratios(tableau, entering_col_index):
-    ratios = []
-    # Compute ratios for each constraint (row 1 and onward)
-    for i in range(1, tableau.shape[0]):
-        if tableau[i, entering_col_index] > 0:
-            ratios.append(tableau[i, -1] / tableau[i, entering_col_index])
-        else:
-            ratios.append(np.inf)
-    return np.array(ratios)
+def calculate_ratios(tableau, entering_col_index, pivot_tol=1e-9):
+    # Compute ratios for each constraint (row 1 and onward); entries too small to pivot on are not eligible
+    column = tableau[1:, entering_col_index]
+    eligible = column > pivot_tol
+    ratios = np.full(column.shape, np.inf)
+    ratios[eligible] = tableau[1:, -1][eligible] / column[eligible]
+    return ratios
 
 def select_leaving_variable(tableau, entering_col_index):
     ratios = calculate_ratios(tableau, entering_col_index)
@@ -277,6 +228,7 @@ def setup_tableau(objective_coeffs, constraint_matrix, rhs_values, senses, probl
     num_total_vars = num_original_vars + num_slack_vars + num_artificial_vars
 
     tableau = np.zeros((num_constraints + 1, num_total_vars + 1))
+    basis = np.zeros(num_constraints, dtype=int)  # Column that is basic in each constraint row
     tableau[0, :num_original_vars] = -objective_coeffs  # Negate objective coefficients here
 
     slack_surplus_index = num_original_vars
@@ -287,25 +239,24 @@ def setup_tableau(objective_coeffs, constraint_matrix, rhs_values, senses, probl
 
         if senses[i] == '<=':
             tableau[i + 1, slack_surplus_index] = 1
+            basis[i] = slack_surplus_index
             slack_surplus_index += 1
         elif senses[i] == '>=' or senses[i] == '=':
             # For '>=' or '=' constraints, add an artificial variable to help find a basic feasible solution.
             tableau[i + 1, artificial_index - num_surplus_vars] = 1
+            basis[i] = artificial_index - num_surplus_vars
             artificial_index += 1
             if senses[i] == '>=':
                 # Also add a surplus variable (which will have a negative sign)
                 tableau[i + 1, slack_surplus_index] = -1
                 slack_surplus_index += 1
-    return tableau
+    return tableau, basis
 
-def extract_solution(tableau, num_original_vars, num_constraints, problem_type='max'):
+def extract_solution(tableau, basis, num_original_vars, problem_type='max'):
     optimal_solution = np.zeros(num_original_vars)
-    # Look through each original variable column to see if it's a basic variable.
-    for i in range(num_original_vars):
-        column = tableau[:, i]
-        if np.sum(np.abs(column)) == 1 and np.count_nonzero(column == 1) == 1:
-            basic_variable_row = np.where(column == 1)[0][0]
-            optimal_solution[i] = tableau[basic_variable_row, -1]
+    # The basic original variables take the RHS value of their row; all others are zero.
+    structural_rows = np.flatnonzero(basis < num_original_vars)
+    optimal_solution[basis[structural_rows]] = tableau[structural_rows + 1, -1]
 
     optimal_objective_value = tableau[0, -1]
     if problem_type == 'min':
@@ -0,0 +1,195 @@
+import numpy as np
+from typing import List, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+def validate_batch_inputs(
+    objective_coeffs: np.ndarray,
+    constraint_matrix: np.ndarray,
+    rhs_values: np.ndarray,
+    senses: List[str],
+    problem_type: str = 'max'
+) -> None:
+    """
+    Validates a stack of same-shaped problems once for the whole batch.
+
+    Raises:
+        ValueError: If the arrays are not (B, n), (B, m, n) and (B, m) or the senses are invalid.
+    """
+    if not isinstance(constraint_matrix, np.ndarray) or constraint_matrix.ndim != 3:
+        raise ValueError("Constraint matrices must be a 3D numpy array of shape (B, m, n).")
+    batch_size, num_constraints, num_variables = constraint_matrix.shape
+    if not isinstance(objective_coeffs, np.ndarray) or objective_coeffs.shape != (batch_size, num_variables):
+        raise ValueError("Objective coefficients must be a numpy array of shape (B, n).")
+    if not isinstance(rhs_values, np.ndarray) or rhs_values.shape != (batch_size, num_constraints):
+        raise ValueError("Right-hand side values must be a numpy array of shape (B, m).")
+    if len(senses) != num_constraints or any(sense not in ('<=', '>=', '=') for sense in senses):
+        raise ValueError("Senses must contain one of '<=', '>=', '=' per constraint.")
+    if problem_type not in ['max', 'min']:
+        raise ValueError("Problem type must be 'max' or 'min'.")
+
+
+def _run_phase(
+    tableau: np.ndarray,
+    basis: np.ndarray,
+    enterable: np.ndarray,
+    active: np.ndarray,
+    artificial_start: int,
+    allow_artificial_basis: bool,
+    max_iterations: int,
+    tol: float
+) -> np.ndarray:
+    """
+    Runs simplex pivots on every active problem of a 3-D tableau until each one stops.
+
+    Returns an array of per-problem outcomes: 'optimal', 'unbounded', 'iteration_limit',
+    or '' for problems that were not active.
+    """
+    batch_size, num_rows, _ = tableau.shape
+    outcome = np.full(batch_size, '', dtype='<U15')
+    running = active.copy()
+
+    for _ in range(max_iterations):
+        indices = np.flatnonzero(running)
+        if indices.size == 0:
+            return outcome
+        arange = np.arange(indices.size)
+        current = tableau[indices]
+
+        # Dantzig pricing on every running problem at once
+        reduced_costs = np.where(enterable[indices], current[:, 0, :-1], np.inf)
+        entering = np.argmin(reduced_costs, axis=1)
+        finished = reduced_costs[arange, entering] >= -tol
+        outcome[indices[finished]] = 'optimal'
+
+        # Minimum ratio test over the constraint rows
+        pivot_column = current[arange, 1:, entering]
+        rhs = current[:, 1:, -1]
+        positive = pivot_column > tol
+        ratios = np.full(pivot_column.shape, np.inf)
+        ratios[positive] = np.maximum(rhs[positive], 0.0) / pivot_column[positive]
+        if not allow_artificial_basis:
+            # Artificials left basic at zero must leave before they can become nonzero
+            blocking = (basis[indices] >= artificial_start) & (np.abs(pivot_column) > tol)
+            ratios[blocking] = 0.0
+        leaving = np.argmin(ratios, axis=1)
+        unbounded = ~finished & np.isinf(ratios[arange, leaving])
+        outcome[indices[unbounded]] = 'unbounded'
+
+        # Pivot only the problems that are still improving
+        pivoting = ~(finished | unbounded)
+        running[indices[~pivoting]] = False
+        if not np.any(pivoting):
+            continue
+        current = current[pivoting]
+        arange = np.arange(current.shape[0])
+        entering = entering[pivoting]
+        leaving_row = leaving[pivoting] + 1
+
+        pivot_row = current[arange, leaving_row, :] / current[arange, leaving_row, entering][:, None]
+        factors = current[arange, :, entering]
+        factors[arange, leaving_row] = 0.0
+        current -= factors[:, :, None] * pivot_row[:, None, :]
+        current[arange, leaving_row, :] = pivot_row
+
+        pivoted = indices[pivoting]
+        tableau[pivoted] = current
+        basis[pivoted, leaving_row - 1] = entering
+
+    outcome[running] = 'iteration_limit'
+    logger.warning("%d problems hit the iteration limit", np.count_nonzero(running))
+    return outcome
+
+
+def solve_batch(
+    objective_coeffs: np.ndarray,
+    constraint_matrix: np.ndarray,
+    rhs_values: np.ndarray,
+    senses: List[str],
+    problem_type: str = 'max',
+    max_iterations: int = 1000,
+    tol: float = 1e-9
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Solves a batch of same-shaped linear programming problems with one 3-D tableau.
+
+    Every pivot is applied to all unfinished problems at once, and problems drop
+    out of the working set as soon as they are optimal, unbounded or infeasible.
+    Artificial variables are driven out with a two-phase method.
+
+    Args:
+        objective_coeffs (np.ndarray): Objective coefficients, shape (B, n).
+        constraint_matrix (np.ndarray): Constraint matrices, shape (B, m, n).
+        rhs_values (np.ndarray): Right-hand side values, shape (B, m).
+        senses (List[str]): Constraint senses shared by all problems ('<=', '>=', '=').
+        problem_type (str): 'max' for maximization, 'min' for minimization.
+        max_iterations (int): Maximum number of pivots per phase.
+        tol (float): Tolerance used for pricing, ratio test and feasibility.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Per-problem status strings ('optimal',
+        'unbounded', 'infeasible' or 'iteration_limit'), solutions of shape (B, n) and
+        objective values of shape (B,). Entries of problems that are not optimal are NaN.
+    """
+    logger.info("Starting batch simplex solver")
+    validate_batch_inputs(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type)
+
+    batch_size, num_constraints, num_original_vars = constraint_matrix.shape
+    logical_start = num_original_vars
+    artificial_start = num_original_vars + num_constraints
+    num_columns = num_original_vars + 2 * num_constraints
+    rows = np.arange(num_constraints)
+
+    # Make every RHS nonnegative; flipping a row also flips its sense
+    row_signs = np.where(rhs_values < 0, -1.0, 1.0)
+    sense_codes = np.array([1.0 if sense == '<=' else -1.0 if sense == '>=' else 0.0 for sense in senses])
+    logical_coeffs = sense_codes * row_signs
+    needs_artificial = logical_coeffs <= 0
+
+    # Layout per problem: [x (n) | slack/surplus (m) | artificial (m) | rhs]
+    tableau = np.zeros((batch_size, num_constraints + 1, num_columns + 1))
+    tableau[:, 1:, :num_original_vars] = constraint_matrix * row_signs[:, :, None]
+    tableau[:, rows + 1, logical_start + rows] = logical_coeffs
+    tableau[:, rows + 1, artificial_start + rows] = needs_artificial
+    tableau[:, 1:, -1] = rhs_values * row_signs
+
+    basis = np.where(needs_artificial, artificial_start + rows, logical_start + rows)
+    enterable = np.zeros((batch_size, num_columns), dtype=bool)
+    enterable[:, :num_original_vars] = True
+    enterable[:, logical_start:artificial_start] = logical_coeffs != 0
+
+    status = np.full(batch_size, 'optimal', dtype='<U15')
+
+    # Phase I: maximize -sum(artificials), priced out against the artificial basis
+    tableau[:, 0, artificial_start:num_columns] = needs_artificial
+    tableau[:, 0, :] -= np.einsum('bi,bij->bj', needs_artificial.astype(float), tableau[:, 1:, :])
+    phase_one = _run_phase(tableau, basis, enterable, np.any(needs_artificial, axis=1),
+                           artificial_start, True, max_iterations, tol)
+    rhs_scale = np.maximum(1.0, np.abs(rhs_values).max(axis=1))
+    status[tableau[:, 0, -1] < -tol * rhs_scale] = 'infeasible'
+    status[phase_one == 'iteration_limit'] = 'iteration_limit'
+
+    # Phase II: restore the real objective and price out the current basis
+    costs = objective_coeffs if problem_type == 'max' else -objective_coeffs
+    tableau[:, 0, :] = 0.0
+    tableau[:, 0, :num_original_vars] = -costs
+    basic_costs = np.take_along_axis(tableau[:, 0, :], basis, axis=1)
+    tableau[:, 0, :] -= np.einsum('bi,bij->bj', basic_costs, tableau[:, 1:, :])
+    phase_two = _run_phase(tableau, basis, enterable, status == 'optimal',
+                           artificial_start, False, max_iterations, tol)
+    status[phase_two == 'unbounded'] = 'unbounded'
+    status[phase_two == 'iteration_limit'] = 'iteration_limit'
+
+    # Read the basic structural variables off the RHS column
+    solutions = np.zeros((batch_size, num_original_vars))
+    problem_index, row_index = np.nonzero(basis < logical_start)
+    solutions[problem_index, basis[problem_index, row_index]] = tableau[problem_index, row_index + 1, -1]
+    objective_values = tableau[:, 0, -1] if problem_type == 'max' else -tableau[:, 0, -1]
+
+    not_optimal = status != 'optimal'
+    solutions[not_optimal] = np.nan
+    objective_values = np.where(not_optimal, np.nan, objective_values)
+
+    logger.info("Batch solved: %d optimal out of %d", np.count_nonzero(~not_optimal), batch_size)
+    return status, solutions, objective_values
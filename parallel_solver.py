@@ -0,0 +1,230 @@
+import numpy as np
+import scipy.sparse as sp
+import os
+import signal
+import itertools
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from multiprocessing import shared_memory
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Byte alignment of every array packed into a shared-memory block
+ALIGNMENT = 64
+
+
+class _SolveTimeout(BaseException):
+    # Derives from BaseException so the solver's broad `except Exception` cannot swallow it
+    pass
+
+
+def _raise_timeout(signum, frame):
+    raise _SolveTimeout()
+
+
+def _disarm_alarm() -> None:
+    try:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+    except _SolveTimeout:
+        # The one-shot alarm went off just before it was disarmed; it cannot fire again
+        pass
+
+
+def _pack_arrays(arrays: List[np.ndarray]) -> Tuple[shared_memory.SharedMemory, List[Tuple[int, tuple, str]]]:
+    """Copies arrays into one shared-memory block and returns the block with (offset, shape, dtype) descriptors."""
+    descriptors = []
+    offset = 0
+    for array in arrays:
+        offset = -(-offset // ALIGNMENT) * ALIGNMENT
+        descriptors.append((offset, array.shape, array.dtype.str))
+        offset += array.nbytes
+    block = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    for array, (start, shape, dtype) in zip(arrays, descriptors):
+        np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=start)[...] = array
+    return block, descriptors
+
+
+def _flatten_problem(problem: Sequence) -> Tuple[List[np.ndarray], tuple]:
+    """Splits a problem into its numeric arrays and the small metadata that is pickled as-is."""
+    objective_coeffs, constraint_matrix, rhs_values, senses = problem[:4]
+    problem_type = problem[4] if len(problem) > 4 else 'max'
+    arrays = [np.asarray(objective_coeffs), np.asarray(rhs_values)]
+    if sp.issparse(constraint_matrix):
+        arrays += [constraint_matrix.data, constraint_matrix.indices, constraint_matrix.indptr]
+        matrix_info = (constraint_matrix.format, constraint_matrix.shape)
+    else:
+        arrays.append(np.asarray(constraint_matrix))
+        matrix_info = None
+    return arrays, (list(senses), problem_type, matrix_info)
+
+
+def _solve_chunk(block_name: str, entries: list, engine: str, timeout: Optional[float]) -> list:
+    """Worker entry point: attaches to the shared block and solves every problem of one chunk."""
+    from simplex import tabular_simplex
+
+    block = shared_memory.SharedMemory(name=block_name)
+    use_alarm = timeout is not None and hasattr(signal, 'setitimer')
+    if use_alarm:
+        previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+    results = []
+    try:
+        for index, descriptors, (senses, problem_type, matrix_info) in entries:
+            views = [np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=offset) for offset, shape, dtype in descriptors]
+            objective_coeffs, rhs_values = views[0], views[1]
+            if matrix_info is None:
+                constraint_matrix = views[2]
+            else:
+                matrix_format, shape = matrix_info
+                matrix_class = sp.csr_matrix if matrix_format == 'csr' else sp.csc_matrix
+                constraint_matrix = matrix_class((views[2], views[3], views[4]), shape=shape, copy=False)
+            solved = None
+            try:
+                if use_alarm:
+                    signal.setitimer(signal.ITIMER_REAL, timeout)
+                solved = tabular_simplex(
+                    objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, verbose=False, engine=engine,
+                    history='none'
+                )
+                # Disarm as soon as the solve returns, so the alarm cannot interrupt the bookkeeping below
+                if use_alarm:
+                    _disarm_alarm()
+            except _SolveTimeout:
+                pass
+            finally:
+                if use_alarm:
+                    _disarm_alarm()
+            status, solution, objective_value = solved[:3] if solved is not None else ('timeout', None, None)
+            results.append((index, status, solution, objective_value))
+            # Views must be released before the block can be closed
+            del views, objective_coeffs, rhs_values, constraint_matrix
+    finally:
+        if use_alarm:
+            signal.signal(signal.SIGALRM, previous_handler)
+        block.close()
+    return results
+
+
+class ParallelSolver:
+    """
+    Solves independent linear programming problems on a pool of worker processes.
+
+    Problems are grouped into chunks; the numeric arrays of each chunk are copied
+    once into a shared-memory block and workers read them in place, so only
+    small descriptors travel through pickling. Problems are
+    (objective_coeffs, constraint_matrix, rhs_values, senses[, problem_type])
+    sequences, with dense or CSR/CSC constraint matrices.
+
+    Example:
+        with ParallelSolver(max_workers=8, chunksize=32, timeout=10.0) as solver:
+            for index, status, x, z in solver.solve(problems, ordered=False):
+                ...
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        chunksize: int = 1,
+        timeout: Optional[float] = None,
+        engine: str = 'auto'
+    ):
+        """
+        Args:
+            max_workers (Optional[int]): Number of worker processes (defaults to the CPU count).
+            chunksize (int): Number of problems sent to a worker per task.
+            timeout (Optional[float]): Per-problem time limit in seconds. Problems that exceed
+                it get the status 'timeout'. Enforced with SIGALRM inside the worker, so it
+                requires a POSIX platform.
+            engine (str): Solver engine passed to tabular_simplex.
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be at least 1.")
+        if timeout is not None and not hasattr(signal, 'setitimer'):
+            logger.warning("Per-problem timeouts are not supported on this platform and will be ignored")
+        self.max_workers = max_workers
+        self.chunksize = chunksize
+        self.timeout = timeout
+        self.engine = engine
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> 'ParallelSolver':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _submit(self, chunk: list) -> Tuple[Future, shared_memory.SharedMemory, List[int]]:
+        arrays, entries = [], []
+        for index, problem in chunk:
+            problem_arrays, metadata = _flatten_problem(problem)
+            entries.append((index, len(arrays), len(problem_arrays), metadata))
+            arrays += problem_arrays
+        block, descriptors = _pack_arrays(arrays)
+        entries = [(index, descriptors[start:start + count], metadata) for index, start, count, metadata in entries]
+        future = self._executor.submit(_solve_chunk, block.name, entries, self.engine, self.timeout)
+        return future, block, [index for index, _ in chunk]
+
+    @staticmethod
+    def _collect(future: Future, block: shared_memory.SharedMemory, indices: List[int]) -> list:
+        try:
+            results = future.result()
+        except Exception as e:
+            logger.exception(f"Worker failed on problems {indices}: {e}")
+            results = [(index, 'error', None, None) for index in indices]
+        finally:
+            block.close()
+            block.unlink()
+        return results
+
+    def solve(self, problems: Iterable[Sequence], ordered: bool = True) -> Iterator[Tuple[int, str, Optional[np.ndarray], Optional[float]]]:
+        """
+        Solves the problems and yields (index, status, solution, objective_value) tuples.
+
+        The input is consumed lazily and at most two chunks per worker are in flight,
+        so an iterator of problems is never materialized in full.
+
+        Args:
+            problems (Iterable[Sequence]): Problems to solve.
+            ordered (bool): Yield results in input order (True) or as soon as they complete (False).
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        max_in_flight = 2 * (self.max_workers or os.cpu_count() or 1)
+
+        numbered_problems = enumerate(problems)
+        in_flight = deque()
+        try:
+            while True:
+                chunk = list(itertools.islice(numbered_problems, self.chunksize))
+                if not chunk:
+                    break
+                in_flight.append(self._submit(chunk))
+                while len(in_flight) >= max_in_flight:
+                    yield from self._drain(in_flight, ordered)
+            while in_flight:
+                yield from self._drain(in_flight, ordered)
+        finally:
+            # Abandoned generators must not leak shared-memory blocks; running chunks release theirs when done
+            for future, block, _ in in_flight:
+                future.cancel()
+                future.add_done_callback(lambda _, block=block: (block.close(), block.unlink()))
+
+    def _drain(self, in_flight: deque, ordered: bool) -> Iterator[tuple]:
+        if ordered:
+            future, block, indices = in_flight.popleft()
+            yield from self._collect(future, block, indices)
+            return
+        done, _ = wait([future for future, _, _ in in_flight], return_when=FIRST_COMPLETED)
+        for item in [item for item in in_flight if item[0] in done]:
+            in_flight.remove(item)
+            yield from self._collect(*item)
+
+    def solve_all(self, problems: Iterable[Sequence]) -> List[Tuple[str, Optional[np.ndarray], Optional[float]]]:
+        """Solves all problems and returns (status, solution, objective_value) in input order."""
+        return [result[1:] for result in self.solve(problems, ordered=True)]
@@ -0,0 +1,367 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import lu_factor, lu_solve, LinAlgWarning
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from simplex import tabular_simplex
+from utils.basis import Basis, variable_columns
+from utils.input_validation import validate_inputs
+import warnings
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+@dataclass
+class ParametricPiece:
+    """
+    One interval of a parametric sweep on which the optimal basis does not change.
+
+    On [start, end] the solution is solution + (theta - start) * solution_slope and the
+    objective value is objective_value + (theta - start) * objective_slope. Intervals
+    where the problem is infeasible or unbounded have no basis and no values.
+    """
+    start: float
+    end: float
+    status: str  # 'optimal', 'infeasible' or 'unbounded'
+    basis: Optional[Basis] = None
+    solution: Optional[np.ndarray] = None
+    solution_slope: Optional[np.ndarray] = None
+    objective_value: Optional[float] = None
+    objective_slope: Optional[float] = None
+
+
+@dataclass
+class ParametricResult:
+    """Piecewise-linear optimal value function of a sweep over theta, with the basis of each piece."""
+    parameter: str  # 'rhs' or 'objective'
+    pieces: List[ParametricPiece]
+    tol: float = 1e-9  # Breakpoints carry round-off, so theta matches a piece within tol of its ends
+
+    @property
+    def breakpoints(self) -> np.ndarray:
+        """Values of theta where the basis or the status changes."""
+        return np.array([piece.start for piece in self.pieces[1:]])
+
+    def piece_at(self, theta: float) -> ParametricPiece:
+        """Piece containing theta (within tol); at a breakpoint the optimal piece nearest to theta."""
+        containing = [piece for piece in self.pieces
+                      if piece.start - self.tol <= theta <= piece.end + self.tol] or self.pieces[-1:]
+        optimal = [piece for piece in containing if piece.status == 'optimal']
+        if not optimal:
+            return containing[0]
+        return min(optimal, key=lambda piece: max(piece.start - theta, theta - piece.end, 0.0))
+
+    def objective_value(self, theta: float) -> Optional[float]:
+        """Optimal objective value at theta (None where the problem is infeasible or unbounded)."""
+        piece = self.piece_at(theta)
+        if piece.status != 'optimal':
+            return None
+        return piece.objective_value + (theta - piece.start) * piece.objective_slope
+
+    def solution(self, theta: float) -> Optional[np.ndarray]:
+        """Optimal solution at theta (None where the problem is infeasible or unbounded)."""
+        piece = self.piece_at(theta)
+        if piece.status != 'optimal':
+            return None
+        return piece.solution + (theta - piece.start) * piece.solution_slope
+
+
+def _theta_limit(
+    objective_coeffs: np.ndarray,
+    constraint_matrix: np.ndarray | sp.spmatrix,
+    rhs_values: np.ndarray,
+    senses: List[str],
+    problem_type: str,
+    direction: np.ndarray,
+    parameter: str,
+    theta_range: Tuple[float, float],
+    lb: np.ndarray,
+    ub: np.ndarray,
+    last: bool = False
+) -> Optional[float]:
+    """
+    Smallest (or with last=True largest) theta in the range where the problem is feasible ('rhs') or bounded ('objective').
+
+    Both sets are intervals in theta, so this is one auxiliary LP with theta as a bounded
+    variable: the primal constraints for 'rhs', the dual constraints for 'objective'.
+    Returns None if there is no such theta.
+    """
+    dense = constraint_matrix.toarray() if sp.issparse(constraint_matrix) else np.asarray(constraint_matrix, dtype=float)
+    num_constraints, num_original_vars = dense.shape
+    if parameter == 'rhs':
+        # A x - theta d (sense) b, with the variable bounds
+        aux_matrix = np.hstack([dense, -direction[:, None]])
+        aux_rhs, aux_senses = np.asarray(rhs_values, dtype=float), list(senses)
+        aux_lb, aux_ub = np.append(lb, theta_range[0]), np.append(ub, theta_range[1])
+    else:
+        # Min-form reduced costs s(c + theta g) - A^T y must have the sign that keeps a bounded optimum:
+        # >= 0 for variables with only a lower bound, <= 0 with only an upper bound, = 0 if free
+        sign = -1.0 if problem_type == 'max' else 1.0
+        rows = np.flatnonzero(~(np.isfinite(lb) & np.isfinite(ub)))
+        if rows.size == 0:
+            return theta_range[1] if last else theta_range[0]
+        aux_matrix = np.hstack([dense[:, rows].T, -sign * direction[rows, None]])
+        aux_rhs = sign * np.asarray(objective_coeffs, dtype=float)[rows]
+        aux_senses = ['<=' if np.isfinite(lb[j]) else '>=' if np.isfinite(ub[j]) else '=' for j in rows]
+        dual_lb = np.array([-np.inf if sense in ('<=', '=') else 0.0 for sense in senses])
+        dual_ub = np.array([np.inf if sense in ('>=', '=') else 0.0 for sense in senses])
+        aux_lb, aux_ub = np.append(dual_lb, theta_range[0]), np.append(dual_ub, theta_range[1])
+    aux_objective = np.zeros(aux_matrix.shape[1])
+    aux_objective[-1] = 1.0
+    status, solution, _, _ = tabular_simplex(aux_objective, aux_matrix, aux_rhs, aux_senses, 'max' if last else 'min',
+                                             verbose=False, lb=aux_lb, ub=aux_ub)
+    return float(solution[-1]) if status == 'optimal' else None
+
+
+def parametric_solve(
+    objective_coeffs: np.ndarray,
+    constraint_matrix: np.ndarray | sp.spmatrix,
+    rhs_values: np.ndarray,
+    senses: List[str],
+    problem_type: str = 'max',
+    rhs_direction: Optional[np.ndarray] = None,
+    objective_direction: Optional[np.ndarray] = None,
+    theta_range: Tuple[float, float] = (0.0, 1.0),
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None,
+    tol: float = 1e-9,
+    max_pivots: int = 10000
+) -> ParametricResult:
+    """
+    Solves b + theta * rhs_direction (or c + theta * objective_direction) for all theta in a range.
+
+    The problem is solved once at the start of the range. From there the sweep
+    moves theta up to the next breakpoint, where the current basis stops being
+    primal feasible (RHS sweep) or dual feasible (objective sweep), and replaces it
+    with one pivot: a bounded dual simplex step for an RHS sweep, a bounded primal
+    simplex step (or a bound flip) for an objective sweep. Each step costs one LU
+    factorization of the basis instead of a cold solve per value of theta.
+
+    Args:
+        objective_coeffs (np.ndarray): Objective function coefficients.
+        constraint_matrix (np.ndarray | sp.spmatrix): Dense or CSR/CSC constraint coefficient matrix.
+        rhs_values (np.ndarray): Right-hand side values.
+        senses (List[str]): List of strings for each constraint ('<=', '>=', '=').
+        problem_type (str): 'max' for maximization, 'min' for minimization.
+        rhs_direction (Optional[np.ndarray]): Direction d of an RHS sweep b + theta d.
+        objective_direction (Optional[np.ndarray]): Direction g of an objective sweep c + theta g.
+        theta_range (Tuple[float, float]): First and last value of theta.
+        lb (Optional[np.ndarray]): Variable lower bounds (-inf allowed), default 0.
+        ub (Optional[np.ndarray]): Variable upper bounds (inf allowed), default inf.
+        tol (float): Feasibility and pivot tolerance.
+        max_pivots (int): Limit on the number of breakpoint pivots.
+
+    Returns:
+        ParametricResult: The pieces of the optimal value function, in increasing theta.
+
+    Raises:
+        ValueError: If not exactly one direction is given, its shape is wrong or the range is empty.
+    """
+    logger.info("Starting parametric solve")
+    validate_inputs(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, lb, ub)
+    num_constraints, num_original_vars = constraint_matrix.shape
+    if (rhs_direction is None) == (objective_direction is None):
+        raise ValueError("Exactly one of rhs_direction and objective_direction must be given.")
+    parameter = 'rhs' if rhs_direction is not None else 'objective'
+    direction = np.asarray(rhs_direction if parameter == 'rhs' else objective_direction, dtype=float)
+    if direction.shape != ((num_constraints,) if parameter == 'rhs' else (num_original_vars,)):
+        raise ValueError("The direction must have one entry per constraint (rhs) or per variable (objective).")
+    theta_start, theta_end = map(float, theta_range)
+    if not theta_start <= theta_end:
+        raise ValueError("The parameter range must satisfy start <= end.")
+
+    objective_coeffs = np.asarray(objective_coeffs, dtype=float)
+    rhs_values = np.asarray(rhs_values, dtype=float)
+    lb = np.zeros(num_original_vars) if lb is None else np.asarray(lb, dtype=float)
+    ub = np.full(num_original_vars, np.inf) if ub is None else np.asarray(ub, dtype=float)
+    free = ~np.isfinite(lb) & ~np.isfinite(ub)
+    mirrored = ~np.isfinite(lb) & np.isfinite(ub)
+    boxed = np.isfinite(lb) & np.isfinite(ub)
+    logical_signs = np.array([1.0 if sense == '<=' else -1.0 if sense == '>=' else 0.0 for sense in senses])
+    # Bounds of all variables in the layout-independent numbering (artificials are fixed at zero)
+    lower = np.concatenate([lb, np.zeros(2 * num_constraints)])
+    upper = np.concatenate([ub, np.full(num_constraints, np.inf), np.zeros(num_constraints)])
+    # Nonbasic candidates: movable original variables and the logicals of inequality rows
+    candidates = np.concatenate([np.flatnonzero(lb < ub), num_original_vars + np.flatnonzero(logical_signs != 0)])
+    sense_sign = -1.0 if problem_type == 'max' else 1.0
+
+    def objective_at(theta: float) -> np.ndarray:
+        return objective_coeffs + theta * direction if parameter == 'objective' else objective_coeffs
+
+    def rhs_at(theta: float) -> np.ndarray:
+        return rhs_values + theta * direction if parameter == 'rhs' else rhs_values
+
+    def min_costs(costs: np.ndarray) -> np.ndarray:
+        return np.concatenate([sense_sign * costs, np.zeros(2 * num_constraints)])
+
+    pieces: List[ParametricPiece] = []
+
+    def result() -> ParametricResult:
+        # A zero-length infeasible or unbounded piece is round-off in a breakpoint: its neighbours take its place
+        kept = [piece for piece in pieces if piece.status == 'optimal' or piece.end - piece.start > tol] or pieces[:1]
+        for previous, piece in zip(kept, kept[1:]):
+            previous.end = piece.start
+        kept[-1].end = theta_end
+        return ParametricResult(parameter, kept, tol)
+
+    def add_piece(piece: ParametricPiece) -> None:
+        # Zero-length pieces from degenerate pivots are dropped when an optimal neighbour covers their theta
+        if pieces and pieces[-1].status == 'optimal' and piece.end - piece.start <= tol and piece.status == 'optimal':
+            return
+        if pieces and pieces[-1].end - pieces[-1].start <= tol and pieces[-1].status == 'optimal' \
+                and piece.status == 'optimal':
+            pieces.pop()
+        pieces.append(piece)
+
+    # Start from an optimal basis at the first theta where one exists
+    theta = theta_start
+    status, _, _, _, start_basis = tabular_simplex(objective_at(theta), constraint_matrix, rhs_at(theta), senses,
+                                                   problem_type, verbose=False, return_basis=True, lb=lb, ub=ub)
+    blocked = 'infeasible' if parameter == 'rhs' else 'unbounded'
+    if status == blocked:
+        first = _theta_limit(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, direction,
+                             parameter, (theta_start, theta_end), lb, ub)
+        if first is None:
+            pieces.append(ParametricPiece(theta_start, theta_end, status))
+            return result()
+        pieces.append(ParametricPiece(theta_start, first, status))
+        theta = first
+        status, _, _, _, start_basis = tabular_simplex(objective_at(theta), constraint_matrix, rhs_at(theta), senses,
+                                                       problem_type, verbose=False, return_basis=True, lb=lb, ub=ub)
+    if status != 'optimal':
+        # Changing b cannot make an unbounded problem bounded, nor changing c an infeasible one feasible,
+        # but b can still move an unbounded problem out of its (interval of) feasibility
+        end = theta_end
+        if parameter == 'rhs' and status == 'unbounded':
+            end = _theta_limit(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, direction,
+                               parameter, (theta, theta_end), lb, ub, last=True)
+            end = theta if end is None else end
+        pieces.append(ParametricPiece(theta, end, status))
+        if end < theta_end:
+            pieces.append(ParametricPiece(end, theta_end, 'infeasible'))
+        return result()
+
+    basic = np.asarray(start_basis.basic_variables, dtype=int).copy()
+    at_upper = np.zeros(num_original_vars, dtype=bool)
+    if start_basis.at_upper is not None:
+        at_upper[np.asarray(start_basis.at_upper, dtype=int)] = True
+    at_upper |= mirrored
+
+    for _ in range(max_pivots):
+        is_basic = np.zeros(num_original_vars + 2 * num_constraints, dtype=bool)
+        is_basic[basic] = True
+        nonbasic = candidates[~is_basic[candidates]]
+        nonbasic_at_upper = np.zeros(len(nonbasic), dtype=bool)
+        structural = nonbasic < num_original_vars
+        nonbasic_at_upper[structural] = at_upper[nonbasic[structural]]
+        nonbasic_free = np.zeros(len(nonbasic), dtype=bool)
+        nonbasic_free[structural] = free[nonbasic[structural]]
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', LinAlgWarning)
+            lu = lu_factor(variable_columns(basic, constraint_matrix, senses))
+
+        # Current vertex: nonbasic originals at their bound, basic values from B x_B = b - N x_N
+        solution = np.where(at_upper, ub, np.where(free, 0.0, lb))
+        solution[basic[basic < num_original_vars]] = 0.0
+        basic_values = lu_solve(lu, rhs_at(theta) - constraint_matrix @ solution)
+        solution[basic[basic < num_original_vars]] = basic_values[basic < num_original_vars]
+        solution_slope = np.zeros(num_original_vars)
+        costs = objective_at(theta)
+
+        # Largest step in theta for which the basis stays optimal, and what blocks it
+        if parameter == 'rhs':
+            basic_slope = lu_solve(lu, direction)
+            lower_room = np.maximum(basic_values - lower[basic], 0.0)
+            upper_room = np.maximum(upper[basic] - basic_values, 0.0)
+            ratios = np.full(num_constraints, np.inf)
+            falling, rising = basic_slope < -tol, basic_slope > tol
+            ratios[falling] = lower_room[falling] / -basic_slope[falling]
+            ratios[rising] = upper_room[rising] / basic_slope[rising]
+            step = float(ratios.min()) if num_constraints else np.inf
+            solution_slope[basic[basic < num_original_vars]] = basic_slope[basic < num_original_vars]
+            objective_slope = float(costs @ solution_slope)
+        else:
+            full_costs, full_direction = min_costs(costs), min_costs(direction)
+            nonbasic_columns = variable_columns(nonbasic, constraint_matrix, senses)
+            reduced_costs = full_costs[nonbasic] - nonbasic_columns.T @ lu_solve(lu, full_costs[basic], trans=1)
+            reduced_slope = full_direction[nonbasic] - nonbasic_columns.T @ lu_solve(lu, full_direction[basic], trans=1)
+            ratios = np.full(len(nonbasic), np.inf)
+            # At a lower bound d must stay >= 0, at an upper bound <= 0, and a free nonbasic variable needs d = 0
+            falling = ~nonbasic_at_upper & ~nonbasic_free & (reduced_slope < -tol)
+            rising = nonbasic_at_upper & (reduced_slope > tol)
+            ratios[falling] = np.maximum(reduced_costs[falling], 0.0) / -reduced_slope[falling]
+            ratios[rising] = np.maximum(-reduced_costs[rising], 0.0) / reduced_slope[rising]
+            ratios[nonbasic_free & (np.abs(reduced_slope) > tol)] = 0.0
+            step = float(ratios.min()) if len(nonbasic) else np.inf
+            objective_slope = float(direction @ solution)
+
+        end = min(theta + step, theta_end)
+        add_piece(ParametricPiece(theta, end, 'optimal',
+                                  Basis(basic.copy(), num_original_vars, num_constraints, np.flatnonzero(at_upper & boxed)),
+                                  solution, solution_slope, float(costs @ solution), objective_slope))
+        if end >= theta_end:
+            logger.info("Parametric solve finished with %d pieces", len(pieces))
+            return result()
+        theta = end
+
+        if parameter == 'rhs':
+            # Dual simplex step: the blocking basic variable leaves at the bound it reaches
+            row = int(np.argmin(np.where(ratios <= step + tol, -np.abs(basic_slope), np.inf)))
+            leaving = basic[row]
+            to_upper = basic_slope[row] > 0
+            inverse_row = lu_solve(lu, np.eye(num_constraints)[row], trans=1)
+            nonbasic_columns = variable_columns(nonbasic, constraint_matrix, senses)
+            alpha = nonbasic_columns.T @ inverse_row
+            full_costs = min_costs(objective_at(theta))
+            reduced_costs = full_costs[nonbasic] - nonbasic_columns.T @ lu_solve(lu, full_costs[basic], trans=1)
+            # x_leaving changes by -alpha_q per unit move of x_q; it must move back inside its bounds
+            wanted = -1.0 if to_upper else 1.0
+            eligible = (nonbasic_free & (np.abs(alpha) > tol)) | \
+                (~nonbasic_at_upper & ~nonbasic_free & (wanted * alpha < -tol)) | \
+                (nonbasic_at_upper & (wanted * alpha > tol))
+            if not np.any(eligible):
+                logger.info("Problem becomes infeasible at theta = %s", theta)
+                add_piece(ParametricPiece(theta, theta_end, 'infeasible'))
+                return result()
+            dual_ratios = np.where(eligible, np.abs(reduced_costs) / np.where(eligible, np.abs(alpha), 1.0), np.inf)
+            best = dual_ratios.min()
+            entering = nonbasic[int(np.argmax(np.where(dual_ratios <= best + tol, np.abs(alpha), -np.inf)))]
+        else:
+            # Primal simplex step: the blocking nonbasic variable enters (or flips to its other bound)
+            position = int(np.argmin(np.where(ratios <= step + tol, -np.abs(reduced_slope), np.inf)))
+            entering = nonbasic[position]
+            if nonbasic_free[position]:
+                move = -1.0 if reduced_slope[position] > 0 else 1.0
+            else:
+                move = -1.0 if nonbasic_at_upper[position] else 1.0
+            entering_column = lu_solve(lu, variable_columns(np.array([entering]), constraint_matrix, senses)[:, 0])
+            rate = -move * entering_column  # Change of the basic values per unit step
+            lower_room = np.maximum(basic_values - lower[basic], 0.0)
+            upper_room = np.maximum(upper[basic] - basic_values, 0.0)
+            steps = np.full(num_constraints, np.inf)
+            falling, rising = rate < -tol, rate > tol
+            steps[falling] = lower_room[falling] / -rate[falling]
+            steps[rising] = upper_room[rising] / rate[rising]
+            entering_range = ub[entering] - lb[entering] if entering < num_original_vars and boxed[entering] else np.inf
+            primal_step = float(steps.min()) if num_constraints else np.inf
+            if np.isfinite(entering_range) and entering_range <= primal_step:
+                at_upper[entering] = not at_upper[entering]
+                continue
+            if not np.isfinite(primal_step):
+                logger.info("Problem becomes unbounded at theta = %s", theta)
+                add_piece(ParametricPiece(theta, theta_end, 'unbounded'))
+                return result()
+            row = int(np.argmax(np.where(steps <= primal_step + tol, np.abs(rate), -np.inf)))
+            leaving = basic[row]
+            to_upper = rate[row] > 0
+
+        # The leaving variable becomes nonbasic at the bound it reached
+        if leaving < num_original_vars:
+            at_upper[leaving] = bool(to_upper) and np.isfinite(ub[leaving])
+        if entering < num_original_vars:
+            at_upper[entering] = False
+        basic[row] = entering
+
+    raise RuntimeError("Parametric solve exceeded its pivot limit")
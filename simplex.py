@@ -1,167 +1,597 @@
 import numpy as np
-from utils.setup_tableau import setup_tableau
-from utils.transform_constraints import transform_constraints
-from utils.pivot import select_entering_variable, select_leaving_variable, pivot
+import scipy.sparse as sp
+from dataclasses import dataclass
+from typing import Callable, Iterator
+from utils.setup_tableau import setup_tableau, starting_basis, tableau_variable_indices
+from utils.transform_constraints import rhs_sign_flips
+from utils.two_phase import set_phase_one_objective, remove_artificial_variables, set_phase_two_objective
+from utils.pivot import select_leaving_variable, pivot
+from utils.pricing import PricingRule, get_pricing_rule
+from utils.ratio_test import Perturbation
+from utils.presolve import presolve_problem
+from utils.scaling import compute_scaling
+from utils.bounds import transform_bounds, TableauBounds
+from utils.precision import TableauRefactorization, resolve_dtype, is_reduced_precision, working_tolerance
+from utils.pivot import select_leaving_variable_dual, select_entering_variable_dual
+from utils.basis import Basis, warm_start_tableau, tableau_basis
+from utils.exact import ExactCertificate, exact_solve
+from utils.history import TableauHistory, get_history_policy
+from utils.out_of_core import DEFAULT_MEMORY_BUDGET, column_norms
+from utils.sensitivity import sensitivity_analysis, SensitivityReport
 from utils.solution_extraction import extract_solution
-from utils.latex_printer import print_latex_problem
-from utils.infeasibility_check import check_infeasibility
+from utils.event_printer import print_event
 from utils.input_validation import validate_inputs
+from utils.revised_simplex import revised_simplex
 import logging
 from utils.ratio_analysis import calculate_ratios  # Import the calculate_ratios function
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+@dataclass
+class SimplexIteration:
+    """
+    State of the tableau engine after one step, as yielded by iter_simplex.
+
+    tableau and basis are read-only views of the engine's live arrays rather than
+    copies, so they are only valid until the generator is resumed; copy them to
+    keep them. The last state has the final status and, if optimal, the solution
+    and the optimal Basis.
+    """
+    iteration: int
+    phase: str  # 'one', 'two' or 'dual'
+    status: str  # 'running' while iterating, then 'optimal', 'infeasible' or 'unbounded'
+    entering: int | None  # Tableau column that entered the basis or flipped to its other bound
+    leaving: int | None  # Tableau row (1-based) whose basic variable left, None for a bound flip
+    objective_value: float | None  # Objective value of the current vertex in the sense of the problem
+    tableau: np.ndarray
+    basis: np.ndarray  # Tableau column that is basic in each constraint row
+    solution: np.ndarray | None = None
+    optimal_basis: Basis | None = None
+
+
+def _tableau_iterations(
+    objective_coeffs: np.ndarray,
+    constraint_matrix: np.ndarray,
+    rhs_values: np.ndarray,
+    senses: list[str],
+    problem_type: str,
+    subscribers: list[Callable[[str, dict], None]],
+    initial_basis: Basis | None,
+    pricing: str | PricingRule,
+    feasibility_tol: float,
+    pivot_tol: float,
+    lb: np.ndarray | None,
+    ub: np.ndarray | None,
+    tableau_dtype: np.dtype,
+    tableau_history: TableauHistory,
+    memmap_dir: str | None = None,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET
+) -> Iterator[SimplexIteration]:
+    # The tableau engine: yields the state after every pivot or bound flip and ends with the final state
+    def emit(event: str, **data) -> None:
+        for subscriber in subscribers:
+            subscriber(event, data)
+
+    num_constraints, num_original_vars = constraint_matrix.shape
+
+    # Bounds are handled implicitly: each variable is shifted or mirrored to [0, u] or left free, never given a row
+    bounds = None
+    tableau_objective_coeffs, tableau_constraint_matrix, tableau_rhs_values = objective_coeffs, constraint_matrix, rhs_values
+    if lb is not None or ub is not None:
+        tableau_objective_coeffs, tableau_constraint_matrix, tableau_rhs_values, transform = transform_bounds(
+            objective_coeffs, constraint_matrix, rhs_values, lb, ub
+        )
+        bounds = TableauBounds(transform)
+
+    # Make every right-hand side nonnegative so the slack/artificial columns form a feasible start;
+    # the row signs are applied while the tableau is filled, so the matrix itself is never copied
+    row_signs, normalized_rhs_values, normalized_senses = rhs_sign_flips(tableau_rhs_values, senses)
+    logger.debug("Constraints normalized successfully")
+    
+    # Set up the initial tableau for the simplex method, memory-mapped with memmap_dir
+    tableau = setup_tableau(tableau_objective_coeffs, tableau_constraint_matrix, normalized_rhs_values, normalized_senses,
+                            problem_type, dtype=tableau_dtype, row_signs=row_signs, memmap_dir=memmap_dir,
+                            memory_budget=memory_budget)
+    logger.debug("Tableau setup complete")
+
+    # A float32 tableau is periodically rebuilt in float64 and its tolerances follow its precision
+    refactorization = None
+    if is_reduced_precision(tableau_dtype):
+        refactorization = TableauRefactorization(tableau_constraint_matrix, tableau_rhs_values, normalized_senses)
+        feasibility_tol = working_tolerance(feasibility_tol, tableau_dtype)
+        pivot_tol = working_tolerance(pivot_tol, tableau_dtype)
+    
+    if subscribers:
+        emit('setup', num_constraints=num_constraints, num_original_vars=num_original_vars, objective_coeffs=objective_coeffs)
+
+    # Tableau column that is basic in each constraint row, and the variable behind each column
+    basis = starting_basis(num_original_vars, normalized_senses)
+    variable_indices = tableau_variable_indices(num_original_vars, normalized_senses)
+    artificial_columns = variable_indices >= num_original_vars + num_constraints
+    # Objective row entries of the original variables, kept in float64 whatever the tableau dtype
+    objective_row = (-1.0 if problem_type == 'max' else 1.0) * np.asarray(tableau_objective_coeffs, dtype=np.float64)
+
+    warm_start = None
+    if initial_basis is not None:
+        warm_start = warm_start_tableau(tableau, num_original_vars, normalized_senses, initial_basis, bounds=bounds)
+    if warm_start is not None:
+        # A warm start that lost primal feasibility (e.g. after an RHS change) is repaired with dual simplex
+        tableau, basis, variable_indices = warm_start
+        phase = 'dual'
+    elif np.any(artificial_columns):
+        # Phase I drives the artificial variables to zero before the real objective is optimized
+        tableau = set_phase_one_objective(tableau, basis, artificial_columns)
+        phase = 'one'
+    else:
+        phase = 'two'
+
+    tol = working_tolerance(1e-9, tableau_dtype)  # Round-off tolerance for the optimality test
+    pricing_rule = get_pricing_rule(pricing)
+    perturbation = Perturbation()
+    resume_phase = 'two'  # Phase to return to after dual simplex cleanup
+
+    def price(columns):
+        return tableau[0, :-1][columns]
+
+    def project(vector):
+        return vector @ tableau[1:, :-1]
+
+    def reset_pricing():
+        num_columns = tableau.shape[1] - 1
+        norms = column_norms(tableau[1:, :-1], memory_budget) if pricing_rule.needs_column_norms else None
+        pricing_rule.reset(num_columns, norms)
+
+    def phase_two_costs():
+        # Complemented columns enter the objective with the opposite sign
+        return objective_row if bounds is None else objective_row * bounds.column_sign
+
+    def primal_infeasible():
+        if bounds is not None:
+            return bounds.primal_infeasibility(tableau, basis) > feasibility_tol
+        return np.any(tableau[1:, -1] < -feasibility_tol)
+
+    def refactor():
+        # Rebuild the constraint rows in float64 and price the objective row of the current phase out again
+        nonlocal tableau, logged_pivot
+        logged_pivot = None
+        tableau = refactorization.refactor(tableau, basis, variable_indices, bounds)
+        if perturbation.active:
+            tableau[1:, -1] += perturbation.shift[1:]
+        if (resume_phase if phase == 'dual' else phase) == 'one':
+            tableau = set_phase_one_objective(tableau, basis, artificial_columns)
+        else:
+            tableau = set_phase_two_objective(tableau, basis, phase_two_costs())
+        if subscribers:
+            emit('refactor', tableau=tableau, dtype=tableau.dtype)
+
+    def state(status, entering=None, leaving=None, objective_value=None, solution=None, optimal_basis=None) -> SimplexIteration:
+        # Read-only views of the live arrays, no copies
+        tableau_view, basis_view = tableau.view(), basis.view()
+        tableau_view.flags.writeable = basis_view.flags.writeable = False
+        if status == 'running':
+            # Objective value of the current vertex (primal infeasible in Phase I and dual simplex)
+            if bounds is not None:
+                point = bounds.solution(tableau, basis)
+            else:
+                point = np.zeros(num_original_vars)
+                structural = basis < num_original_vars
+                point[basis[structural]] = tableau[1:, -1][structural]
+            objective_value = float(np.dot(objective_coeffs, point))
+        return SimplexIteration(iteration, phase, status, entering, leaving, objective_value, tableau_view, basis_view,
+                                solution, optimal_basis)
+
+    reset_pricing()
+    iteration = 0
+    logged_pivot = None  # Pivot since the last recorded tableau, if nothing else changed it
+    complements = 0
+    while True:
+        iteration += 1
+        if subscribers:
+            emit('iteration', iteration=iteration, tableau=tableau, senses=normalized_senses,
+                 basis=basis, variable_indices=variable_indices, num_original_vars=num_original_vars)
+        
+        # Store the current tableau in the history (a pivot log only keeps the pivot when it is all that changed)
+        if bounds is not None and bounds.complements != complements:
+            logged_pivot, complements = None, bounds.complements
+        tableau_history.record(tableau, logged_pivot)
+        logged_pivot = None
+
+        if phase == 'dual':
+            if bounds is not None:
+                leaving_row = bounds.select_leaving_dual(tableau, basis, feasibility_tol, perturbation)
+            else:
+                leaving_row = select_leaving_variable_dual(tableau, feasibility_tol)
+            if leaving_row is None:
+                phase = resume_phase
+                reset_pricing()
+            else:
+                if bounds is not None:
+                    entering_col_index = bounds.select_entering_dual(tableau, leaving_row)
+                else:
+                    entering_col_index = select_entering_variable_dual(tableau, leaving_row)
+                if entering_col_index is None:
+                    if subscribers:
+                        emit('infeasible', stage='dual')
+                    yield state('infeasible')
+                    return
+                perturbation.pivot(tableau[:, entering_col_index].copy(), leaving_row)
+                logged_pivot = (entering_col_index, leaving_row, tableau[leaving_row, entering_col_index])
+                tableau = pivot(tableau, entering_col_index, leaving_row, memory_budget)
+                basis[leaving_row - 1] = entering_col_index
+                if subscribers:
+                    emit('dual_pivot', tableau=tableau, leaving_row=leaving_row, entering_col_index=entering_col_index)
+                if refactorization is not None and refactorization.record_pivot():
+                    refactor()
+                yield state('running', entering_col_index, leaving_row)
+                continue
+
+        # Select entering variable; none means the current phase is optimal
+        entering_col_index = pricing_rule.select_entering(price if bounds is None else bounds.price(tableau), tol)
+        if entering_col_index is None:
+            if perturbation.active:
+                # Remove the perturbation; basic variables it was hiding outside their bounds are repaired with dual simplex
+                tableau[:, -1] -= perturbation.remove()
+                if primal_infeasible():
+                    resume_phase, phase = phase, 'dual'
+                    continue
+            if refactorization is not None and refactorization.stale:
+                # Confirm the end of the phase on a float64 refactorization of the reduced-precision tableau
+                refactor()
+                if primal_infeasible():
+                    resume_phase, phase = phase, 'dual'
+                continue
+            if phase == 'one':
+                infeasibility = -tableau[0, -1]
+                if infeasibility > feasibility_tol * max(1.0, np.abs(normalized_rhs_values).max()):
+                    logger.warning("Problem is infeasible: Phase I objective %s", infeasibility)
+                    if subscribers:
+                        emit('infeasible', stage='phase_one')
+                    yield state('infeasible')
+                    return
+                tableau, basis, variable_indices = remove_artificial_variables(tableau, basis, variable_indices, artificial_columns,
+                                                                               memory_budget=memory_budget)
+                tableau = set_phase_two_objective(tableau, basis, phase_two_costs())
+                if subscribers:
+                    emit('phase_two', tableau=tableau)
+                phase = 'two'
+                reset_pricing()
+                continue
+
+            status = 'optimal'
+            basic_values = None
+            if refactorization is not None:
+                # Basic values in full float64 accuracy from the original data
+                basic_values = refactorization.basic_values(basis, variable_indices, bounds)
+            if bounds is not None:
+                optimal_solution = bounds.solution(tableau, basis, basic_values)
+                optimal_objective_value = float(np.dot(objective_coeffs, optimal_solution))
+            elif basic_values is not None:
+                optimal_solution = np.zeros(num_original_vars)
+                structural = basis < num_original_vars
+                optimal_solution[basis[structural]] = basic_values[structural]
+                optimal_objective_value = float(np.dot(objective_coeffs, optimal_solution))
+            else:
+                optimal_solution, optimal_objective_value = extract_solution(tableau, num_original_vars, num_constraints, problem_type, basis)
+            logger.info("Optimal solution found: %s, Objective value: %s", optimal_solution, optimal_objective_value)
+            if subscribers:
+                emit('optimal', solution=optimal_solution, objective_value=optimal_objective_value)
+            yield state(status, objective_value=optimal_objective_value, solution=optimal_solution,
+                        optimal_basis=tableau_basis(basis, variable_indices, num_original_vars, num_constraints,
+                                                    bounds.at_upper(basis) if bounds is not None else None))
+            return
+        
+        logger.debug("Selected entering variable: column %d", entering_col_index)
+        if bounds is not None:
+            bounds.orient_entering(tableau, entering_col_index)
+        if subscribers:
+            emit('entering', entering_col_index=entering_col_index, tableau=tableau,
+                 pricing=pricing if isinstance(pricing, str) else type(pricing).__name__)
+            # Ratios are only materialised separately for narration; select_leaving_variable computes its own
+            emit('ratios', ratios=calculate_ratios(tableau, entering_col_index))
+        
+        if bounds is not None:
+            leaving_row, bound_flip = bounds.select_leaving(tableau, basis, entering_col_index, feasibility_tol, pivot_tol)
+            if bound_flip:
+                # The entering variable reaches its own upper bound first: no basis change
+                bounds.complement_column(tableau, entering_col_index)
+                if subscribers:
+                    emit('bound_flip', tableau=tableau, entering_col_index=entering_col_index)
+                yield state('running', entering_col_index)
+                continue
+            if leaving_row is not None and tableau[leaving_row, entering_col_index] < 0:
+                # The basic variable leaves at its upper bound
+                bounds.complement_row(tableau, leaving_row, basis[leaving_row - 1], perturbation)
+        else:
+            leaving_row = select_leaving_variable(tableau, entering_col_index, feasibility_tol, pivot_tol)
+
+        if leaving_row is None:
+            status = 'unbounded'
+            logger.warning("Problem is unbounded")
+            if subscribers:
+                emit('unbounded')
+            yield state(status)
+            return
+        
+        logger.debug("About to perform pivot operation")
+        if subscribers:
+            emit('leaving', leaving_row=leaving_row, pivot_element=tableau[leaving_row, entering_col_index])
+        
+        # Edge weights and the perturbation are updated from the tableau before it changes
+        entering_column = tableau[:, entering_col_index].copy()
+        pricing_rule.update(entering_col_index, leaving_row - 1, basis[leaving_row - 1], entering_column[1:], project)
+        perturbation.pivot(entering_column, leaving_row)
+        step = max(tableau[leaving_row, -1], 0.0) / entering_column[leaving_row]
+
+        # Perform pivot and display normalized pivot row
+        tableau = pivot(tableau, entering_col_index, leaving_row, memory_budget)
+        basis[leaving_row - 1] = entering_col_index
+        logged_pivot = (entering_col_index, leaving_row, entering_column[leaving_row])
+        if perturbation.record_step(step, feasibility_tol):
+            basic_upper = bounds.basic_bounds(tableau, basis)[1] if bounds is not None else None
+            tableau[1:, -1] += perturbation.apply(tableau[1:, -1], basic_upper)
+            logged_pivot = None
+        if subscribers:
+            emit('pivot', tableau=tableau, leaving_row=leaving_row)
+        if refactorization is not None and refactorization.record_pivot():
+            refactor()
+        yield state('running', entering_col_index, leaving_row)
+
+
 def tabular_simplex(
     objective_coeffs: np.ndarray,
     constraint_matrix: np.ndarray,
     rhs_values: np.ndarray,
     senses: list[str],
     problem_type: str = 'max',
-    verbose: bool = True  # Added verbose parameter with a default value of True
-) -> tuple[str, np.ndarray | None, float | None, list[np.ndarray]]:
+    verbose: bool = True,  # Added verbose parameter with a default value of True
+    callback: Callable[[str, dict], None] | None = None,  # Optional event subscriber, see utils.event_printer
+    engine: str = 'auto',  # 'tableau', 'revised' (LU-factorized basis) or 'auto' (revised for scipy.sparse input)
+    initial_basis: Basis | None = None,  # Basis from an earlier solve to warm start from
+    return_basis: bool = False,  # Append the optimal Basis (None if not optimal) to the returned tuple
+    pricing: str | PricingRule = 'dantzig',  # Entering-column rule, see utils.pricing
+    feasibility_tol: float = 1e-9,  # How far basic variables may drop below zero in the Harris ratio test
+    pivot_tol: float = 1e-9,  # Smallest column entry accepted as a pivot
+    presolve: bool = False,  # Reduce the problem with utils.presolve first and map the solution back
+    scaling: str | None = None,  # 'geometric', 'equilibrate' or 'auto' to scale rows and columns first, see utils.scaling
+    lb: np.ndarray | None = None,  # Variable lower bounds (-inf for none), default 0
+    ub: np.ndarray | None = None,  # Variable upper bounds (inf for none), default inf
+    dtype: str | np.dtype = 'float64',  # Tableau dtype: 'float32', 'float64' or 'longdouble' (the revised engine always uses float64)
+    exact: bool = False,  # Certify the optimal basis in rational arithmetic with utils.exact, return the exact solution and append the ExactCertificate (None if the float solve fails) last
+    sensitivity: bool = False,  # Append a SensitivityReport (None if not optimal) computed from the final basis, see utils.sensitivity
+    history: str | TableauHistory | None = None,  # Which tableaux to keep: 'all' (default), 'none', 'last', 'every', 'pivots' or a policy, see utils.history; 'none' with memmap_dir
+    memmap_dir: str | None = None,  # Back the tableau with a np.memmap file in this directory for problems larger than RAM, see utils.out_of_core
+    memory_budget: int = DEFAULT_MEMORY_BUDGET  # Scratch bytes per row panel of a pivot update
+) -> tuple:
     logger.info("Starting tabular simplex method")
     
-    tableau_history = []  # Initialize list to store tableau history
+    # Tableaux kept under the history policy; an out-of-core solve keeps none by default, a copy would have to fit in RAM
+    tableau_history = get_history_policy(history if history is not None else 'none' if memmap_dir is not None else 'all')
+
+    def result(status: str, solution: np.ndarray | None, objective_value: float | None, basis: Basis | None = None,
+               report: SensitivityReport | None = None, certificate: ExactCertificate | None = None) -> tuple:
+        returned = (status, solution, objective_value, tableau_history)
+        if return_basis:
+            returned += (basis,)
+        if sensitivity:
+            returned += (report,)
+        if exact:
+            returned += (certificate,)
+        return returned
+
+    # Narration is delivered as events; with no subscribers nothing is formatted or printed
+    subscribers = [subscriber for subscriber in (print_event if verbose else None, callback) if subscriber is not None]
+
+    def emit(event: str, **data) -> None:
+        for subscriber in subscribers:
+            subscriber(event, data)
     
     try:
         # Validate inputs to ensure the data is suitable for the simplex method
-        validate_inputs(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type)
+        validate_inputs(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, lb, ub)
         logger.debug("Inputs validated successfully")
+        tableau_dtype = resolve_dtype(dtype)
         
         num_constraints, num_original_vars = constraint_matrix.shape
-        logger.debug(f"Number of constraints: {num_constraints}")
-        logger.debug(f"Number of original variables: {num_original_vars}")
+        logger.debug("Number of constraints: %d", num_constraints)
+        logger.debug("Number of original variables: %d", num_original_vars)
 
-        # Print the problem in LaTeX format for better readability and educational purposes
-        print("\nProblem in LaTeX format:")
-        print_latex_problem(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type)
+        # Show the problem in LaTeX format for better readability and educational purposes
+        if subscribers:
+            emit('problem', objective_coeffs=objective_coeffs, constraint_matrix=constraint_matrix,
+                 rhs_values=rhs_values, senses=senses, problem_type=problem_type)
 
-        # Transform constraints with '>=' to '<=' by multiplying the row and rhs_values by -1.
-        transformed_constraint_matrix, transformed_rhs_values = transform_constraints(constraint_matrix, rhs_values, senses)
-        logger.debug("Constraints transformed successfully")
-        
-        # Set up the initial tableau for the simplex method
-        tableau = setup_tableau(objective_coeffs, transformed_constraint_matrix, transformed_rhs_values, senses, problem_type)
-        logger.debug("Tableau setup complete")
-        
-        print("\nInitial Problem Setup:")
-        print(f"Number of constraints (m): {num_constraints}")
-        print(f"Number of variables (n): {num_original_vars}")
-        print(f"Objective function coefficients (c): {objective_coeffs}")
-        
-        # Check for infeasibility: look for artificial variables in the basis with non-zero values
-        status = check_infeasibility(tableau, num_original_vars, senses, num_constraints)
-        if status == 'infeasible':
-            if verbose:
-                print("The problem is infeasible at the initial tableau.")
-            return status, None, None, tableau_history
-        
-        iteration = 0
-        while True:
-            iteration += 1
-            print(f"\n{'='*50}")
-            print(f"Iteration {iteration}:")
-            print("Current tableau:")
-            print(tableau)
-            
-            # Display detailed current information
-            print("\n[Step] Displaying current basic variables and RHS values:")
-            for i in range(1, tableau.shape[0]):
-                # Determine if the variable is artificial, slack, or original
-                if i - 1 < num_constraints:
-                    if senses[i-1] == '<=':
-                        var_type = "Slack"
-                    elif senses[i-1] == '>=' or senses[i-1] == '=':
-                        var_type = "Artificial"
-                    else:
-                        var_type = "Original"
+        if presolve:
+            if initial_basis is not None or return_basis or exact or sensitivity:
+                raise ValueError("Presolve cannot be combined with initial_basis, return_basis, exact or sensitivity.")
+            presolved = presolve_problem(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, feasibility_tol, lb, ub)
+            if subscribers:
+                emit('presolve', status=presolved.status, num_constraints=num_constraints, num_original_vars=num_original_vars,
+                     reduced_constraints=len(presolved.senses), reduced_vars=len(presolved.kept_columns))
+            if presolved.status in ('infeasible', 'unbounded'):
+                if subscribers:
+                    emit(presolved.status, stage='presolve')
+                return result(presolved.status, None, None)
+
+            reduced_solution, reduced_objective_value = None, 0.0
+            if presolved.status == 'reduced':
+                status, reduced_solution, reduced_objective_value, tableau_history = tabular_simplex(
+                    presolved.objective_coeffs, presolved.constraint_matrix, presolved.rhs_values, presolved.senses,
+                    problem_type, verbose=verbose, callback=callback, engine=engine, pricing=pricing,
+                    feasibility_tol=feasibility_tol, pivot_tol=pivot_tol, scaling=scaling, lb=presolved.lb, ub=presolved.ub,
+                    dtype=dtype, history=tableau_history, memmap_dir=memmap_dir, memory_budget=memory_budget
+                )
+                if status != 'optimal':
+                    return result(status, None, None)
+            optimal_solution = presolved.postsolve(reduced_solution)
+            optimal_objective_value = presolved.postsolve_objective(reduced_objective_value)
+            if subscribers:
+                emit('postsolve', solution=optimal_solution, objective_value=optimal_objective_value)
+            return result('optimal', optimal_solution, optimal_objective_value)
+
+        if sensitivity:
+            # Duals and ranges follow from the final basis and the original data, so no second solve is needed
+            solved = tabular_simplex(
+                objective_coeffs, constraint_matrix, rhs_values, senses, problem_type,
+                verbose=verbose, callback=callback, engine=engine, initial_basis=initial_basis, return_basis=True,
+                pricing=pricing, feasibility_tol=feasibility_tol, pivot_tol=pivot_tol, scaling=scaling, lb=lb, ub=ub,
+                dtype=dtype, exact=exact, history=tableau_history, memmap_dir=memmap_dir, memory_budget=memory_budget
+            )
+            status, optimal_solution, optimal_objective_value, tableau_history, optimal_basis = solved[:5]
+            certificate = solved[5] if exact else None
+            if status != 'optimal' or optimal_basis is None:
+                return result(status, optimal_solution, optimal_objective_value, optimal_basis, certificate=certificate)
+            report = sensitivity_analysis(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type,
+                                          optimal_basis, lb, ub, pivot_tol)
+            if subscribers:
+                emit('sensitivity', report=report)
+            return result(status, optimal_solution, optimal_objective_value, optimal_basis, report, certificate)
+
+        if exact:
+            # The float solve only has to find the basis; its values are replaced by the exact ones
+            status, _, _, tableau_history, optimal_basis = tabular_simplex(
+                objective_coeffs, constraint_matrix, rhs_values, senses, problem_type,
+                verbose=verbose, callback=callback, engine=engine, initial_basis=initial_basis, return_basis=True,
+                pricing=pricing, feasibility_tol=feasibility_tol, pivot_tol=pivot_tol, scaling=scaling, lb=lb, ub=ub, dtype=dtype,
+                history=tableau_history, memmap_dir=memmap_dir, memory_budget=memory_budget
+            )
+            if status != 'optimal':
+                return result(status, None, None)
+            certificate = exact_solve(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type,
+                                      initial_basis=optimal_basis, lb=lb, ub=ub)
+            if subscribers:
+                emit('exact', certificate=certificate)
+            if certificate.status != 'optimal':
+                return result(certificate.status, None, None, certificate=certificate)
+            return result('optimal', np.array(certificate.solution, dtype=float), float(certificate.objective_value), certificate.basis,
+                          certificate=certificate)
+
+        if scaling is not None:
+            # Bases are unaffected by scaling, so warm starts pass straight through
+            problem_scaling = compute_scaling(constraint_matrix, scaling)
+            if subscribers:
+                emit('scaling', scaling=problem_scaling)
+            scaled_objective_coeffs, scaled_constraint_matrix, scaled_rhs_values = problem_scaling.apply(
+                objective_coeffs, constraint_matrix, rhs_values
+            )
+            scaled_lb, scaled_ub = problem_scaling.scale_bounds(lb, ub)
+            scaled_result = tabular_simplex(
+                scaled_objective_coeffs, scaled_constraint_matrix, scaled_rhs_values, senses, problem_type,
+                verbose=verbose, callback=callback, engine=engine, initial_basis=initial_basis, return_basis=return_basis,
+                pricing=pricing, feasibility_tol=feasibility_tol, pivot_tol=pivot_tol, lb=scaled_lb, ub=scaled_ub, dtype=dtype,
+                history=tableau_history, memmap_dir=memmap_dir, memory_budget=memory_budget
+            )
+            status, scaled_solution, optimal_objective_value, tableau_history = scaled_result[:4]
+            if status != 'optimal':
+                return result(status, None, None, *scaled_result[4:])
+            optimal_solution = problem_scaling.unscale_solution(scaled_solution)
+            if subscribers:
+                emit('unscale', solution=optimal_solution, objective_value=optimal_objective_value)
+            return result('optimal', optimal_solution, optimal_objective_value, *scaled_result[4:])
+
+        if engine == 'auto':
+            engine = 'revised' if sp.issparse(constraint_matrix) else 'tableau'
+        if engine == 'revised':
+            # The revised engine keeps only a factorized basis, so there is no tableau history to record
+            status, optimal_solution, optimal_objective_value, optimal_basis = revised_simplex(
+                objective_coeffs, constraint_matrix, rhs_values, senses, problem_type,
+                tol=feasibility_tol, initial_basis=initial_basis, return_basis=True, pricing=pricing,
+                pivot_tol=pivot_tol, lb=lb, ub=ub, memory_budget=memory_budget
+            )
+            if subscribers:
+                if status == 'optimal':
+                    emit('optimal', solution=optimal_solution, objective_value=optimal_objective_value)
+                elif status == 'unbounded':
+                    emit('unbounded')
                 else:
-                    var_type = "Unknown"
-                print(f"Row {i} ({var_type} Basis): {tableau[i, :-1]} | RHS: {tableau[i, -1]:.4f}")
-            
-            # Store the current tableau in the history
-            tableau_history.append(tableau.copy())
-
-            # Check for optimality
-            if np.all(tableau[0, :-1] >= 0):
-                if verbose:
-                    print("All coefficients in the objective row are now nonnegative.")
-                    print("Explanation: No further improvement is possible so the current solution is optimal.")
-                status = 'optimal'
-                optimal_solution, optimal_objective_value = extract_solution(tableau, num_original_vars, num_constraints, problem_type)
-                tol = 1e-6
-                if np.any(np.dot(transformed_constraint_matrix, optimal_solution) > transformed_rhs_values + tol):
-                    print("\nProblem is infeasible!")
-                    logger.warning("Optimal solution violates at least one constraint")
-                    if verbose:
-                        print("After checking, there is a violation in the constraints (infeasible basic variable)!")
-                    return 'infeasible', None, None, tableau_history
-                print("\nOptimal solution found!")
-                logger.info(f"Optimal solution found: {optimal_solution}, Objective value: {optimal_objective_value}")
-                if verbose:
-                    print("Optimal solution reached!")
-                    print("Solution:", np.round(optimal_solution, 3))
-                    print("Objective value:", round(optimal_objective_value, 3))
-                return status, optimal_solution, optimal_objective_value, tableau_history
-
-            # Display detailed optimality test status
-            print("\n[Step] Checking objective row for negative coefficients:")
-            print(f"Objective Row (Z_j - C_j): {tableau[0, :-1]}")
-            
-            # Select entering variable
-            entering_col_index = select_entering_variable(tableau)
-            if verbose:
-                print(f"Entering variable (most negative coefficient) is at column index: {entering_col_index}")
-                print(f"Coefficient value for entering variable: {tableau[0, entering_col_index]:.3f}")
-            print(f"\nEntering variable chosen: x_{entering_col_index+1} with coefficient {tableau[0, entering_col_index]:.4f}")
-            print(f"This is the most negative coefficient, indicating the largest potential increase in the objective function.")
-            logger.debug(f"Selected entering variable: column {entering_col_index}")
-
-            # Compute and display ratios with detailed explanation
-            ratios = calculate_ratios(tableau, entering_col_index)
-            print("\n[Step] Computing ratios for leaving variable:")
-            
-            # Create a ratios tableau for display
-            ratios_tableau = np.full((tableau.shape[0]-1, 1), np.inf)
-            for i, ratio in enumerate(ratios[1:], start=1):
-                ratios_tableau[i-1, 0] = ratio
-                print(f"Row {i} ratio: {ratio:.4f}")
-            print("Ratios are calculated as RHS / corresponding element in the entering variable's column.")
-            print("The smallest non-negative ratio determines the leaving variable.")
-            print("\nRatios Tableau:")
-            print(ratios_tableau)
-            
-            leaving_row = select_leaving_variable(tableau, entering_col_index)
+                    emit('infeasible', stage='phase_one')
+            return result(status, optimal_solution, optimal_objective_value, optimal_basis)
+        if engine != 'tableau':
+            raise ValueError("Engine must be 'auto', 'tableau' or 'revised'.")
+
+        if memmap_dir is not None and initial_basis is not None:
+            raise ValueError("A warm start refactors the tableau in memory and cannot be combined with memmap_dir.")
+
+        # The tableau engine runs to completion; iter_simplex exposes the same steps one at a time
+        for final in _tableau_iterations(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, subscribers,
+                                         initial_basis, pricing, feasibility_tol, pivot_tol, lb, ub, tableau_dtype, tableau_history,
+                                         memmap_dir, memory_budget):
+            pass
+        return result(final.status, final.solution, final.objective_value, final.optimal_basis)
 
-            if leaving_row is None:
-                status = 'unbounded'
-                print("\nProblem is unbounded!")
-                logger.warning("Problem is unbounded")
-                if verbose:
-                    print("No valid leaving variable found (all ratios are infinite). The problem is unbounded!")
-                return status, None, None, tableau_history
-            
-            print(f"\nLeaving variable chosen: row {leaving_row} with pivot element {tableau[leaving_row, entering_col_index]:.4f}")
-            print(f"This row will be replaced by the entering variable in the next iteration.")
-            logger.debug("About to perform pivot operation")
-            if verbose:
-                print(f"Leaving variable is in row: {leaving_row}")
-            
-            # Perform pivot and display normalized pivot row
-            tableau = pivot(tableau, entering_col_index, leaving_row)
-            print("\n[Step] After pivot operation, new tableau:")
-            print(tableau)
-            print("\n[Step] Normalized pivot row details:")
-            print(tableau[leaving_row, :])
-            print("The pivot row has been normalized, and other rows have been adjusted to make the entering variable's column a unit vector.")
-            if verbose:
-                print("After pivot operation, the tableau is updated as follows:")
-                print(tableau)
-            
     except ValueError as e:
         logger.error(f"ValueError: {e}")
-        return 'infeasible', None, None, tableau_history
+        return result('infeasible', None, None)
     except Exception as e:
         logger.exception(f"An unexpected error occurred: {e}")
-        return 'infeasible', None, None, tableau_history
\ No newline at end of file
+        return result('infeasible', None, None)
+
+
+def iter_simplex(
+    objective_coeffs: np.ndarray,
+    constraint_matrix: np.ndarray,
+    rhs_values: np.ndarray,
+    senses: list[str],
+    problem_type: str = 'max',
+    verbose: bool = False,
+    callback: Callable[[str, dict], None] | None = None,
+    initial_basis: Basis | None = None,
+    pricing: str | PricingRule = 'dantzig',
+    feasibility_tol: float = 1e-9,
+    pivot_tol: float = 1e-9,
+    lb: np.ndarray | None = None,
+    ub: np.ndarray | None = None,
+    dtype: str | np.dtype = 'float64',
+    history: str | TableauHistory = 'none',
+    memmap_dir: str | None = None,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET
+) -> Iterator[SimplexIteration]:
+    """
+    Runs the tableau simplex method one step at a time.
+
+    Yields a SimplexIteration after every pivot and bound flip, and a last one with
+    the final status. Nothing is copied per step, so memory stays flat however many
+    iterations run, and the caller can stop at any point (an objective gap, a time
+    budget) by leaving the loop. Running the generator to the end gives the same
+    result as tabular_simplex with engine='tableau'; presolve, scaling, exact and
+    sensitivity are only available there.
+
+    Args:
+        objective_coeffs (np.ndarray): Objective function coefficients.
+        constraint_matrix (np.ndarray): Constraint coefficient matrix.
+        rhs_values (np.ndarray): Right-hand side values.
+        senses (list[str]): List of strings for each constraint ('<=', '>=', '=').
+        problem_type (str): 'max' for maximization, 'min' for minimization.
+        verbose (bool): Narrate every step with print_event.
+        callback (Callable[[str, dict], None] | None): Optional event subscriber.
+        initial_basis (Basis | None): Basis from an earlier solve to warm start from.
+        pricing (str | PricingRule): Entering-column rule, see utils.pricing.
+        feasibility_tol (float): How far basic variables may drop below zero in the Harris ratio test.
+        pivot_tol (float): Smallest column entry accepted as a pivot.
+        lb (np.ndarray | None): Variable lower bounds (-inf for none), default 0.
+        ub (np.ndarray | None): Variable upper bounds (inf for none), default inf.
+        dtype (str | np.dtype): Tableau dtype: 'float32', 'float64' or 'longdouble'.
+        history (str | TableauHistory): Which tableaux to keep as well, see utils.history.
+        memmap_dir (str | None): Back the tableau with a np.memmap file in this directory, see utils.out_of_core.
+        memory_budget (int): Scratch bytes per row panel of a pivot update.
+
+    Returns:
+        Iterator[SimplexIteration]: The state after each step.
+
+    Raises:
+        ValueError: If the inputs are invalid.
+    """
+    logger.info("Starting iterative tabular simplex method")
+    # Inputs are checked here rather than on the first next(), so errors surface at the call
+    validate_inputs(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, lb, ub)
+    if memmap_dir is not None and initial_basis is not None:
+        raise ValueError("A warm start refactors the tableau in memory and cannot be combined with memmap_dir.")
+    tableau_dtype = resolve_dtype(dtype)
+    tableau_history = get_history_policy(history)
+    subscribers = [subscriber for subscriber in (print_event if verbose else None, callback) if subscriber is not None]
+    for subscriber in subscribers:
+        subscriber('problem', dict(objective_coeffs=objective_coeffs, constraint_matrix=constraint_matrix,
+                                   rhs_values=rhs_values, senses=senses, problem_type=problem_type))
+    return _tableau_iterations(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, subscribers,
+                               initial_basis, pricing, feasibility_tol, pivot_tol, lb, ub, tableau_dtype, tableau_history,
+                               memmap_dir, memory_budget)
@@ -1,10 +1,17 @@
 import numpy as np
-from typing import List, Tuple
-from utils.transform_constraints import transform_constraints
-from utils.setup_tableau import setup_tableau
-from utils.pivot import select_entering_variable, select_leaving_variable, pivot
-from utils.solution_extraction import extract_solution
+import scipy.sparse as sp
+from typing import List
+from utils.pricing import PricingRule
+from utils.presolve import presolve_problem
+from utils.scaling import compute_scaling
+from utils.precision import resolve_dtype
+from utils.basis import Basis
+from utils.exact import exact_solve
+from utils.history import NoHistory
+from utils.sensitivity import sensitivity_analysis
 from utils.input_validation import validate_inputs
+from utils.revised_simplex import revised_simplex
+from simplex import _tableau_iterations
 import logging
 
 # Configure logging
@@ -17,73 +24,188 @@ def simplex_solver(
     rhs_values: np.ndarray,
     senses: List[str],
     problem_type: str = 'max',
-    max_iterations: int = 100
-) -> Tuple[np.ndarray, float]:
+    max_iterations: int = 1000,
+    engine: str = 'auto',
+    initial_basis: Basis = None,
+    return_basis: bool = False,
+    pricing: str | PricingRule = 'dantzig',
+    feasibility_tol: float = 1e-9,
+    pivot_tol: float = 1e-9,
+    presolve: bool = False,
+    scaling: str = None,
+    lb: np.ndarray = None,
+    ub: np.ndarray = None,
+    dtype: str = 'float64',
+    exact: bool = False,
+    sensitivity: bool = False
+) -> tuple:
     """
     Solves a linear programming problem using the simplex method.
 
     Args:
         objective_coeffs (np.ndarray): Objective function coefficients.
-        constraint_matrix (np.ndarray): Constraint coefficient matrix.
+        constraint_matrix (np.ndarray | sp.spmatrix): Dense or CSR/CSC constraint coefficient matrix.
         rhs_values (np.ndarray): Right-hand side values.
         senses (List[str]): List of strings for each constraint ('<=', '>=', '=').
         problem_type (str): 'max' for maximization, 'min' for minimization.
-        max_iterations (int): Maximum number of iterations to perform.
+        max_iterations (int): Maximum number of iterations to perform. If the solve has not
+            finished by then, no solution is returned (None, None), as for an infeasible problem.
+        engine (str): 'tableau' for the dense tableau method, 'revised' for the
+            LU-factorized revised simplex method (max_iterations does not apply),
+            or 'auto' to use the revised method for scipy.sparse constraint matrices.
+        initial_basis (Basis): Basis returned by an earlier solve to warm start from.
+        return_basis (bool): Also return the final Basis as a third element.
+        pricing (str | PricingRule): Entering-column rule ('dantzig', 'bland', 'devex',
+            'steepest_edge', 'partial' or a PricingRule instance).
+        feasibility_tol (float): How far a basic variable may drop below zero in the Harris
+            ratio test; also the Phase I infeasibility tolerance.
+        pivot_tol (float): Smallest column entry accepted as a pivot.
+        presolve (bool): Remove redundant rows and fixed or dominated columns first
+            (see utils.presolve) and map the solution back. Cannot be combined with
+            initial_basis or return_basis.
+        scaling (str): 'geometric', 'equilibrate' or 'auto' to scale rows and columns
+            before the solve (see utils.scaling); the solution is unscaled automatically.
+        lb (np.ndarray): Variable lower bounds (-inf for none), default 0.
+        ub (np.ndarray): Variable upper bounds (inf for none), default inf. Bounds are
+            handled inside the ratio test (see utils.bounds), not as extra rows.
+        dtype (str): Tableau dtype, 'float32', 'float64' or 'longdouble'. A float32
+            tableau uses half the memory; it is refactorized in float64 every
+            REFACTOR_FREQUENCY pivots and the solution is computed in float64 with
+            iterative refinement (see utils.precision). The revised engine always uses float64.
+        exact (bool): Certify the optimal basis in rational arithmetic (see utils.exact),
+            continuing with exact pivots if it is not exactly optimal, return the
+            exact solution rounded to float and append the ExactCertificate as the last
+            element (None if the float solve fails). Cannot be combined with presolve.
+        sensitivity (bool): Also return a SensitivityReport (duals, reduced costs, slacks,
+            RHS and objective ranging) computed from the final basis, as the last element
+            (None if the problem is not optimal). Cannot be combined with presolve.
 
     Returns:
-        Tuple[np.ndarray, float]: A tuple containing the optimal solution and the optimal objective value.
+        tuple: The optimal solution and the optimal objective value (None and None if the
+        problem is infeasible or the iteration limit is reached, None and inf if it is
+        unbounded), followed by the Basis if return_basis, the SensitivityReport if
+        sensitivity and the ExactCertificate if exact, in that order, so 2 to 5 elements.
     """
     logger.info("Starting simplex solver")
     
     # Validate inputs
-    validate_inputs(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type)
-    
-    # Transform constraints to standard form
-    transformed_matrix, transformed_rhs = transform_constraints(constraint_matrix, rhs_values, senses)
-    
-    # Set up the initial tableau
-    tableau = setup_tableau(objective_coeffs, transformed_matrix, transformed_rhs, senses, problem_type)
-    logger.info(f"Initial Tableau:\n{tableau}")
-    
-    num_original_vars = len(objective_coeffs)
-    num_constraints = len(senses)
-    
-    # Iterate until optimal solution is found or max iterations reached
-    iteration = 0
-    while iteration < max_iterations:
-        logger.info(f"Iteration: {iteration + 1}")
-        
-        # Select entering variable
-        entering_col = select_entering_variable(tableau)
-        logger.info(f"Entering column: {entering_col}")
-        
-        # Check if all coefficients in the objective row are non-negative
-        if tableau[0, entering_col] >= 0:
-            logger.info("Optimal solution found")
-            break
-            
-        # Select leaving variable
-        leaving_row = select_leaving_variable(tableau, entering_col)
-        logger.info(f"Leaving row: {leaving_row}")
-        
-        # Check if the problem is unbounded
-        if leaving_row is None:
+    validate_inputs(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, lb, ub)
+    tableau_dtype = resolve_dtype(dtype)
+
+    if presolve:
+        if initial_basis is not None or return_basis or exact or sensitivity:
+            raise ValueError("Presolve cannot be combined with initial_basis, return_basis, exact or sensitivity.")
+        presolved = presolve_problem(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, feasibility_tol, lb, ub)
+        if presolved.status == 'infeasible':
+            logger.warning("Problem is infeasible")
+            return None, None
+        if presolved.status == 'unbounded':
             logger.warning("Problem is unbounded")
             return None, float('inf')
-        
-        # Pivot
-        tableau = pivot(tableau, entering_col, leaving_row)
-        logger.info(f"Tableau after pivoting:\n{tableau}")
-        
-        iteration += 1
-    
-    # Extract solution
-    optimal_solution, optimal_objective_value = extract_solution(tableau, num_original_vars, num_constraints, problem_type)
-    
-    logger.info(f"Optimal solution: {optimal_solution}")
-    logger.info(f"Optimal objective value: {optimal_objective_value}")
+        if presolved.status == 'optimal':
+            return presolved.postsolve(), presolved.postsolve_objective(0.0)
+        reduced_solution, reduced_objective_value = simplex_solver(
+            presolved.objective_coeffs, presolved.constraint_matrix, presolved.rhs_values, presolved.senses,
+            problem_type, max_iterations, engine, pricing=pricing, feasibility_tol=feasibility_tol, pivot_tol=pivot_tol,
+            scaling=scaling, lb=presolved.lb, ub=presolved.ub, dtype=dtype
+        )
+        if reduced_solution is None:
+            return None, reduced_objective_value
+        return presolved.postsolve(reduced_solution), presolved.postsolve_objective(reduced_objective_value)
+
+    if sensitivity:
+        solved = simplex_solver(
+            objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, max_iterations,
+            engine, initial_basis, True, pricing, feasibility_tol, pivot_tol, scaling=scaling, lb=lb, ub=ub, dtype=dtype,
+            exact=exact
+        )
+        optimal_solution, optimal_objective_value, optimal_basis = solved[:3]
+        certificate = solved[3:]  # The ExactCertificate if exact
+        report = None
+        if optimal_solution is not None and optimal_basis is not None:
+            report = sensitivity_analysis(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type,
+                                          optimal_basis, lb, ub, pivot_tol)
+        if return_basis:
+            return (optimal_solution, optimal_objective_value, optimal_basis, report) + certificate
+        return (optimal_solution, optimal_objective_value, report) + certificate
+
+    if exact:
+        float_result = simplex_solver(
+            objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, max_iterations,
+            engine, initial_basis, True, pricing, feasibility_tol, pivot_tol, scaling=scaling, lb=lb, ub=ub, dtype=dtype
+        )
+        if float_result[0] is None:
+            return (float_result if return_basis else float_result[:2]) + (None,)
+        certificate = exact_solve(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type,
+                                  initial_basis=float_result[2], lb=lb, ub=ub)
+        logger.info("Exact verification: %s after %d exact pivots", certificate.status, certificate.pivots)
+        if certificate.status == 'optimal':
+            exact_result = np.array(certificate.solution, dtype=float), float(certificate.objective_value)
+        else:
+            exact_result = None, float('inf') if certificate.status == 'unbounded' else None
+        if return_basis:
+            exact_result += (certificate.basis,)
+        return exact_result + (certificate,)
+
+    if scaling is not None:
+        problem_scaling = compute_scaling(constraint_matrix, scaling)
+        scaled_objective_coeffs, scaled_constraint_matrix, scaled_rhs_values = problem_scaling.apply(
+            objective_coeffs, constraint_matrix, rhs_values
+        )
+        scaled_lb, scaled_ub = problem_scaling.scale_bounds(lb, ub)
+        scaled_result = simplex_solver(
+            scaled_objective_coeffs, scaled_constraint_matrix, scaled_rhs_values, senses, problem_type, max_iterations,
+            engine, initial_basis, return_basis, pricing, feasibility_tol, pivot_tol, lb=scaled_lb, ub=scaled_ub, dtype=dtype
+        )
+        if scaled_result[0] is None:
+            return scaled_result
+        return (problem_scaling.unscale_solution(scaled_result[0]),) + scaled_result[1:]
+
+    if engine == 'auto':
+        engine = 'revised' if sp.issparse(constraint_matrix) else 'tableau'
+    if engine == 'revised':
+        status, optimal_solution, optimal_objective_value, optimal_basis = revised_simplex(
+            objective_coeffs, constraint_matrix, rhs_values, senses, problem_type,
+            tol=feasibility_tol, initial_basis=initial_basis, return_basis=True, pricing=pricing,
+            pivot_tol=pivot_tol, lb=lb, ub=ub
+        )
+        if status == 'unbounded':
+            logger.warning("Problem is unbounded")
+            optimal_solution, optimal_objective_value = None, float('inf')
+        elif status == 'infeasible':
+            logger.warning("Problem is infeasible")
+            optimal_solution, optimal_objective_value = None, None
+        if return_basis:
+            return optimal_solution, optimal_objective_value, optimal_basis
+        return optimal_solution, optimal_objective_value
+    if engine != 'tableau':
+        raise ValueError("Engine must be 'auto', 'tableau' or 'revised'.")
     
-    return optimal_solution, optimal_objective_value
+    # The tableau engine of tabular_simplex, run step by step so the iteration limit can stop it
+    steps = _tableau_iterations(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, [], initial_basis,
+                                pricing, feasibility_tol, pivot_tol, lb, ub, tableau_dtype, NoHistory())
+    num_steps = 0
+    for state in steps:
+        if state.status != 'running':
+            break
+        num_steps += 1
+        if num_steps > max_iterations:
+            # The current point is not known to be optimal (in Phase I not even feasible), so it is not returned
+            steps.close()
+            logger.warning("Iteration limit of %d reached before the solution was proven optimal", max_iterations)
+            return (None, None, None) if return_basis else (None, None)
+
+    if state.status == 'optimal':
+        logger.info("Optimal solution: %s", state.solution)
+        logger.info("Optimal objective value: %s", state.objective_value)
+        optimal_result = state.solution, state.objective_value
+    elif state.status == 'unbounded':
+        logger.warning("Problem is unbounded")
+        optimal_result = None, float('inf')
+    else:
+        logger.warning("Problem is infeasible")
+        optimal_result = None, None
+    return optimal_result + (state.optimal_basis,) if return_basis else optimal_result
 
 if __name__ == '__main__':
     # Example usage
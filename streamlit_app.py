@@ -1,9 +1,11 @@
 import streamlit as st
+import asyncio
 import logging
 from webapp.components.example_selection import example_selection
 from webapp.components.input_form import input_form
 from webapp.components.display_results import display_results
-from webapp.logic.solve_simplex import solve_simplex
+from webapp.logic.solve_async import solve_async
+from webapp.logic.solution_cache import solution_cache
 from webapp.logic.load_example import load_example
 from webapp.logic.problem_latex import problem_latex
 
@@ -12,6 +14,9 @@ from webapp.example_problems import example_problems
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 
+# Seconds a single solve may run before it is stopped
+SOLVE_TIMEOUT = 60
+
 def main():
     st.title("Tabular Simplex Method Solver")
 
@@ -45,21 +50,34 @@ def main():
 
     if submitted:
         if objective_coeffs is not None and constraint_matrix is not None and rhs_values is not None:
-            # Call the tabular simplex method
-            status, solution, objective_value, tableau_history = solve_simplex(
-                objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, verbose=True
-            )
-
-            # Display results
-            if status == 'optimal':
-                # Display the problem in LaTeX format
-                st.subheader("Problem Formulation (LaTeX)")
-                latex_str = problem_latex(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type)
-                st.latex(latex_str)
-
-            display_results(status, solution, objective_value, tableau_history, objective_coeffs, constraint_matrix, rhs_values, senses)
+            # Call the tabular simplex method off the script thread, showing progress and stopping at the time limit;
+            # the result is kept so browsing the tableau history does not solve again
+            progress_text = st.empty()
+            results = asyncio.run(solve_async(
+                objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, verbose=True, timeout=SOLVE_TIMEOUT,
+                progress=lambda state: progress_text.write(f"Iteration {state.iteration}: objective value {state.objective_value}")
+            ))
+            progress_text.empty()
+            st.session_state.solve_results = (objective_coeffs, constraint_matrix, rhs_values, senses, problem_type) + tuple(results)
         else:
+            st.session_state.pop('solve_results', None)
             st.error("Please provide valid inputs for all parameters.")
 
+    cache_stats = solution_cache.stats()
+    st.sidebar.caption(f"Solution cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+
+    if 'solve_results' in st.session_state:
+        objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, status, solution, objective_value, tableau_history = \
+            st.session_state.solve_results
+
+        # Display results
+        if status == 'optimal':
+            # Display the problem in LaTeX format
+            st.subheader("Problem Formulation (LaTeX)")
+            latex_str = problem_latex(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type)
+            st.latex(latex_str)
+
+        display_results(status, solution, objective_value, tableau_history, objective_coeffs, constraint_matrix, rhs_values, senses)
+
 if __name__ == "__main__":
     main()
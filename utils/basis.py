@@ -0,0 +1,182 @@
+import numpy as np
+import scipy.sparse as sp
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from utils.setup_tableau import tableau_variable_indices
+from utils.two_phase import remove_artificial_variables
+from utils.bounds import TableauBounds
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+@dataclass
+class Basis:
+    """
+    A reusable simplex basis, returned by the solvers and accepted as `initial_basis`.
+
+    `basic_variables[i]` is the variable that is basic in constraint row i, in the
+    layout-independent numbering shared by both engines: original variables are
+    0..n-1, the slack/surplus variable of row i is n + i and the artificial variable
+    of row i is n + m + i. `at_upper` lists the bounded original variables that are
+    nonbasic at their upper bound rather than their lower bound (problems with lb/ub only).
+    """
+    basic_variables: np.ndarray
+    num_original_vars: int
+    num_constraints: int
+    at_upper: Optional[np.ndarray] = None
+
+    def matches(self, num_original_vars: int, num_constraints: int) -> bool:
+        return (
+            self.num_original_vars == num_original_vars
+            and self.num_constraints == num_constraints
+            and len(self.basic_variables) == num_constraints
+            and len(np.unique(self.basic_variables)) == num_constraints
+        )
+
+
+def refactor_tableau(tableau: np.ndarray, basis: np.ndarray) -> np.ndarray:
+    """
+    Rewrites a tableau in terms of the given basis with one factorization.
+
+    The constraint rows become B^-1 [A | b] and the objective row is priced out
+    against the basic columns, which is what the pivots leading to that basis would
+    have produced. Basic columns are set to exact unit vectors afterwards so that
+    later pivots and solution extraction see a clean basis. The solve runs in
+    float64 and the result keeps the dtype of the given tableau.
+
+    Args:
+        tableau (np.ndarray): Tableau whose constraint rows are in their original form.
+        basis (np.ndarray): Tableau column that should be basic in each constraint row.
+
+    Returns:
+        np.ndarray: The refactored tableau.
+
+    Raises:
+        np.linalg.LinAlgError: If the basis matrix is singular.
+    """
+    logger.info("Refactoring tableau to the given basis")
+    dtype = tableau.dtype if np.issubdtype(tableau.dtype, np.floating) else np.float64
+    tableau = np.array(tableau, dtype=np.float64)
+    basis_matrix = tableau[1:, basis]
+    tableau[1:, :] = np.linalg.solve(basis_matrix, tableau[1:, :])
+    tableau[1:, basis] = np.eye(len(basis))
+    tableau[0, :] -= tableau[0, basis] @ tableau[1:, :]
+    tableau[0, basis] = 0.0
+    logger.debug("Refactored tableau:\n%s", tableau)
+    return tableau.astype(dtype, copy=False)
+
+
+def warm_start_tableau(
+    tableau: np.ndarray,
+    num_original_vars: int,
+    senses: List[str],
+    initial_basis: Basis,
+    tol: float = 1e-9,
+    bounds: Optional[TableauBounds] = None
+) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Moves a freshly built tableau to a previously returned basis.
+
+    The basis is usable when it fits the problem, contains no artificial variables,
+    its basis matrix is nonsingular and the refactored tableau is either primal
+    feasible (continue with primal simplex) or dual feasible (continue with dual
+    simplex). Artificial columns are dropped, as after Phase I. Otherwise the caller
+    should fall back to a cold start.
+
+    Args:
+        tableau (np.ndarray): Tableau returned by setup_tableau.
+        num_original_vars (int): Number of original variables.
+        senses (List[str]): Constraint senses used to build the tableau.
+        initial_basis (Basis): Basis from an earlier solve.
+        tol (float): Feasibility tolerance.
+        bounds (Optional[TableauBounds]): Bound bookkeeping of a problem with lb/ub; the
+            variables in `initial_basis.at_upper` are moved to their upper bound, as is any
+            other boxed nonbasic variable whose reduced cost favours it.
+
+    Returns:
+        Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]: The refactored tableau, the
+        tableau column basic in each row and the variable index of each tableau column,
+        or None if the basis cannot be used.
+    """
+    num_constraints = len(senses)
+    if not initial_basis.matches(num_original_vars, num_constraints):
+        logger.warning("Initial basis does not match the problem dimensions, starting from scratch")
+        return None
+
+    variable_indices = tableau_variable_indices(num_original_vars, senses)
+    column_of = {variable: column for column, variable in enumerate(variable_indices)}
+    if any(variable not in column_of or variable >= num_original_vars + num_constraints
+           for variable in initial_basis.basic_variables):
+        logger.warning("Initial basis refers to variables the tableau does not have, starting from scratch")
+        return None
+    basis = np.array([column_of[variable] for variable in initial_basis.basic_variables], dtype=int)
+
+    try:
+        tableau = refactor_tableau(tableau, basis)
+    except np.linalg.LinAlgError:
+        logger.warning("Initial basis is singular, starting from scratch")
+        return None
+    artificial_columns = variable_indices >= num_original_vars + num_constraints
+    tableau, basis, variable_indices = remove_artificial_variables(tableau, basis, variable_indices, artificial_columns)
+
+    if bounds is not None:
+        if initial_basis.at_upper is not None:
+            bounds.move_to_upper(tableau, basis, initial_basis.at_upper)
+        primal_feasible = bounds.primal_infeasibility(tableau, basis) <= tol
+        if not primal_feasible:
+            # A boxed variable can sit at either bound, so it never has to violate dual feasibility
+            bounds.flip_dual_infeasible(tableau, basis, tol)
+        dual_feasible = bounds.is_dual_feasible(tableau, tol)
+    else:
+        primal_feasible = np.all(tableau[1:, -1] >= -tol)
+        dual_feasible = np.all(tableau[0, :-1] >= -tol)
+    if not (primal_feasible or dual_feasible):
+        logger.warning("Initial basis is neither primal nor dual feasible, starting from scratch")
+        return None
+    logger.info("Warm start from the given basis (%s feasible)", 'primal' if primal_feasible else 'dual')
+    return tableau, basis, variable_indices
+
+
+def tableau_basis(
+    basis: np.ndarray,
+    variable_indices: np.ndarray,
+    num_original_vars: int,
+    num_constraints: int,
+    at_upper: Optional[np.ndarray] = None
+) -> Basis:
+    """Wraps the basic tableau columns of a solve into a reusable Basis."""
+    return Basis(variable_indices[basis], num_original_vars, num_constraints, at_upper)
+
+
+def variable_columns(variables: np.ndarray, constraint_matrix: np.ndarray | sp.spmatrix, senses: List[str],
+                     sparse: bool = False) -> np.ndarray | sp.csc_matrix:
+    """
+    Constraint columns of the given layout-independent variables, dense unless sparse is set.
+
+    Original variable j gives A_j, the slack/surplus variable of row i gives +e_i
+    ('<=') or -e_i ('>='), and the artificial variable of row i gives e_i. With
+    sparse the columns are assembled as a CSC matrix without densifying A.
+    """
+    num_constraints, num_original_vars = constraint_matrix.shape
+    variables = np.asarray(variables, dtype=int)
+    logical_signs = np.array([1.0 if sense == '<=' else -1.0 if sense == '>=' else 0.0 for sense in senses])
+    structural = np.flatnonzero(variables < num_original_vars)
+    logical = np.flatnonzero((variables >= num_original_vars) & (variables < num_original_vars + num_constraints))
+    artificial = np.flatnonzero(variables >= num_original_vars + num_constraints)
+    if sparse:
+        values = sp.coo_matrix(sp.csc_matrix(constraint_matrix)[:, variables[structural]])
+        rows = np.concatenate([values.row, variables[logical] - num_original_vars,
+                               variables[artificial] - num_original_vars - num_constraints])
+        cols = np.concatenate([structural[values.col], logical, artificial])
+        data = np.concatenate([values.data, logical_signs[variables[logical] - num_original_vars], np.ones(len(artificial))])
+        columns = sp.csc_matrix((data, (rows, cols)), shape=(num_constraints, len(variables)))
+        columns.eliminate_zeros()
+        return columns
+    columns = np.zeros((num_constraints, len(variables)))
+    if structural.size:
+        values = constraint_matrix[:, variables[structural]]
+        columns[:, structural] = values.toarray() if sp.issparse(values) else values
+    columns[variables[logical] - num_original_vars, logical] = logical_signs[variables[logical] - num_original_vars]
+    columns[variables[artificial] - num_original_vars - num_constraints, artificial] = 1.0
+    return columns
@@ -0,0 +1,253 @@
+import numpy as np
+import scipy.sparse as sp
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from utils.ratio_test import Perturbation, harris_ratio_test
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+@dataclass
+class BoundTransform:
+    """
+    Change of variables that gives every variable the range [0, upper] or makes it free.
+
+    x_j = offset_j + sign_j * v_j: a finite lower bound is shifted to zero, a variable
+    with only an upper bound is mirrored (v = ub - x), and a variable with neither
+    bound is free (v = x, unrestricted).
+    """
+    offset: np.ndarray
+    sign: np.ndarray
+    upper: np.ndarray  # Upper bound of v_j (inf if there is none)
+    free: np.ndarray
+
+    def restore(self, values: np.ndarray) -> np.ndarray:
+        """Maps values of the transformed variables back to the original variables."""
+        return self.offset + self.sign * values
+
+
+def transform_bounds(
+    objective_coeffs: np.ndarray,
+    constraint_matrix: np.ndarray | sp.spmatrix,
+    rhs_values: np.ndarray,
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray | sp.spmatrix, np.ndarray, BoundTransform]:
+    """
+    Rewrites a problem with bounds lb <= x <= ub in the transformed variables of BoundTransform.
+
+    Args:
+        objective_coeffs (np.ndarray): Objective function coefficients.
+        constraint_matrix (np.ndarray | sp.spmatrix): Dense or CSR/CSC constraint coefficient matrix.
+        rhs_values (np.ndarray): Right-hand side values.
+        lb (Optional[np.ndarray]): Lower bounds (-inf allowed), default 0.
+        ub (Optional[np.ndarray]): Upper bounds (inf allowed), default inf.
+
+    Returns:
+        Tuple: The transformed objective coefficients, constraint matrix (same format)
+        and right-hand sides, and the BoundTransform to map solutions back.
+    """
+    num_variables = constraint_matrix.shape[1]
+    lb = np.zeros(num_variables) if lb is None else np.asarray(lb, dtype=float)
+    ub = np.full(num_variables, np.inf) if ub is None else np.asarray(ub, dtype=float)
+
+    mirrored = ~np.isfinite(lb) & np.isfinite(ub)
+    free = ~np.isfinite(lb) & ~np.isfinite(ub)
+    offset = np.where(np.isfinite(lb), lb, np.where(mirrored, ub, 0.0))
+    sign = np.where(mirrored, -1.0, 1.0)
+    upper = np.where(np.isfinite(lb) & np.isfinite(ub), ub - lb, np.inf)
+    logger.debug("Bounds: %d boxed, %d mirrored and %d free variables",
+                 np.count_nonzero(np.isfinite(upper)), np.count_nonzero(mirrored), np.count_nonzero(free))
+
+    if not np.any(mirrored):
+        # Shifts only change the right-hand side, so the (possibly memory-mapped) matrix is not copied
+        transformed_matrix = constraint_matrix
+    elif sp.issparse(constraint_matrix):
+        transformed_matrix = (constraint_matrix @ sp.diags(sign)).asformat(constraint_matrix.format)
+    else:
+        transformed_matrix = constraint_matrix * sign
+    transformed_rhs = np.asarray(rhs_values, dtype=float) - constraint_matrix @ offset
+    return np.asarray(objective_coeffs, dtype=float) * sign, transformed_matrix, transformed_rhs, \
+        BoundTransform(offset, sign, upper, free)
+
+
+class TableauBounds:
+    """
+    Bound bookkeeping for the bounded-variable tableau method.
+
+    The structural columns of the tableau hold the transformed variables v_j of a
+    BoundTransform, every other column a variable in [0, inf). Nonbasic variables
+    always sit at zero: a variable that moves to its upper bound u is complemented
+    (w = u - v) instead, which negates its column and moves u times the column into
+    the right-hand side. So the right-hand side keeps holding the basic values, and a
+    basic variable may now also block at its upper bound in the ratio test.
+    Free variables never block and may enter in either direction.
+    """
+
+    def __init__(self, transform: BoundTransform):
+        self.transform = transform
+        self.num_variables = len(transform.upper)
+        # v_j = base_j + column_sign_j * w_j for the current tableau variable w_j
+        self.base = np.zeros(self.num_variables)
+        self.column_sign = np.ones(self.num_variables)
+        self.complements = 0  # Number of complemented columns and rows, so callers can tell a plain pivot apart
+
+    def column_upper(self, num_columns: int) -> np.ndarray:
+        return np.concatenate([self.transform.upper, np.full(num_columns - self.num_variables, np.inf)])
+
+    def column_free(self, num_columns: int) -> np.ndarray:
+        return np.concatenate([self.transform.free, np.zeros(num_columns - self.num_variables, dtype=bool)])
+
+    def basic_bounds(self, tableau: np.ndarray, basis: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Lower and upper bounds of the basic variables."""
+        num_columns = tableau.shape[1] - 1
+        lower = np.where(self.column_free(num_columns)[basis], -np.inf, 0.0)
+        return lower, self.column_upper(num_columns)[basis]
+
+    def price(self, tableau: np.ndarray):
+        """Returns a price function for PricingRule.select_entering with fixed columns excluded and free columns in either direction."""
+        num_columns = tableau.shape[1] - 1
+        movable = self.column_upper(num_columns) > 0
+        free = self.column_free(num_columns)
+
+        def price(columns: np.ndarray | slice) -> np.ndarray:
+            reduced_costs = tableau[0, :-1][columns]
+            reduced_costs = np.where(free[columns], -np.abs(reduced_costs), reduced_costs)
+            return np.where(movable[columns], reduced_costs, 0.0)
+        return price
+
+    def complement_column(self, tableau: np.ndarray, column: int) -> None:
+        """Moves a nonbasic variable to its other bound (a free variable just changes direction)."""
+        self.complements += 1
+        upper = 0.0 if column >= self.num_variables or self.transform.free[column] else self.transform.upper[column]
+        if upper:
+            tableau[:, -1] -= upper * tableau[:, column]
+        tableau[:, column] *= -1
+        if column < self.num_variables:
+            self.base[column] += self.column_sign[column] * upper
+            self.column_sign[column] = -self.column_sign[column]
+
+    def complement_row(self, tableau: np.ndarray, row: int, basic_column: int, perturbation: Optional[Perturbation] = None) -> None:
+        """Complements the basic variable of tableau row `row` so that its upper bound becomes its lower bound."""
+        self.complements += 1
+        upper = self.transform.upper[basic_column]
+        tableau[row, :] *= -1
+        tableau[row, basic_column] = 1.0
+        tableau[row, -1] += upper
+        self.base[basic_column] += self.column_sign[basic_column] * upper
+        self.column_sign[basic_column] = -self.column_sign[basic_column]
+        if perturbation is not None:
+            perturbation.negate(row)
+
+    def orient_entering(self, tableau: np.ndarray, column: int) -> None:
+        """Makes a free entering variable increase, so the usual ratio test applies."""
+        if column < self.num_variables and self.transform.free[column] and tableau[0, column] > 0:
+            self.complement_column(tableau, column)
+
+    def select_leaving(
+        self,
+        tableau: np.ndarray,
+        basis: np.ndarray,
+        entering: int,
+        feasibility_tol: float = 1e-9,
+        pivot_tol: float = 1e-9
+    ) -> Tuple[Optional[int], bool]:
+        """
+        Bounded ratio test for an entering column that increases from zero.
+
+        Returns:
+            Tuple[Optional[int], bool]: The leaving tableau row (None if no basic variable
+            blocks) and whether the entering variable reaches its own upper bound first,
+            in which case it is complemented instead of pivoted in.
+        """
+        lower, upper = self.basic_bounds(tableau, basis)
+        column, rhs = tableau[1:, entering], tableau[1:, -1]
+        row = harris_ratio_test(column, rhs, feasibility_tol, pivot_tol, lower=lower, upper=upper)
+        entering_upper = self.column_upper(tableau.shape[1] - 1)[entering]
+        if self.column_free(tableau.shape[1] - 1)[entering]:
+            entering_upper = np.inf
+        if row is None:
+            return None, bool(np.isfinite(entering_upper))
+        distance = rhs[row] - lower[row] if column[row] > 0 else upper[row] - rhs[row]
+        step = max(distance, 0.0) / abs(column[row])
+        return row + 1, bool(entering_upper <= step)
+
+    def select_leaving_dual(
+        self,
+        tableau: np.ndarray,
+        basis: np.ndarray,
+        feasibility_tol: float = 1e-9,
+        perturbation: Optional[Perturbation] = None
+    ) -> Optional[int]:
+        """
+        Picks the basic variable furthest outside its bounds for a dual simplex step.
+
+        A variable above its upper bound is complemented first, so the chosen row always
+        has a negative right-hand side as in the unbounded case. Returns None when every
+        basic variable is within its bounds.
+        """
+        lower, upper = self.basic_bounds(tableau, basis)
+        rhs = tableau[1:, -1]
+        below, above = lower - rhs, rhs - upper
+        violation = np.maximum(below, above)
+        row = int(np.argmax(violation))
+        if violation[row] <= feasibility_tol:
+            return None
+        if above[row] > below[row]:
+            self.complement_row(tableau, row + 1, basis[row], perturbation)
+        return row + 1
+
+    def select_entering_dual(self, tableau: np.ndarray, leaving_row: int, tol: float = 1e-9) -> Optional[int]:
+        """Dual ratio test over the movable columns; free columns are turned to have a negative entry."""
+        num_columns = tableau.shape[1] - 1
+        row = tableau[leaving_row, :-1]
+        free = self.column_free(num_columns)
+        candidates = (self.column_upper(num_columns) > 0) & ((row < -tol) | (free & (row > tol)))
+        if not np.any(candidates):
+            logger.warning("Problem is infeasible: no eligible entry in leaving row %d", leaving_row)
+            return None
+        ratios = np.full(num_columns, np.inf)
+        ratios[candidates] = np.abs(tableau[0, :-1][candidates]) / np.abs(row[candidates])
+        entering = int(np.argmin(ratios))
+        if row[entering] > 0:
+            self.complement_column(tableau, entering)
+        return entering
+
+    def is_dual_feasible(self, tableau: np.ndarray, tol: float = 1e-9) -> bool:
+        return not np.any(self.price(tableau)(slice(None)) < -tol)
+
+    def primal_infeasibility(self, tableau: np.ndarray, basis: np.ndarray) -> float:
+        lower, upper = self.basic_bounds(tableau, basis)
+        rhs = tableau[1:, -1]
+        return float(max(np.max(lower - rhs, initial=0.0), np.max(rhs - upper, initial=0.0)))
+
+    def solution(self, tableau: np.ndarray, basis: np.ndarray, basic_values: Optional[np.ndarray] = None) -> np.ndarray:
+        """Values of the original variables: basic variables from the right-hand side (or `basic_values`), nonbasic ones at their bound."""
+        values = np.zeros(tableau.shape[1] - 1)
+        values[basis] = tableau[1:, -1] if basic_values is None else basic_values
+        return self.transform.restore(self.base + self.column_sign * values[:self.num_variables])
+
+    def boxed(self) -> np.ndarray:
+        return np.isfinite(self.transform.upper) & (self.transform.upper > 0)
+
+    def at_upper(self, basis: np.ndarray) -> np.ndarray:
+        """Boxed structural variables that are nonbasic at their upper bound."""
+        nonbasic = np.ones(self.num_variables, dtype=bool)
+        nonbasic[basis[basis < self.num_variables]] = False
+        return np.flatnonzero(nonbasic & self.boxed() & (self.column_sign < 0))
+
+    def move_to_upper(self, tableau: np.ndarray, basis: np.ndarray, at_upper: np.ndarray) -> None:
+        """Complements the given boxed nonbasic variables so they sit at their upper bound (used for warm starts)."""
+        target = np.zeros(self.num_variables, dtype=bool)
+        target[np.asarray(at_upper, dtype=int)] = True
+        target[basis[basis < self.num_variables]] = False
+        for column in np.flatnonzero(target & self.boxed() & (self.column_sign > 0)):
+            self.complement_column(tableau, column)
+
+    def flip_dual_infeasible(self, tableau: np.ndarray, basis: np.ndarray, tol: float = 1e-9) -> None:
+        """Moves every boxed nonbasic variable with a negative reduced cost to its other bound."""
+        nonbasic = np.ones(self.num_variables, dtype=bool)
+        nonbasic[basis[basis < self.num_variables]] = False
+        for column in np.flatnonzero(nonbasic & self.boxed() & (tableau[0, :self.num_variables] < -tol)):
+            self.complement_column(tableau, column)
@@ -0,0 +1,137 @@
+import numpy as np
+import scipy.sparse as sp
+from typing import Callable, List, Tuple
+from utils.setup_tableau import setup_tableau, starting_basis, tableau_variable_indices
+from utils.pivot import select_leaving_variable_dual, select_entering_variable_dual, pivot
+from utils.solution_extraction import extract_solution
+from utils.input_validation import validate_inputs
+from utils.event_printer import print_event
+from utils.history import TableauHistory, get_history_policy
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+def to_less_equal_form(
+    constraint_matrix: np.ndarray | sp.spmatrix,
+    rhs_values: np.ndarray,
+    senses: List[str]
+) -> Tuple[np.ndarray | sp.spmatrix, np.ndarray]:
+    """
+    Rewrites every constraint as '<=' so that the slack basis needs no artificial variables.
+
+    '>=' rows are negated and each '=' row is split into a '<=' row and a negated
+    '<=' row. Right-hand sides may become negative, which is what dual simplex
+    works off.
+    """
+    rows, signs = [], []
+    for i, sense in enumerate(senses):
+        if sense in ('<=', '='):
+            rows.append(i)
+            signs.append(1.0)
+        if sense in ('>=', '='):
+            rows.append(i)
+            signs.append(-1.0)
+    rows, signs = np.array(rows, dtype=int), np.array(signs)
+
+    if sp.issparse(constraint_matrix):
+        matrix = (sp.diags(signs) @ constraint_matrix.tocsr()[rows]).asformat(constraint_matrix.format)
+    else:
+        matrix = constraint_matrix[rows] * signs[:, None]
+    return matrix, np.asarray(rhs_values, dtype=float)[rows] * signs
+
+
+def dual_simplex(
+    objective_coeffs: np.ndarray,
+    constraint_matrix: np.ndarray | sp.spmatrix,
+    rhs_values: np.ndarray,
+    senses: List[str],
+    problem_type: str = 'max',
+    verbose: bool = True,
+    callback: Callable[[str, dict], None] | None = None,
+    history: str | TableauHistory = 'all'
+) -> Tuple[str, np.ndarray | None, float | None, TableauHistory]:
+    """
+    Solves a linear programming problem with the dual simplex method on the original tableau.
+
+    The tableau is built in '<=' form with a slack basis. While the objective row is
+    nonnegative (dual feasible), each iteration removes the most negative RHS: that
+    row leaves the basis and the dual ratio test picks the entering column so the
+    objective row stays nonnegative. The method stops when every RHS is nonnegative
+    (optimal) or a row with a negative RHS has no negative entry (infeasible).
+    Problems whose starting basis is not dual feasible are handed to tabular_simplex.
+
+    Args:
+        objective_coeffs (np.ndarray): Objective function coefficients.
+        constraint_matrix (np.ndarray | sp.spmatrix): Dense or CSR/CSC constraint coefficient matrix.
+        rhs_values (np.ndarray): Right-hand side values.
+        senses (List[str]): List of strings for each constraint ('<=', '>=', '=').
+        problem_type (str): 'max' for maximization, 'min' for minimization.
+        verbose (bool): Narrate every step with print_event.
+        callback (Callable[[str, dict], None] | None): Optional event subscriber.
+        history (str | TableauHistory): Which tableaux to keep, see utils.history.
+
+    Returns:
+        Tuple[str, np.ndarray | None, float | None, TableauHistory]: Status ('optimal' or
+        'infeasible'), the optimal solution, the optimal objective value and the tableau history.
+    """
+    logger.info("Starting dual simplex method")
+    tableau_history = get_history_policy(history)
+
+    subscribers = [subscriber for subscriber in (print_event if verbose else None, callback) if subscriber is not None]
+
+    def emit(event: str, **data) -> None:
+        for subscriber in subscribers:
+            subscriber(event, data)
+
+    validate_inputs(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type)
+    num_original_vars = constraint_matrix.shape[1]
+
+    transformed_constraint_matrix, transformed_rhs_values = to_less_equal_form(constraint_matrix, rhs_values, senses)
+    num_constraints = transformed_constraint_matrix.shape[0]
+    transformed_senses = ['<='] * num_constraints
+    tableau = setup_tableau(objective_coeffs, transformed_constraint_matrix, transformed_rhs_values, transformed_senses, problem_type)
+
+    if np.any(tableau[0, :-1] < 0):
+        # Without a dual feasible start the dual method has nothing to maintain
+        logger.info("Initial basis is not dual feasible, falling back to primal simplex")
+        from simplex import tabular_simplex
+        return tabular_simplex(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type,
+                               verbose=verbose, callback=callback, history=tableau_history)
+
+    basis = starting_basis(num_original_vars, transformed_senses)
+    variable_indices = tableau_variable_indices(num_original_vars, transformed_senses)
+
+    if subscribers:
+        emit('problem', objective_coeffs=objective_coeffs, constraint_matrix=constraint_matrix,
+             rhs_values=rhs_values, senses=senses, problem_type=problem_type)
+        emit('setup', num_constraints=num_constraints, num_original_vars=num_original_vars, objective_coeffs=objective_coeffs)
+
+    iteration = 0
+    logged_pivot = None
+    while True:
+        iteration += 1
+        if subscribers:
+            emit('iteration', iteration=iteration, tableau=tableau, senses=transformed_senses,
+                 basis=basis, variable_indices=variable_indices, num_original_vars=num_original_vars)
+        tableau_history.record(tableau, logged_pivot)
+
+        leaving_row = select_leaving_variable_dual(tableau)
+        if leaving_row is None:
+            optimal_solution, optimal_objective_value = extract_solution(tableau, num_original_vars, num_constraints, problem_type, basis)
+            logger.info("Optimal solution found: %s, Objective value: %s", optimal_solution, optimal_objective_value)
+            if subscribers:
+                emit('optimal', solution=optimal_solution, objective_value=optimal_objective_value)
+            return 'optimal', optimal_solution, optimal_objective_value, tableau_history
+
+        entering_col_index = select_entering_variable_dual(tableau, leaving_row)
+        if entering_col_index is None:
+            if subscribers:
+                emit('infeasible', stage='dual')
+            return 'infeasible', None, None, tableau_history
+
+        logged_pivot = (entering_col_index, leaving_row, tableau[leaving_row, entering_col_index])
+        tableau = pivot(tableau, entering_col_index, leaving_row)
+        basis[leaving_row - 1] = entering_col_index
+        if subscribers:
+            emit('dual_pivot', tableau=tableau, leaving_row=leaving_row, entering_col_index=entering_col_index)
@@ -0,0 +1,192 @@
+import numpy as np
+import logging
+from utils.latex_printer import print_latex_problem
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+def print_event(event: str, data: dict) -> None:
+    """
+    Prints the step-by-step narration for a single solver event.
+
+    This is the subscriber tabular_simplex installs when verbose=True. All string
+    formatting of tableaus and ratios happens here, so a solve without
+    subscribers never pays for it.
+
+    Args:
+        event (str): Name of the event emitted by the solver.
+        data (dict): Event payload. Arrays are live views of the solver state and
+            must not be modified.
+    """
+    if event == 'problem':
+        print("\nProblem in LaTeX format:")
+        print_latex_problem(data['objective_coeffs'], data['constraint_matrix'], data['rhs_values'], data['senses'], data['problem_type'])
+
+    elif event == 'setup':
+        print("\nInitial Problem Setup:")
+        print(f"Number of constraints (m): {data['num_constraints']}")
+        print(f"Number of variables (n): {data['num_original_vars']}")
+        print(f"Objective function coefficients (c): {data['objective_coeffs']}")
+
+    elif event == 'iteration':
+        tableau = data['tableau']
+        senses = data['senses']
+        print(f"\n{'='*50}")
+        print(f"Iteration {data['iteration']}:")
+        print("Current tableau:")
+        print(tableau)
+
+        print("\n[Step] Displaying current basic variables and RHS values:")
+        basis = data.get('basis')
+        for i in range(1, tableau.shape[0]):
+            # Determine if the variable is artificial, slack, or original
+            if basis is not None:
+                # Label the variable that is actually basic in the row, from the engine's basis array
+                variable = data['variable_indices'][basis[i - 1]]
+                num_original_vars = data['num_original_vars']
+                if variable < num_original_vars:
+                    var_type = "Original"
+                elif variable < num_original_vars + len(senses):
+                    var_type = "Slack" if senses[variable - num_original_vars] == '<=' else "Surplus"
+                else:
+                    var_type = "Artificial"
+            elif i - 1 < len(senses):
+                if senses[i-1] == '<=':
+                    var_type = "Slack"
+                elif senses[i-1] == '>=' or senses[i-1] == '=':
+                    var_type = "Artificial"
+                else:
+                    var_type = "Original"
+            else:
+                var_type = "Unknown"
+            print(f"Row {i} ({var_type} Basis): {tableau[i, :-1]} | RHS: {tableau[i, -1]:.4f}")
+
+    elif event == 'optimal':
+        print("All coefficients in the objective row are now nonnegative.")
+        print("Explanation: No further improvement is possible so the current solution is optimal.")
+        print("\nOptimal solution found!")
+        print("Solution:", np.round(data['solution'], 3))
+        print("Objective value:", round(data['objective_value'], 3))
+
+    elif event == 'entering':
+        tableau = data['tableau']
+        entering_col_index = data['entering_col_index']
+        print("\n[Step] Checking objective row for negative coefficients:")
+        print(f"Objective Row (Z_j - C_j): {tableau[0, :-1]}")
+        print(f"\nEntering variable chosen: x_{entering_col_index+1} with coefficient {tableau[0, entering_col_index]:.4f}")
+        if data.get('pricing', 'dantzig') == 'dantzig':
+            print("This is the most negative coefficient, indicating the largest potential increase in the objective function.")
+        else:
+            print(f"It was chosen by the {data['pricing']} pricing rule among the columns with a negative coefficient.")
+
+    elif event == 'ratios':
+        ratios = data['ratios']
+        print("\n[Step] Computing ratios for leaving variable:")
+        for i, ratio in enumerate(ratios, start=1):
+            print(f"Row {i} ratio: {ratio:.4f}")
+        print("Ratios are calculated as RHS / corresponding element in the entering variable's column.")
+        print("The smallest non-negative ratio determines the leaving variable.")
+        print("\nRatios Tableau:")
+        print(ratios.reshape(-1, 1))
+
+    elif event == 'leaving':
+        print(f"\nLeaving variable chosen: row {data['leaving_row']} with pivot element {data['pivot_element']:.4f}")
+        print("This row will be replaced by the entering variable in the next iteration.")
+
+    elif event == 'pivot':
+        tableau = data['tableau']
+        print("\n[Step] After pivot operation, new tableau:")
+        print(tableau)
+        print("\n[Step] Normalized pivot row details:")
+        print(tableau[data['leaving_row'], :])
+        print("The pivot row has been normalized, and other rows have been adjusted to make the entering variable's column a unit vector.")
+
+    elif event == 'bound_flip':
+        print(f"\n[Step] Bound flip: x_{data['entering_col_index']+1} reaches its other bound before any basic variable blocks.")
+        print("The variable moves to that bound without a basis change; its column is complemented:")
+        print(data['tableau'])
+
+    elif event == 'refactor':
+        print(f"\n[Step] Refactorization: the {data['dtype']} tableau is rebuilt in float64 from the original data")
+        print("This removes the rounding error accumulated by the reduced-precision pivots:")
+        print(data['tableau'])
+
+    elif event == 'dual_pivot':
+        tableau = data['tableau']
+        print(f"\n[Step] Dual simplex pivot: row {data['leaving_row']} has a negative RHS and leaves the basis.")
+        print(f"Entering variable chosen by the dual ratio test: x_{data['entering_col_index']+1}")
+        print("The objective row stays nonnegative while the negative RHS is removed.")
+        print(tableau)
+
+    elif event == 'phase_two':
+        print("\n[Step] Phase I complete: all artificial variables are zero.")
+        print("Artificial columns are dropped and the original objective is restored:")
+        print(data['tableau'])
+
+    elif event == 'presolve':
+        print("\n[Step] Presolve:")
+        print(f"Constraints: {data['num_constraints']} -> {data['reduced_constraints']}, "
+              f"variables: {data['num_original_vars']} -> {data['reduced_vars']}")
+        if data['status'] == 'reduced':
+            print("The reduced problem is solved next; its solution is mapped back afterwards.")
+
+    elif event == 'postsolve':
+        print("\n[Step] Postsolve: solution in terms of the original variables")
+        print(f"Solution: {np.round(data['solution'], 3)}")
+        print(f"Objective value: {data['objective_value']:.3f}")
+
+    elif event == 'scaling':
+        scaling = data['scaling']
+        print(f"\n[Step] Scaling rows and columns ({scaling.method}, {scaling.passes} passes):")
+        print(f"Ratio of largest to smallest coefficient: {scaling.ratio_before:.3g} -> {scaling.ratio_after:.3g}")
+        print(f"Row scale factors: {scaling.row_scale}")
+        print(f"Column scale factors: {scaling.col_scale}")
+
+    elif event == 'unscale':
+        print("\n[Step] Unscaling: solution in terms of the original variables")
+        print(f"Solution: {np.round(data['solution'], 3)}")
+        print(f"Objective value: {data['objective_value']:.3f}")
+
+    elif event == 'exact':
+        certificate = data['certificate']
+        print("\n[Step] Exact verification in rational arithmetic")
+        if certificate.verified:
+            print("The floating-point basis is exactly optimal.")
+        else:
+            print(f"The floating-point basis was not exactly optimal; {certificate.pivots} exact pivots were needed.")
+        if certificate.status == 'optimal':
+            print(f"Exact solution: [{', '.join(str(value) for value in certificate.solution)}]")
+            print(f"Exact objective value: {certificate.objective_value}")
+
+    elif event == 'sensitivity':
+        report = data['report']
+        print("\n[Step] Sensitivity analysis from the final basis")
+        print("Constraint | Dual value | Slack | RHS range")
+        for i, (dual, slack, (low, high)) in enumerate(zip(report.duals, report.slacks, report.rhs_ranges), start=1):
+            print(f"{i:>10} | {dual:>10.4f} | {slack:>5.4g} | [{low:.4g}, {high:.4g}]")
+        print("Variable | Reduced cost | Objective coefficient range")
+        for j, (reduced_cost, (low, high)) in enumerate(zip(report.reduced_costs, report.objective_ranges), start=1):
+            print(f"{'x_' + str(j):>8} | {reduced_cost:>12.4f} | [{low:.4g}, {high:.4g}]")
+
+    elif event == 'unbounded':
+        print("\nProblem is unbounded!")
+        if data.get('stage') == 'presolve':
+            print("Presolve found a variable that improves the objective without limit.")
+        else:
+            print("No valid leaving variable found (all ratios are infinite). The problem is unbounded!")
+
+    elif event == 'infeasible':
+        print("\nProblem is infeasible!")
+        if data.get('stage') == 'initial':
+            print("The problem is infeasible at the initial tableau.")
+        elif data.get('stage') == 'phase_one':
+            print("Phase I could not drive the artificial variables to zero.")
+        elif data.get('stage') == 'presolve':
+            print("Presolve found constraints or bounds that cannot all be satisfied.")
+        elif data.get('stage') == 'dual':
+            print("A row with a negative RHS has no negative entry, so no dual simplex pivot can fix it.")
+        else:
+            print("After checking, there is a violation in the constraints (infeasible basic variable)!")
+
+    else:
+        logger.debug("No narration for event %s", event)
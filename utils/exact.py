@@ -0,0 +1,367 @@
+import numpy as np
+import scipy.sparse as sp
+from dataclasses import dataclass
+from fractions import Fraction
+from math import lcm
+from typing import List, Optional, Tuple
+from utils.basis import Basis
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+@dataclass
+class ExactCertificate:
+    """
+    Result of exact_solve: the optimal basis and solution in rational arithmetic.
+
+    `verified` is True when the given float basis was already optimal, so no exact
+    pivot was needed; `pivots` counts the exact pivots made after installing it.
+    Duals are per original constraint, in the sense of the problem (for 'max',
+    nonnegative on binding '<=' rows).
+    """
+    status: str  # 'optimal', 'infeasible' or 'unbounded'
+    solution: Optional[List[Fraction]]
+    objective_value: Optional[Fraction]
+    duals: Optional[List[Fraction]]
+    basis: Optional[Basis]  # The exact optimal basis in the solvers' layout, if it has an equivalent there
+    verified: bool
+    pivots: int
+
+
+def _to_integers(values: List[Fraction]) -> Tuple[List[int], int]:
+    # Scales a row of exact values to integers; returns the integers and the scale factor
+    scale = lcm(*(value.denominator for value in values)) if values else 1
+    return [int(value * scale) for value in values], scale
+
+
+class _IntegerTableau:
+    """
+    Integer-preserving (Edmonds) Gauss-Jordan tableau.
+
+    The true tableau is T / d with integer T: a pivot on (r, q) keeps row r and
+    replaces every other row i by (T_rq T_ij - T_iq T_rj) / d, which divides
+    exactly, after which d = T_rq. Entries stay integer minors of the input, so
+    no fractions or gcd computations are needed while pivoting.
+    """
+
+    def __init__(self, rows: List[List[int]]):
+        self.rows = [list(row) for row in rows]  # Row 0 is the objective row, the last column the right-hand side
+        self.denominator = 1
+        self.basis: List[Optional[int]] = [None] * (len(rows) - 1)
+
+    @property
+    def sign(self) -> int:
+        return 1 if self.denominator > 0 else -1
+
+    def pivot(self, row: int, column: int) -> None:
+        pivot_row = self.rows[row]
+        pivot_element = pivot_row[column]
+        denominator = self.denominator
+        for i, current in enumerate(self.rows):
+            if i == row:
+                continue
+            factor = current[column]
+            if factor == 0:
+                self.rows[i] = [(pivot_element * value) // denominator for value in current]
+            else:
+                self.rows[i] = [(pivot_element * value - factor * pivot_value) // denominator
+                                for value, pivot_value in zip(current, pivot_row)]
+        self.denominator = pivot_element
+        self.basis[row - 1] = column
+
+    def value(self, row: int, column: int = -1) -> Fraction:
+        return Fraction(self.rows[row][column], self.denominator)
+
+    def set_objective(self, costs: List[int]) -> None:
+        # Prices a new objective row out against the basis: d c - sum_r c_B(r) T_r, over the common denominator d
+        row = [self.denominator * cost for cost in costs] + [0]
+        for r, column in enumerate(self.basis, start=1):
+            if column is not None and costs[column]:
+                row = [value - costs[column] * basic for value, basic in zip(row, self.rows[r])]
+        self.rows[0] = row
+
+
+def _primal(tableau: _IntegerTableau, enterable: List[bool], fixed_zero: List[bool], max_pivots: int) -> Tuple[str, int]:
+    """Primal simplex with Bland's rule from a primal feasible basis. Variables in fixed_zero may only leave."""
+    pivots = 0
+    while pivots < max_pivots:
+        sign, objective, basic = tableau.sign, tableau.rows[0], set(tableau.basis)
+        entering = next((j for j in range(len(objective) - 1)
+                         if enterable[j] and j not in basic and objective[j] * sign < 0), None)
+        if entering is None:
+            return 'optimal', pivots
+        best, best_ratio = None, None
+        for r in range(1, len(tableau.rows)):
+            entry = tableau.rows[r][entering] * sign
+            leaving = tableau.basis[r - 1]
+            if fixed_zero[leaving] and entry != 0:
+                ratio = Fraction(0)
+            elif entry > 0:
+                ratio = Fraction(tableau.rows[r][-1] * sign, entry)
+            else:
+                continue
+            # Bland: smallest ratio, ties to the lowest basic variable
+            if best is None or ratio < best_ratio or (ratio == best_ratio and leaving < tableau.basis[best - 1]):
+                best, best_ratio = r, ratio
+        if best is None:
+            return 'unbounded', pivots
+        tableau.pivot(best, entering)
+        pivots += 1
+    raise RuntimeError("Exact primal simplex exceeded its pivot limit")
+
+
+def _dual(tableau: _IntegerTableau, enterable: List[bool], max_pivots: int) -> Tuple[str, int]:
+    """Dual simplex with Bland's rule from a dual feasible basis."""
+    pivots = 0
+    while pivots < max_pivots:
+        sign = tableau.sign
+        negative = [r for r in range(1, len(tableau.rows)) if tableau.rows[r][-1] * sign < 0]
+        if not negative:
+            return 'optimal', pivots
+        leaving = min(negative, key=lambda r: tableau.basis[r - 1])
+        row, objective, basic = tableau.rows[leaving], tableau.rows[0], set(tableau.basis)
+        best, best_ratio = None, None
+        for j in range(len(row) - 1):
+            if not enterable[j] or j in basic or row[j] * sign >= 0:
+                continue
+            ratio = Fraction(objective[j] * sign, -row[j] * sign)
+            if best is None or ratio < best_ratio:
+                best, best_ratio = j, ratio
+        if best is None:
+            return 'infeasible', pivots
+        tableau.pivot(leaving, best)
+        pivots += 1
+    raise RuntimeError("Exact dual simplex exceeded its pivot limit")
+
+
+def exact_solve(
+    objective_coeffs: np.ndarray,
+    constraint_matrix: np.ndarray | sp.spmatrix,
+    rhs_values: np.ndarray,
+    senses: List[str],
+    problem_type: str = 'max',
+    initial_basis: Optional[Basis] = None,
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None,
+    max_pivots: int = 100000
+) -> ExactCertificate:
+    """
+    Certifies (or finds) the optimal basis of a problem in exact rational arithmetic.
+
+    The float data is taken as exact binary fractions. The basis from a float
+    solve is installed with one integer-preserving pivot per row and checked for
+    primal and dual feasibility without tolerances. If it is optimal, nothing else
+    is done. If it is only primal (dual) feasible, exact primal (dual) simplex with
+    Bland's rule continues from it, which usually takes a few pivots. Only a basis
+    that is neither, or singular, falls back to a full exact two-phase solve.
+
+    Bounds are expanded into the standard form: finite lower bounds shift the
+    variable, upper-bound-only variables are mirrored, free variables are split and
+    finite upper bounds of boxed variables become rows. The Basis and its at_upper
+    entries are mapped accordingly.
+
+    Args:
+        objective_coeffs (np.ndarray): Objective function coefficients.
+        constraint_matrix (np.ndarray | sp.spmatrix): Dense or CSR/CSC constraint coefficient matrix.
+        rhs_values (np.ndarray): Right-hand side values.
+        senses (List[str]): List of strings for each constraint ('<=', '>=', '=').
+        problem_type (str): 'max' for maximization, 'min' for minimization.
+        initial_basis (Optional[Basis]): Basis from a float solve; None solves from scratch.
+        lb (Optional[np.ndarray]): Variable lower bounds (-inf allowed), default 0.
+        ub (Optional[np.ndarray]): Variable upper bounds (inf allowed), default inf.
+        max_pivots (int): Safety limit on exact pivots per phase.
+
+    Returns:
+        ExactCertificate: The exact status, solution, objective value, duals and basis.
+    """
+    logger.info("Starting exact verification")
+    num_constraints, num_original_vars = constraint_matrix.shape
+    dense = constraint_matrix.toarray() if sp.issparse(constraint_matrix) else np.asarray(constraint_matrix)
+    lb = np.zeros(num_original_vars) if lb is None else np.asarray(lb, dtype=float)
+    ub = np.full(num_original_vars, np.inf) if ub is None else np.asarray(ub, dtype=float)
+
+    # Standard form columns: (original variable, sign) with x_j = offset_j + sum of sign * column
+    columns: List[Tuple[int, int]] = []
+    column_of = {}
+    offsets = [Fraction(0)] * num_original_vars
+    boxed, split_columns = [], set()
+    for j in range(num_original_vars):
+        column_of[j] = len(columns)
+        if np.isfinite(lb[j]):
+            offsets[j] = Fraction(float(lb[j]))
+            columns.append((j, 1))
+            if np.isfinite(ub[j]):
+                boxed.append(j)
+        elif np.isfinite(ub[j]):
+            offsets[j] = Fraction(float(ub[j]))
+            columns.append((j, -1))
+        else:
+            split_columns.add(len(columns))
+            columns.append((j, 1))
+            columns.append((j, -1))
+
+    exact_matrix = [[Fraction(float(value)) for value in row] for row in dense]
+    rows, row_rhs, row_senses = [], [], []
+    for i in range(num_constraints):
+        shifted = Fraction(float(rhs_values[i])) - sum(a * offset for a, offset in zip(exact_matrix[i], offsets) if a and offset)
+        rows.append([exact_matrix[i][j] * sign for j, sign in columns])
+        row_rhs.append(shifted)
+        row_senses.append(senses[i])
+    for j in boxed:
+        row = [Fraction(0)] * len(columns)
+        row[column_of[j]] = Fraction(1)
+        rows.append(row)
+        row_rhs.append(Fraction(float(ub[j])) - offsets[j])
+        row_senses.append('<=')
+
+    n, m = len(columns), len(rows)
+    # Tableau columns: structural [0, n), one logical per row [n, n+m) (zero for '='), one artificial per row [n+m, n+2m)
+    # Artificials carry the sign of their right-hand side, so the slack/artificial basis is feasible
+    logical_signs = [1 if sense == '<=' else -1 if sense == '>=' else 0 for sense in row_senses]
+    artificial_signs = [1 if rhs >= 0 else -1 for rhs in row_rhs]
+    integer_rows = [[0] * (n + 2 * m + 1)]
+    for i in range(m):
+        exact_row = rows[i] + [Fraction(logical_signs[k] if k == i else 0) for k in range(m)] \
+            + [Fraction(artificial_signs[k] if k == i else 0) for k in range(m)] + [row_rhs[i]]
+        integer_row, _ = _to_integers(exact_row)
+        integer_rows.append(integer_row)
+
+    costs = [Fraction(float(objective_coeffs[j])) * sign * (-1 if problem_type == 'max' else 1) for j, sign in columns]
+    phase_two_costs, cost_scale = _to_integers(costs + [Fraction(0)] * (2 * m))
+    enterable = [True] * n + [sign != 0 for sign in logical_signs] + [False] * m
+    is_artificial = [False] * (n + m) + [True] * m
+
+    def installed_basis() -> Optional[List[int]]:
+        # The float basis in standard form columns, or None if it has no exact counterpart
+        if initial_basis is None or not initial_basis.matches(num_original_vars, num_constraints):
+            return None
+        at_upper = set() if initial_basis.at_upper is None else {int(j) for j in initial_basis.at_upper}
+        basic = []
+        for variable in initial_basis.basic_variables:
+            variable = int(variable)
+            if variable < num_original_vars:
+                if variable not in at_upper:
+                    basic.append(column_of[variable])
+            elif variable < num_original_vars + num_constraints:
+                basic.append(n + variable - num_original_vars)
+            else:
+                basic.append(n + m + variable - num_original_vars - num_constraints)
+        basic_set = {int(variable) for variable in initial_basis.basic_variables}
+        for k, j in enumerate(boxed):
+            if j in at_upper and j not in basic_set:
+                basic.append(column_of[j])
+            else:
+                basic.append(n + num_constraints + k)
+        if len(set(basic)) != m or any(column >= n + m and column - n - m >= num_constraints for column in basic):
+            return None
+        return basic
+
+    tableau = _IntegerTableau(integer_rows)
+    basic_columns = installed_basis()
+    pivots = 0
+    verified = False
+    status = None
+    if basic_columns is not None:
+        for column in basic_columns:
+            row = next((r for r in range(1, m + 1) if tableau.basis[r - 1] is None and tableau.rows[r][column] != 0), None)
+            if row is None:
+                logger.warning("Exact verification: the float basis is singular, solving from scratch")
+                basic_columns = None
+                break
+            tableau.pivot(row, column)
+    if basic_columns is not None:
+        # A basic free variable enters the split as x+; if its value is negative, x- = -x+ takes its place
+        for r, column in enumerate(tableau.basis, start=1):
+            if column in split_columns and tableau.rows[r][-1] * tableau.sign < 0:
+                tableau.pivot(r, column + 1)
+        tableau.set_objective(phase_two_costs)
+        sign = tableau.sign
+        primal_feasible = all(tableau.rows[r][-1] * sign >= 0 and not (is_artificial[tableau.basis[r - 1]] and tableau.rows[r][-1] != 0)
+                              for r in range(1, m + 1))
+        dual_feasible = all(tableau.rows[0][j] * sign >= 0 for j in range(n + 2 * m) if enterable[j] and j not in tableau.basis)
+        if primal_feasible and dual_feasible:
+            verified, status = True, 'optimal'
+            logger.info("Exact verification: the float basis is optimal")
+        elif primal_feasible:
+            logger.info("Exact verification: the float basis is primal feasible, continuing with exact primal simplex")
+            status, pivots = _primal(tableau, enterable, is_artificial, max_pivots)
+        elif dual_feasible and not any(is_artificial[column] for column in tableau.basis):
+            logger.info("Exact verification: the float basis is dual feasible, continuing with exact dual simplex")
+            status, pivots = _dual(tableau, enterable, max_pivots)
+        else:
+            logger.warning("Exact verification: the float basis is neither primal nor dual feasible, solving from scratch")
+
+    if status is None:
+        # Full exact two-phase solve from the slack/artificial basis
+        tableau = _IntegerTableau([list(row) for row in integer_rows])
+        for i in range(m):
+            column = n + i if logical_signs[i] * artificial_signs[i] > 0 else n + m + i
+            tableau.pivot(i + 1, column)
+        tableau.set_objective([0] * (n + m) + [1] * m)
+        phase_one_enterable = [True] * n + [sign != 0 for sign in logical_signs] + [True] * m
+        _, pivots = _primal(tableau, phase_one_enterable, [False] * (n + 2 * m), max_pivots)
+        if tableau.value(0) != 0:
+            logger.warning("Exact solve: problem is infeasible")
+            return ExactCertificate('infeasible', None, None, None, None, False, pivots)
+        tableau.set_objective(phase_two_costs)
+        status, phase_two_pivots = _primal(tableau, enterable, is_artificial, max_pivots)
+        pivots += phase_two_pivots
+
+    if status != 'optimal':
+        logger.warning("Exact verification: problem is %s", status)
+        return ExactCertificate(status, None, None, None, None, verified, pivots)
+
+    # Solution in the original variables
+    values = [Fraction(0)] * n
+    for r, column in enumerate(tableau.basis, start=1):
+        if column < n:
+            values[column] = tableau.value(r)
+    solution = list(offsets)
+    for (j, sign), value in zip(columns, values):
+        solution[j] += sign * value
+    objective_value = sum(Fraction(float(objective_coeffs[j])) * solution[j] for j in range(num_original_vars))
+
+    # Duals from the reduced costs of the artificial columns (+-e_i), which are -+y_i; row scaling does not change them
+    duals = []
+    for i in range(num_constraints):
+        reduced_cost = Fraction(tableau.rows[0][n + m + i], tableau.denominator * cost_scale)
+        dual = -artificial_signs[i] * reduced_cost
+        duals.append(-dual if problem_type == 'max' else dual)
+
+    logger.info("Exact solution found after %d exact pivots (verified: %s)", pivots, verified)
+    return ExactCertificate('optimal', solution, objective_value, duals,
+                            _solver_basis(tableau.basis, columns, column_of, boxed, n, num_original_vars, num_constraints, lb, ub),
+                            verified, pivots)
+
+
+def _solver_basis(
+    basic_columns: List[int],
+    columns: List[Tuple[int, int]],
+    column_of: dict,
+    boxed: List[int],
+    n: int,
+    num_original_vars: int,
+    num_constraints: int,
+    lb: np.ndarray,
+    ub: np.ndarray
+) -> Optional[Basis]:
+    # Maps a standard form basis back to the solvers' layout (with at_upper for boxed variables)
+    m = num_constraints + len(boxed)
+    basic = set(basic_columns)
+    basic_variables, at_upper = [], []
+    for j in range(num_original_vars):
+        if any(column_of[j] + offset in basic for offset in ((0, 1) if not np.isfinite(lb[j]) and not np.isfinite(ub[j]) else (0,))):
+            if j in boxed and n + num_constraints + boxed.index(j) not in basic:
+                at_upper.append(j)
+            else:
+                basic_variables.append(j)
+    for column in basic_columns:
+        if n <= column < n + num_constraints:
+            basic_variables.append(num_original_vars + column - n)
+        elif n + m <= column < n + m + num_constraints:
+            basic_variables.append(num_original_vars + num_constraints + column - n - m)
+    if len(basic_variables) != num_constraints:
+        return None
+    return Basis(np.array(basic_variables, dtype=int), num_original_vars, num_constraints,
+                 np.array(at_upper, dtype=int) if boxed else None)
@@ -0,0 +1,245 @@
+import numpy as np
+from bisect import bisect_right
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple, Type
+from utils.pivot import pivot
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+Pivot = Tuple[int, int, float]  # Entering column, leaving row and pivot element
+
+
+class TableauHistory:
+    """
+    Policy for which iteration tableaux a solve keeps.
+
+    The solver calls record() with the tableau at the start of every iteration and,
+    when that tableau is exactly one pivot away from the previous one, the pivot
+    that produced it. The history is a read-only sequence of the tableaux it kept,
+    oldest first; iterations holds the (0-based) iteration each of them belongs to.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        """Forgets everything recorded, so one instance can be reused across solves."""
+        self.num_iterations = 0
+
+    def record(self, tableau: np.ndarray, pivot: Optional[Pivot] = None) -> None:
+        self.num_iterations += 1
+
+    @property
+    def iterations(self) -> List[int]:
+        return []
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the kept tableaux and pivots."""
+        return 0
+
+    def __len__(self) -> int:
+        return len(self.iterations)
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        raise IndexError("history index out of range")
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (list, TableauHistory)):
+            return NotImplemented
+        return len(self) == len(other) and all(np.array_equal(mine, theirs) for mine, theirs in zip(self, other))
+
+
+class FullHistory(TableauHistory):
+    """Keeps a copy of every tableau: O(iterations * m * n) memory."""
+
+    def clear(self) -> None:
+        super().clear()
+        self.tableaux: List[np.ndarray] = []
+
+    def record(self, tableau: np.ndarray, pivot: Optional[Pivot] = None) -> None:
+        super().record(tableau, pivot)
+        self.tableaux.append(tableau.copy())
+
+    @property
+    def iterations(self) -> List[int]:
+        return list(range(len(self.tableaux)))
+
+    @property
+    def nbytes(self) -> int:
+        return sum(tableau.nbytes for tableau in self.tableaux)
+
+    def __len__(self) -> int:
+        return len(self.tableaux)
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self.tableaux[index]
+
+
+class NoHistory(TableauHistory):
+    """Keeps nothing."""
+
+
+class LastKHistory(TableauHistory):
+    """Keeps the tableaux of the last k iterations."""
+
+    def __init__(self, k: int = 1):
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+        self.k = k
+        super().__init__()
+
+    def clear(self) -> None:
+        super().clear()
+        self.kept: deque = deque(maxlen=self.k)
+
+    def record(self, tableau: np.ndarray, pivot: Optional[Pivot] = None) -> None:
+        self.kept.append((self.num_iterations, tableau.copy()))
+        super().record(tableau, pivot)
+
+    @property
+    def iterations(self) -> List[int]:
+        return [iteration for iteration, _ in self.kept]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(tableau.nbytes for _, tableau in self.kept)
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self.kept[index][1]
+
+
+class EveryKHistory(TableauHistory):
+    """Keeps every k-th tableau (iterations 0, k, 2k, ...) and the latest one."""
+
+    def __init__(self, k: int = 10):
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+        self.k = k
+        super().__init__()
+
+    def clear(self) -> None:
+        super().clear()
+        self.kept: List[Tuple[int, np.ndarray]] = []
+        self.latest: Optional[Tuple[int, np.ndarray]] = None
+
+    def record(self, tableau: np.ndarray, pivot: Optional[Pivot] = None) -> None:
+        if self.num_iterations % self.k == 0:
+            self.kept.append((self.num_iterations, tableau.copy()))
+            self.latest = None
+        else:
+            self.latest = (self.num_iterations, tableau.copy())
+        super().record(tableau, pivot)
+
+    def _entries(self) -> List[Tuple[int, np.ndarray]]:
+        return self.kept + ([self.latest] if self.latest is not None else [])
+
+    @property
+    def iterations(self) -> List[int]:
+        return [iteration for iteration, _ in self._entries()]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(tableau.nbytes for _, tableau in self._entries())
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self._entries()[index][1]
+
+
+class PivotLog(TableauHistory):
+    """
+    Keeps only (entering column, leaving row, pivot element) per iteration and rebuilds any tableau on demand.
+
+    A full snapshot (checkpoint) is stored for the first tableau, for every tableau
+    that is not one plain pivot away from the previous one (phase changes, bound
+    flips, refactorizations, perturbations) and every checkpoint_interval iterations
+    to bound the replay cost. Tableau i is rebuilt by copying the last checkpoint
+    before it and replaying the pivots in between, which reproduces it bit for bit.
+    Memory is O(iterations + checkpoints * m * n). The last rebuilt tableau is cached,
+    so reading the history in order costs one pivot per tableau. A finished log can be
+    read from several threads at once (the webapp's solution cache shares it between
+    sessions): each read takes the cached tableau once, and it is never modified once stored.
+    """
+
+    def __init__(self, checkpoint_interval: Optional[int] = 100):
+        if checkpoint_interval is not None and checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval must be at least 1 or None.")
+        self.checkpoint_interval = checkpoint_interval
+        super().__init__()
+
+    def clear(self) -> None:
+        super().clear()
+        self.pivots: List[Optional[Pivot]] = []  # None where a checkpoint was stored
+        self.checkpoints: Dict[int, np.ndarray] = {}
+        self.checkpoint_iterations: List[int] = []
+        self._cursor: Optional[Tuple[int, np.ndarray]] = None
+
+    def record(self, tableau: np.ndarray, pivot: Optional[Pivot] = None) -> None:
+        iteration = self.num_iterations
+        since_checkpoint = iteration - self.checkpoint_iterations[-1] if self.checkpoint_iterations else None
+        if pivot is None or since_checkpoint is None or (
+                self.checkpoint_interval is not None and since_checkpoint >= self.checkpoint_interval):
+            self.checkpoints[iteration] = tableau.copy()
+            self.checkpoint_iterations.append(iteration)
+            self.pivots.append(None)
+        else:
+            self.pivots.append((int(pivot[0]), int(pivot[1]), float(pivot[2])))
+        super().record(tableau, pivot)
+
+    @property
+    def iterations(self) -> List[int]:
+        return list(range(self.num_iterations))
+
+    @property
+    def nbytes(self) -> int:
+        # A logged pivot is two integers and a float
+        return sum(tableau.nbytes for tableau in self.checkpoints.values()) + 24 * len(self.pivots)
+
+    def __len__(self) -> int:
+        return self.num_iterations
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        if index < 0:
+            index += self.num_iterations
+        if not 0 <= index < self.num_iterations:
+            raise IndexError("history index out of range")
+        start = self.checkpoint_iterations[bisect_right(self.checkpoint_iterations, index) - 1]
+        cursor = self._cursor  # Read once: another thread may replace it meanwhile
+        if cursor is not None and start <= cursor[0] <= index:
+            position, tableau = cursor[0], cursor[1].copy()
+        else:
+            position, tableau = start, self.checkpoints[start].copy()
+        for entering_col_index, leaving_row, _ in self.pivots[position + 1:index + 1]:
+            tableau = pivot(tableau, entering_col_index, leaving_row)
+        self._cursor = (index, tableau)
+        return tableau.copy()
+
+
+HISTORY_POLICIES: Dict[str, Type[TableauHistory]] = {
+    'all': FullHistory,
+    'none': NoHistory,
+    'last': LastKHistory,
+    'every': EveryKHistory,
+    'pivots': PivotLog,
+}
+
+
+def get_history_policy(history: str | TableauHistory) -> TableauHistory:
+    """
+    Returns an empty history for a policy name or clears and passes a history object through.
+
+    Raises:
+        ValueError: If the name is not one of HISTORY_POLICIES.
+    """
+    if not isinstance(history, str):
+        history.clear()
+        return history
+    if history not in HISTORY_POLICIES:
+        raise ValueError(f"History must be one of {sorted(HISTORY_POLICIES)} or a TableauHistory instance.")
+    return HISTORY_POLICIES[history]()
@@ -1,4 +1,5 @@
 import numpy as np
+import scipy.sparse as sp
 from typing import List, Union
 import logging
 
@@ -10,7 +11,9 @@ def validate_inputs(
     constraint_matrix: np.ndarray,
     rhs_values: np.ndarray,
     senses: List[str],
-    problem_type: str = 'max'
+    problem_type: str = 'max',
+    lb: np.ndarray | None = None,
+    ub: np.ndarray | None = None
 ) -> None:
     logger.info("Validating inputs")
     
@@ -19,10 +22,14 @@ def validate_inputs(
         logger.error("Objective coefficients must be a 1D numpy array.")
         raise ValueError("Objective coefficients must be a 1D numpy array.")
     
-    # Check if the constraint matrix is a 2D numpy array
-    if not isinstance(constraint_matrix, np.ndarray) or constraint_matrix.ndim != 2:
-        logger.error("Constraint matrix must be a 2D numpy array.")
-        raise ValueError("Constraint matrix must be a 2D numpy array.")
+    # Check if the constraint matrix is a 2D numpy array or a scipy.sparse CSR/CSC matrix
+    if sp.issparse(constraint_matrix):
+        if constraint_matrix.format not in ('csr', 'csc'):
+            logger.error("Sparse constraint matrices must be in CSR or CSC format.")
+            raise ValueError("Sparse constraint matrices must be in CSR or CSC format.")
+    elif not isinstance(constraint_matrix, np.ndarray) or constraint_matrix.ndim != 2:
+        logger.error("Constraint matrix must be a 2D numpy array or a scipy.sparse CSR/CSC matrix.")
+        raise ValueError("Constraint matrix must be a 2D numpy array or a scipy.sparse CSR/CSC matrix.")
     
     # Check if the right-hand side values are a 1D numpy array
     if not isinstance(rhs_values, np.ndarray) or rhs_values.ndim != 1:
@@ -55,4 +62,15 @@ def validate_inputs(
         logger.error("The number of senses must be equal to the number of constraints.")
         raise ValueError("The number of senses must be equal to the number of constraints.")
     
+    # Check the variable bounds, if any
+    for name, bound in (('Lower', lb), ('Upper', ub)):
+        if bound is not None and (not isinstance(bound, np.ndarray) or bound.shape != (num_variables,) or np.any(np.isnan(bound))):
+            logger.error(f"{name} bounds must be a 1D numpy array with one entry per variable.")
+            raise ValueError(f"{name} bounds must be a 1D numpy array with one entry per variable.")
+    lower = np.zeros(num_variables) if lb is None else lb
+    upper = np.full(num_variables, np.inf) if ub is None else ub
+    if np.any(lower > upper) or np.any(lower == np.inf) or np.any(upper == -np.inf):
+        logger.error("Lower bounds must not exceed upper bounds, and neither may be infinite in the wrong direction.")
+        raise ValueError("Lower bounds must not exceed upper bounds, and neither may be infinite in the wrong direction.")
+    
     logger.info("Inputs validated successfully.")
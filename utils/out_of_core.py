@@ -0,0 +1,76 @@
+import numpy as np
+import scipy.sparse as sp
+import os
+import tempfile
+from typing import Iterator, Optional
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_BUDGET = 64 * 2 ** 20  # Bytes of scratch memory per row-panel update
+
+
+def panel_rows(num_columns: int, itemsize: int, memory_budget: int = DEFAULT_MEMORY_BUDGET) -> int:
+    """Number of rows of num_columns entries that fit in memory_budget bytes (at least one)."""
+    return max(1, int(memory_budget) // max(1, num_columns * itemsize))
+
+
+def row_panels(num_rows: int, num_columns: int, itemsize: int, memory_budget: int = DEFAULT_MEMORY_BUDGET) -> Iterator[slice]:
+    """Consecutive row slices covering range(num_rows), each within memory_budget bytes."""
+    step = panel_rows(num_columns, itemsize, memory_budget)
+    for start in range(0, num_rows, step):
+        yield slice(start, min(start + step, num_rows))
+
+
+def memmap_array(shape: tuple, dtype: np.dtype | type = np.float64, directory: Optional[str] = None) -> np.memmap:
+    """
+    Zero-filled array backed by a temporary file in directory instead of RAM.
+
+    The file is unlinked as soon as it is mapped, so it lives exactly as long as the
+    array and is never left behind; the operating system pages it in and out, and
+    only the pages being worked on need to be resident. The directory should be on
+    a local disk with room for the whole array.
+
+    Args:
+        shape (tuple): Shape of the array.
+        dtype (np.dtype | type): Element type.
+        directory (Optional[str]): Where to create the file, default the system temporary directory.
+
+    Returns:
+        np.memmap: The array.
+    """
+    with tempfile.NamedTemporaryFile(dir=directory, prefix='simplex-', suffix='.dat') as file:
+        array = np.memmap(file, dtype=dtype, mode='w+', shape=shape)
+    logger.debug("Mapped a %s %s array to %s", shape, np.dtype(dtype), file.name)
+    return array
+
+
+def column_norms(matrix: np.ndarray | sp.spmatrix, memory_budget: int = DEFAULT_MEMORY_BUDGET) -> np.ndarray:
+    """Squared Euclidean norm of every column, summed one row panel at a time."""
+    if sp.issparse(matrix):
+        return np.asarray(matrix.multiply(matrix).sum(axis=0)).ravel()
+    num_rows, num_columns = matrix.shape
+    norms = 0.0
+    for rows in row_panels(num_rows, num_columns, matrix.itemsize, memory_budget):
+        norms = norms + np.sum(matrix[rows] ** 2, axis=0)
+    return np.asarray(norms) if num_rows else np.zeros(num_columns, dtype=matrix.dtype)
+
+
+def take_columns(tableau: np.ndarray, keep: np.ndarray, memory_budget: int = DEFAULT_MEMORY_BUDGET) -> np.ndarray:
+    """
+    Returns tableau[:, keep] for a boolean column mask.
+
+    A memory-mapped tableau is copied panel by panel into a new memory-mapped
+    array in the same directory, so the working set stays within memory_budget;
+    an in-memory one is indexed directly.
+    """
+    if not isinstance(tableau, np.memmap):
+        return tableau[:, keep]
+    directory = os.path.dirname(tableau.filename) if tableau.filename else None
+    num_rows = tableau.shape[0]
+    columns = np.flatnonzero(keep)
+    reduced = memmap_array((num_rows, len(columns)), tableau.dtype, directory)
+    for rows in row_panels(num_rows, tableau.shape[1], tableau.itemsize, memory_budget):
+        reduced[rows] = tableau[rows][:, columns]
+    return reduced
@@ -1,5 +1,7 @@
 import numpy as np
 from typing import Optional
+from utils.ratio_test import calculate_ratios, harris_ratio_test  # calculate_ratios is re-exported for existing imports
+from utils.out_of_core import DEFAULT_MEMORY_BUDGET, row_panels
 import logging
 
 # Set up logging
@@ -8,62 +10,85 @@ logger = logging.getLogger(__name__)
 def select_entering_variable(tableau: np.ndarray) -> int:
     logger.debug("Selecting entering variable")
     entering_col_index = np.argmin(tableau[0, :-1])
-    logger.debug(f"Entering variable selected: column {entering_col_index}")
+    logger.debug("Entering variable selected: column %d", entering_col_index)
     return entering_col_index
 
 
-def calculate_ratios(tableau: np.ndarray, entering_col_index: int) -> np.ndarray:
-    logger.debug(f"Calculating ratios for entering column {entering_col_index}")
-    ratios = []
-    for i in range(1, tableau.shape[0]):
-        if tableau[i, entering_col_index] > 0:
-            ratio = tableau[i, -1] / tableau[i, entering_col_index]
-            ratios.append(ratio)
-            logger.debug(f"Ratio for row {i}: {ratio}")
-        else:
-            ratios.append(np.inf)  # Use np.inf to represent that the ratio is not valid
-            logger.debug(f"Ratio for row {i}: infinity (element in entering column <= 0)")
-    return np.array(ratios)
-
-
-def select_leaving_variable(tableau: np.ndarray, entering_col_index: int) -> Optional[int]:
+def select_leaving_variable(
+    tableau: np.ndarray,
+    entering_col_index: int,
+    feasibility_tol: float = 1e-9,
+    pivot_tol: float = 1e-9
+) -> Optional[int]:
     logger.debug("Selecting leaving variable")
-    ratios = calculate_ratios(tableau, entering_col_index)
-    
-    # If all ratios are np.inf, the problem is unbounded
-    if np.all(ratios == np.inf):
+    leaving_row_index = harris_ratio_test(tableau[1:, entering_col_index], tableau[1:, -1], feasibility_tol, pivot_tol)
+
+    # Without an eligible pivot entry the objective can improve indefinitely
+    if leaving_row_index is None:
         logger.warning("Problem is unbounded: all ratios are infinite")
         return None
 
-    # Find the index of the minimum ratio (excluding infinities)
-    leaving_row_index = np.argmin(ratios)
-    
-    # The leaving row index is relative to the ratios array, so add 1 to get the actual row index in the tableau
+    # The leaving row index is relative to the constraint rows, so add 1 to get the actual row index in the tableau
     leaving_row = leaving_row_index + 1
     
-    logger.debug(f"Leaving variable selected: row {leaving_row}")
+    logger.debug("Leaving variable selected: row %d", leaving_row)
     return leaving_row
 
 
-def pivot(tableau: np.ndarray, entering_col_index: int, leaving_row: int) -> np.ndarray:
-    logger.info(f"Performing pivot operation: entering column {entering_col_index}, leaving row {leaving_row}")
-    pivot_element = tableau[leaving_row, entering_col_index]
-    
-    # Divide the leaving row by the pivot element
-    print(f"\n[Pivot Step] Normalizing pivot row {leaving_row} by dividing by pivot element {pivot_element:.4f}:")
-    tableau[leaving_row, :] /= pivot_element
-    print(tableau)
-    logger.debug(f"Leaving row normalized by pivot element")
-    
-    # Subtract multiples of the leaving row from all other rows to make the
-    # entering column zero in those rows
-    for i in range(tableau.shape[0]):
-        if i != leaving_row:
-            factor = tableau[i, entering_col_index]
-            print(f"\n[Pivot Step] Eliminating variable in row {i} using row {leaving_row}, factor = {factor:.4f}:")
-            tableau[i, :] -= factor * tableau[leaving_row, :]
-            print(tableau)
-            logger.debug(f"Row {i} updated to make entering column zero")
-            
-    logger.info("Pivot operation complete")
+def select_leaving_variable_dual(tableau: np.ndarray, tol: float = 1e-9) -> Optional[int]:
+    logger.debug("Selecting leaving variable (dual simplex)")
+    rhs = tableau[1:, -1]
+    leaving_row_index = np.argmin(rhs)
+
+    # With every basic variable nonnegative the basis is primal feasible and the dual phase is over
+    if rhs[leaving_row_index] >= -tol:
+        logger.debug("All right-hand side values are nonnegative")
+        return None
+
+    leaving_row = leaving_row_index + 1
+    logger.debug("Leaving variable selected (dual simplex): row %d", leaving_row)
+    return leaving_row
+
+
+def select_entering_variable_dual(tableau: np.ndarray, leaving_row: int, tol: float = 1e-9) -> Optional[int]:
+    logger.debug("Selecting entering variable (dual simplex) for row %d", leaving_row)
+    row = tableau[leaving_row, :-1]
+    candidates = row < -tol
+
+    # A row with no negative entry cannot be made nonnegative: the problem is infeasible
+    if not np.any(candidates):
+        logger.warning("Problem is infeasible: no negative entry in leaving row %d", leaving_row)
+        return None
+
+    # Dual ratio test keeps the objective row nonnegative
+    ratios = np.full(row.shape, np.inf)
+    ratios[candidates] = tableau[0, :-1][candidates] / -row[candidates]
+    entering_col_index = int(np.argmin(ratios))
+    logger.debug("Entering variable selected (dual simplex): column %d", entering_col_index)
+    return entering_col_index
+
+
+def pivot(tableau: np.ndarray, entering_col_index: int, leaving_row: int, memory_budget: int = DEFAULT_MEMORY_BUDGET) -> np.ndarray:
+    logger.debug("Performing pivot operation: entering column %d, leaving row %d", entering_col_index, leaving_row)
+    # Integer tableaus cannot hold the scaled pivot row, so promote them once
+    if not np.issubdtype(tableau.dtype, np.floating):
+        tableau = tableau.astype(float)
+
+    # Scale the pivot row once so the pivot element becomes 1
+    tableau[leaving_row, :] /= tableau[leaving_row, entering_col_index]
+    logger.debug("Leaving row normalized by pivot element")
+
+    # Eliminate the entering column from every other row with a rank-1 update,
+    # tableau -= column * pivot_row, skipping the pivot row itself. The update is
+    # applied one row panel at a time so its temporary stays within memory_budget
+    # bytes (and a memory-mapped tableau is streamed through once); every entry
+    # gets the same arithmetic as a single full-size update.
+    factors = tableau[:, entering_col_index].copy()
+    factors[leaving_row] = 0
+    pivot_row = tableau[leaving_row, :].copy()
+    for rows in row_panels(tableau.shape[0], tableau.shape[1], tableau.itemsize, memory_budget):
+        tableau[rows] -= np.outer(factors[rows], pivot_row)
+    logger.debug("Entering column reduced to a unit vector")
+
+    logger.debug("Pivot operation complete")
     return tableau
@@ -0,0 +1,151 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import lu_factor, lu_solve, LinAlgWarning
+from typing import List, Optional
+import warnings
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+TABLEAU_DTYPES = {'float32': np.float32, 'float64': np.float64, 'longdouble': np.longdouble}
+
+# Pivots between two float64 refactorizations of a reduced-precision tableau
+REFACTOR_FREQUENCY = 50
+
+def resolve_dtype(dtype: str | type | np.dtype) -> np.dtype:
+    """
+    Returns the tableau dtype for a name ('float32', 'float64', 'longdouble') or numpy type.
+
+    Raises:
+        ValueError: If the dtype is not one of TABLEAU_DTYPES.
+    """
+    resolved = np.dtype(TABLEAU_DTYPES.get(dtype, dtype) if isinstance(dtype, str) else dtype)
+    if resolved not in [np.dtype(value) for value in TABLEAU_DTYPES.values()]:
+        raise ValueError(f"Tableau dtype must be one of {tuple(TABLEAU_DTYPES)}.")
+    return resolved
+
+
+def is_reduced_precision(dtype: np.dtype) -> bool:
+    """True for dtypes less precise than float64, which need periodic refactorization."""
+    return np.finfo(dtype).eps > np.finfo(np.float64).eps
+
+
+def working_tolerance(tol: float, dtype: np.dtype) -> float:
+    """Loosens a tolerance to what the working precision can resolve; float64 tolerances are unchanged."""
+    return max(tol, 64 * float(np.finfo(dtype).eps))
+
+
+class TableauRefactorization:
+    """
+    Recomputes the constraint rows of a reduced-precision tableau in float64.
+
+    Pivoting in float32 accumulates rounding error in every entry. Every
+    REFACTOR_FREQUENCY pivots the constraint rows are rebuilt as B^-1 [A | b]
+    from the original float64 data, with one step of iterative refinement
+    (X += B^-1 (C - B X)) per block of columns, and stored back in the tableau
+    dtype. Only a block of columns is held in float64 at a time, so the
+    refactorization does not need a float64 copy of the tableau. The same
+    solve gives the final basic values in full float64 accuracy.
+
+    The original data is the constraint matrix and right-hand side the tableau was
+    built from, before normalize_rhs_signs; the matrix is referenced, not copied.
+    """
+
+    def __init__(
+        self,
+        constraint_matrix: np.ndarray | sp.spmatrix,
+        rhs_values: np.ndarray,
+        senses: List[str],
+        frequency: int = REFACTOR_FREQUENCY,
+        block_size: int = 256
+    ):
+        self.constraint_matrix = sp.csc_matrix(constraint_matrix) if sp.issparse(constraint_matrix) else constraint_matrix
+        self.rhs_values = np.asarray(rhs_values, dtype=np.float64)
+        # Same row signs as normalize_rhs_signs; `senses` are the normalized senses used by setup_tableau
+        self.row_signs = np.where(self.rhs_values < 0, -1.0, 1.0)
+        self.logical_signs = np.array([-1.0 if sense == '>=' else 1.0 for sense in senses])
+        self.num_constraints, self.num_original_vars = constraint_matrix.shape
+        self.frequency = frequency
+        self.block_size = block_size
+        self.pivots = 0
+
+    @property
+    def stale(self) -> bool:
+        """True if the tableau has been pivoted since the last refactorization."""
+        return self.pivots > 0
+
+    def record_pivot(self) -> bool:
+        """Counts a pivot. Returns True when a refactorization is due."""
+        self.pivots += 1
+        return self.pivots >= self.frequency
+
+    def original_columns(self, variables: np.ndarray, column_sign: Optional[np.ndarray] = None) -> np.ndarray:
+        """Float64 columns of the original constraint rows for the given layout-independent variable indices."""
+        n, m = self.num_original_vars, self.num_constraints
+        columns = np.zeros((m, len(variables)))
+        structural = np.flatnonzero(variables < n)
+        if structural.size:
+            values = self.constraint_matrix[:, variables[structural]]
+            values = values.toarray() if sp.issparse(values) else np.asarray(values, dtype=np.float64)
+            if column_sign is not None:
+                values = values * column_sign[variables[structural]]
+            columns[:, structural] = self.row_signs[:, None] * values
+        logical = np.flatnonzero((variables >= n) & (variables < n + m))
+        columns[variables[logical] - n, logical] = self.logical_signs[variables[logical] - n]
+        artificial = np.flatnonzero(variables >= n + m)
+        columns[variables[artificial] - n - m, artificial] = 1.0
+        return columns
+
+    def original_rhs(self, column_sign: Optional[np.ndarray] = None, base: Optional[np.ndarray] = None) -> np.ndarray:
+        """Float64 right-hand side of the original constraint rows, after any bound complementing."""
+        rhs = self.row_signs * self.rhs_values
+        if base is not None and np.any(base):
+            rhs = rhs - self.row_signs * (self.constraint_matrix @ base)
+        return rhs
+
+    def _factorize(self, basis: np.ndarray, variable_indices: np.ndarray, column_sign: Optional[np.ndarray]):
+        basis_matrix = self.original_columns(variable_indices[basis], column_sign)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', LinAlgWarning)
+            return basis_matrix, lu_factor(basis_matrix)
+
+    @staticmethod
+    def _refined_solve(basis_matrix: np.ndarray, lu, block: np.ndarray) -> np.ndarray:
+        solution = lu_solve(lu, block)
+        solution += lu_solve(lu, block - basis_matrix @ solution)
+        return solution
+
+    def refactor(self, tableau: np.ndarray, basis: np.ndarray, variable_indices: np.ndarray, bounds=None) -> np.ndarray:
+        """
+        Rewrites the constraint rows of `tableau` in place from the original data; row 0 is left to the caller.
+
+        Args:
+            tableau (np.ndarray): Tableau in a reduced-precision dtype.
+            basis (np.ndarray): Tableau column that is basic in each constraint row.
+            variable_indices (np.ndarray): Layout-independent variable index of each tableau column.
+            bounds (Optional[TableauBounds]): Bound bookkeeping, whose complemented columns are reproduced.
+
+        Returns:
+            np.ndarray: The refactored tableau (the same array).
+        """
+        column_sign = bounds.column_sign if bounds is not None else None
+        basis_matrix, lu = self._factorize(basis, variable_indices, column_sign)
+        num_columns = tableau.shape[1] - 1
+        for start in range(0, num_columns, self.block_size):
+            columns = np.arange(start, min(start + self.block_size, num_columns))
+            block = self.original_columns(variable_indices[columns], column_sign)
+            tableau[1:, columns] = self._refined_solve(basis_matrix, lu, block)
+        rhs = self.original_rhs(column_sign, bounds.base if bounds is not None else None)
+        tableau[1:, -1] = self._refined_solve(basis_matrix, lu, rhs)
+        tableau[1:, basis] = np.eye(len(basis), dtype=tableau.dtype)
+        self.pivots = 0
+        logger.debug("Refactored %s tableau in float64", tableau.dtype)
+        return tableau
+
+    def basic_values(self, basis: np.ndarray, variable_indices: np.ndarray, bounds=None) -> np.ndarray:
+        """Float64 values of the basic variables, B^-1 b with iterative refinement."""
+        column_sign = bounds.column_sign if bounds is not None else None
+        basis_matrix, lu = self._factorize(basis, variable_indices, column_sign)
+        rhs = self.original_rhs(column_sign, bounds.base if bounds is not None else None)
+        return self._refined_solve(basis_matrix, lu, rhs)
@@ -0,0 +1,339 @@
+import numpy as np
+import scipy.sparse as sp
+from dataclasses import dataclass
+from typing import List, Optional
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+@dataclass
+class PresolvedProblem:
+    """
+    Reduced problem produced by presolve_problem, with what postsolve needs to map its solution back.
+
+    Variable j of the reduced problem is original variable kept_columns[j] minus
+    lower_bounds[j] (its finite lower bound, or 0 if it has none), with the bounds
+    `lb` <= x <= `ub` to pass to the solver; both are None when every reduced
+    variable is simply x >= 0. Every other original variable was fixed by presolve
+    at its entry of fixed_values.
+    `status` is 'reduced' if a problem is left to solve, 'optimal' if presolve
+    removed every row and column, or 'infeasible' / 'unbounded' if presolve proved it.
+    """
+    status: str
+    objective_coeffs: np.ndarray
+    constraint_matrix: np.ndarray | sp.spmatrix
+    rhs_values: np.ndarray
+    senses: List[str]
+    kept_rows: np.ndarray
+    kept_columns: np.ndarray
+    lower_bounds: np.ndarray
+    fixed_values: np.ndarray
+    objective_offset: float
+    lb: Optional[np.ndarray] = None
+    ub: Optional[np.ndarray] = None
+
+    def postsolve(self, solution: Optional[np.ndarray] = None) -> np.ndarray:
+        """Maps a solution of the reduced problem back to the original variables."""
+        original_solution = self.fixed_values.copy()
+        if solution is not None:
+            original_solution[self.kept_columns] = self.lower_bounds + np.asarray(solution, dtype=float)
+        return original_solution
+
+    def postsolve_objective(self, objective_value: float) -> float:
+        """Maps the objective value of the reduced problem back to the original problem."""
+        return objective_value + self.objective_offset
+
+
+def _tolerance(values: np.ndarray, tol: float) -> np.ndarray:
+    # Absolute tolerance scaled by the magnitude of the (finite) values it is compared with
+    return tol * (1.0 + np.abs(np.where(np.isfinite(values), values, 0.0)))
+
+
+def presolve_problem(
+    objective_coeffs: np.ndarray,
+    constraint_matrix: np.ndarray | sp.spmatrix,
+    rhs_values: np.ndarray,
+    senses: List[str],
+    problem_type: str = 'max',
+    tol: float = 1e-9,
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None
+) -> PresolvedProblem:
+    """
+    Reduces a linear programming problem before the tableau is built.
+
+    Every constraint is kept as a range lo <= a x <= hi and every variable as
+    lb <= x <= ub (by default 0 and inf). The following reductions are repeated
+    until none applies:
+
+    - empty rows are checked for feasibility and removed,
+    - singleton rows become bounds on their variable,
+    - variables whose bounds meet are fixed and substituted out,
+    - dominated columns (whose objective and every constraint favour one bound) are fixed at that bound,
+    - duplicate (parallel) rows are merged into one range,
+    - rows that can never be violated under the bounds are removed, and rows that can
+      only be met at one extreme force their variables to that extreme,
+    - bounds implied by the rows are tightened, fixing variables whose implied range collapses.
+
+    Rows are only ever dropped for redundancy under the explicit bounds, which stay
+    in the reduced problem as variable bounds (finite lower bounds as a shift of the
+    variable), so implied bounds are never used to remove the rows they came from.
+
+    Args:
+        objective_coeffs (np.ndarray): Objective function coefficients.
+        constraint_matrix (np.ndarray | sp.spmatrix): Dense or CSR/CSC constraint coefficient matrix.
+        rhs_values (np.ndarray): Right-hand side values.
+        senses (List[str]): List of strings for each constraint ('<=', '>=', '=').
+        problem_type (str): 'max' for maximization, 'min' for minimization.
+        tol (float): Feasibility tolerance, scaled by the magnitude of the compared values.
+        lb (Optional[np.ndarray]): Variable lower bounds (-inf allowed), default 0.
+        ub (Optional[np.ndarray]): Variable upper bounds (inf allowed), default inf.
+
+    Returns:
+        PresolvedProblem: The reduced problem and its postsolve information. The reduced
+        constraint matrix has the same format (dense, CSR or CSC) as the input.
+    """
+    logger.info("Starting presolve")
+    num_constraints, num_original_vars = constraint_matrix.shape
+    objective_coeffs = np.asarray(objective_coeffs, dtype=float)
+    rhs_values = np.asarray(rhs_values, dtype=float)
+
+    # Work on the nonzero entries only; the coefficients never change, only bounds and ranges do
+    entries = sp.coo_matrix(constraint_matrix)
+    nonzero = entries.data != 0
+    rows, cols, values = entries.row[nonzero], entries.col[nonzero], entries.data[nonzero].astype(float)
+
+    costs = -objective_coeffs if problem_type == 'max' else objective_coeffs.copy()
+    senses_array = np.array(senses)
+    row_lower = np.where(np.isin(senses_array, ['>=', '=']), rhs_values, -np.inf)
+    row_upper = np.where(np.isin(senses_array, ['<=', '=']), rhs_values, np.inf)
+    lower = np.zeros(num_original_vars) if lb is None else np.array(lb, dtype=float)
+    upper = np.full(num_original_vars, np.inf) if ub is None else np.array(ub, dtype=float)
+    row_active = np.ones(num_constraints, dtype=bool)
+    col_active = np.ones(num_original_vars, dtype=bool)
+    fixed_values = np.zeros(num_original_vars)
+
+    def result(status: str) -> PresolvedProblem:
+        return PresolvedProblem(
+            status, np.zeros(0), np.zeros((0, 0)), np.zeros(0), [], np.zeros(0, dtype=int),
+            np.zeros(0, dtype=int), np.zeros(0), fixed_values, 0.0
+        )
+
+    def fix(columns: np.ndarray, column_values: np.ndarray) -> None:
+        # Substitute the values into every row range and drop the columns
+        fixed_values[columns] = column_values
+        col_active[columns] = False
+        substituted = np.zeros(num_original_vars)
+        substituted[columns] = column_values
+        shift = np.bincount(rows, weights=values * substituted[cols], minlength=num_constraints)
+        row_lower[:] -= shift
+        row_upper[:] -= shift
+
+    passes = 0
+    while True:
+        passes += 1
+        live = row_active[rows] & col_active[cols]
+        r, c, a = rows[live], cols[live], values[live]
+        counts = np.bincount(r, minlength=num_constraints)
+
+        # Empty rows: 0 must lie in the row range
+        empty = row_active & (counts == 0)
+        if np.any(empty):
+            if np.any(empty & ((row_lower > _tolerance(row_lower, tol)) | (row_upper < -_tolerance(row_upper, tol)))):
+                logger.warning("Presolve: an empty row cannot be satisfied, problem is infeasible")
+                return result('infeasible')
+            logger.debug("Presolve: removing %d empty rows", np.count_nonzero(empty))
+            row_active[empty] = False
+            continue
+
+        # Singleton rows: lo <= a x_j <= hi becomes a bound on x_j
+        singleton = counts[r] == 1
+        if np.any(singleton):
+            i, j, coefficient = r[singleton], c[singleton], a[singleton]
+            with np.errstate(invalid='ignore'):
+                from_lower, from_upper = row_lower[i] / coefficient, row_upper[i] / coefficient
+            np.maximum.at(lower, j, np.where(coefficient > 0, from_lower, from_upper))
+            np.minimum.at(upper, j, np.where(coefficient > 0, from_upper, from_lower))
+            logger.debug("Presolve: turning %d singleton rows into bounds", len(i))
+            row_active[i] = False
+
+        # Fixed variables: the bounds meet
+        if np.any(col_active & (lower > upper + _tolerance(lower, tol))):
+            logger.warning("Presolve: conflicting variable bounds, problem is infeasible")
+            return result('infeasible')
+        fixed = np.flatnonzero(col_active & (upper - lower <= _tolerance(lower, tol)))
+        if fixed.size:
+            logger.debug("Presolve: fixing %d variables", fixed.size)
+            fix(fixed, lower[fixed])
+        if np.any(singleton) or fixed.size:
+            continue
+
+        # Dominated columns: x_j can move towards one bound without hurting any row or the objective
+        finite_lower, finite_upper = np.isfinite(row_lower[r]), np.isfinite(row_upper[r])
+        blocks_decrease = np.where(a > 0, finite_lower, finite_upper)
+        blocks_increase = np.where(a > 0, finite_upper, finite_lower)
+        can_decrease = np.bincount(c, weights=blocks_decrease, minlength=num_original_vars) == 0
+        can_increase = np.bincount(c, weights=blocks_increase, minlength=num_original_vars) == 0
+        to_lower = np.flatnonzero(col_active & can_decrease & (costs >= 0) & np.isfinite(lower))
+        to_upper = np.flatnonzero(col_active & can_increase & (costs < 0) & np.isfinite(upper))
+        # A free column without cost that no row restricts can take any value in its bounds
+        to_zero = np.setdiff1d(np.flatnonzero(col_active & can_decrease & can_increase & (costs == 0)), to_lower)
+        if to_lower.size or to_upper.size or to_zero.size:
+            logger.debug("Presolve: fixing %d dominated columns", to_lower.size + to_upper.size + to_zero.size)
+            fix(to_lower, lower[to_lower])
+            fix(to_upper, upper[to_upper])
+            fix(to_zero, np.clip(0.0, lower[to_zero], upper[to_zero]))
+            continue
+
+        # Duplicate rows: rows that are multiples of each other are merged into one range
+        order = np.lexsort((c, r))
+        boundaries = np.flatnonzero(np.diff(r[order])) + 1
+        representatives = {}
+        merged = False
+        for row_entries in np.split(order, boundaries):
+            if row_entries.size == 0:
+                continue
+            i = r[row_entries[0]]
+            scale = a[row_entries[0]]
+            key = (c[row_entries].tobytes(), np.round(a[row_entries] / scale, 12).tobytes())
+            if key not in representatives:
+                representatives[key] = (i, scale)
+                continue
+            kept, kept_scale = representatives[key]
+            ratio = scale / kept_scale
+            bounds = sorted((row_lower[i] / ratio, row_upper[i] / ratio))
+            row_lower[kept] = max(row_lower[kept], bounds[0])
+            row_upper[kept] = min(row_upper[kept], bounds[1])
+            row_active[i] = False
+            merged = True
+        if merged:
+            if np.any(row_active & (row_lower > row_upper + _tolerance(row_upper, tol))):
+                logger.warning("Presolve: duplicate rows are inconsistent, problem is infeasible")
+                return result('infeasible')
+            logger.debug("Presolve: merged duplicate rows")
+            continue
+
+        # Row activity bounds under the explicit variable bounds; infinite terms are counted separately
+        lower_finite, upper_finite = np.isfinite(lower[c]), np.isfinite(upper[c])
+        finite_lower_value = np.where(lower_finite, lower[c], 0.0)
+        finite_upper_value = np.where(upper_finite, upper[c], 0.0)
+        min_activity = np.bincount(r, weights=a * np.where(a > 0, finite_lower_value, finite_upper_value), minlength=num_constraints)
+        max_activity = np.bincount(r, weights=a * np.where(a > 0, finite_upper_value, finite_lower_value), minlength=num_constraints)
+        min_infinite = np.bincount(r, weights=np.where(a > 0, ~lower_finite, ~upper_finite), minlength=num_constraints)
+        max_infinite = np.bincount(r, weights=np.where(a > 0, ~upper_finite, ~lower_finite), minlength=num_constraints)
+        min_activity = np.where(min_infinite > 0, -np.inf, min_activity)
+        max_activity = np.where(max_infinite > 0, np.inf, max_activity)
+
+        if np.any(row_active & ((min_activity > row_upper + _tolerance(row_upper, tol))
+                                | (max_activity < row_lower - _tolerance(row_lower, tol)))):
+            logger.warning("Presolve: a row cannot be satisfied within the variable bounds, problem is infeasible")
+            return result('infeasible')
+
+        redundant = row_active & (min_activity >= row_lower - _tolerance(row_lower, tol)) \
+            & (max_activity <= row_upper + _tolerance(row_upper, tol))
+        if np.any(redundant):
+            logger.debug("Presolve: removing %d redundant rows", np.count_nonzero(redundant))
+            row_active[redundant] = False
+            continue
+
+        # Forcing rows: the range can only be met with every variable at the bound that attains the extreme activity
+        force_max = row_active & np.isfinite(max_activity) & (max_activity <= row_lower + _tolerance(row_lower, tol))
+        force_min = row_active & np.isfinite(min_activity) & (min_activity >= row_upper - _tolerance(row_upper, tol))
+        forcing = force_max[r] | force_min[r]
+        if np.any(forcing):
+            at_upper = np.where(force_max[r], a > 0, a < 0)[forcing]
+            columns, first = np.unique(c[forcing], return_index=True)
+            column_values = np.where(at_upper[first], upper[columns], lower[columns])
+            logger.debug("Presolve: %d forcing rows fix %d variables", np.count_nonzero(force_max | force_min), columns.size)
+            fix(columns, column_values)
+            continue
+
+        # Implied bounds: what each row allows for one variable given the bounds of the others
+        implied_lower = lower.copy()
+        implied_upper = upper.copy()
+        from_upper_row = np.isfinite(row_upper[r]) & (min_infinite[r] == 0)
+        from_lower_row = np.isfinite(row_lower[r]) & (max_infinite[r] == 0)
+        with np.errstate(invalid='ignore'):
+            # From a x <= hi: a_j x_j <= hi - (min activity of the other variables)
+            step = (row_upper[r] - min_activity[r]) / a
+            np.minimum.at(implied_upper, c[from_upper_row & (a > 0)], (lower[c] + step)[from_upper_row & (a > 0)])
+            np.maximum.at(implied_lower, c[from_upper_row & (a < 0)], (upper[c] + step)[from_upper_row & (a < 0)])
+            # From a x >= lo: a_j x_j >= lo - (max activity of the other variables)
+            step = (row_lower[r] - max_activity[r]) / a
+            np.maximum.at(implied_lower, c[from_lower_row & (a > 0)], (upper[c] + step)[from_lower_row & (a > 0)])
+            np.minimum.at(implied_upper, c[from_lower_row & (a < 0)], (lower[c] + step)[from_lower_row & (a < 0)])
+        if np.any(col_active & (implied_lower > implied_upper + _tolerance(implied_lower, tol))):
+            logger.warning("Presolve: implied bounds conflict, problem is infeasible")
+            return result('infeasible')
+        collapsed = np.flatnonzero(col_active & (implied_upper - implied_lower <= _tolerance(implied_lower, tol)))
+        if collapsed.size:
+            logger.debug("Presolve: implied bounds fix %d variables", collapsed.size)
+            fix(collapsed, np.clip(implied_lower[collapsed], lower[collapsed], upper[collapsed]))
+            continue
+        break
+
+    kept_rows = np.flatnonzero(row_active)
+    kept_columns = np.flatnonzero(col_active)
+    lower_bounds = np.where(np.isfinite(lower[kept_columns]), lower[kept_columns], 0.0)
+    objective_offset = float(objective_coeffs @ fixed_values + objective_coeffs[kept_columns] @ lower_bounds)
+    logger.info("Presolve finished after %d passes: %d of %d rows and %d of %d columns remain",
+                passes, kept_rows.size, num_constraints, kept_columns.size, num_original_vars)
+
+    if kept_columns.size == 0:
+        presolved = result('optimal')
+        presolved.objective_offset = float(objective_coeffs @ fixed_values)
+        return presolved
+    if kept_rows.size == 0:
+        # Every column left is free to improve the objective without limit
+        logger.warning("Presolve: problem is unbounded")
+        return result('unbounded')
+
+    # Shift the kept variables by their lower bounds
+    live = row_active[rows] & col_active[cols]
+    r, c, a = rows[live], cols[live], values[live]
+    lower_of_column = np.zeros(num_original_vars)
+    lower_of_column[kept_columns] = lower_bounds
+    shift = np.bincount(r, weights=a * lower_of_column[c], minlength=num_constraints)
+    row_lower -= shift
+    row_upper -= shift
+
+    # Rows back to senses: a finite range on both sides becomes a '>=' and a '<=' row
+    new_senses, new_rhs, sources = [], [], []
+    for i in kept_rows:
+        if np.isfinite(row_lower[i]) and row_upper[i] - row_lower[i] <= _tolerance(row_upper[i], tol):
+            pieces = [('=', row_upper[i])]
+        else:
+            pieces = [(sense, value) for sense, value in (('>=', row_lower[i]), ('<=', row_upper[i])) if np.isfinite(value)]
+        for sense, value in pieces:
+            new_senses.append(sense)
+            new_rhs.append(value)
+            sources.append(i)
+    sources = np.array(sources, dtype=int)
+
+    new_column = np.full(num_original_vars, -1)
+    new_column[kept_columns] = np.arange(kept_columns.size)
+    # Each original row may appear twice; repeat its entries for every reduced row it became
+    entry_rows, entry_cols, entry_values = [], [], []
+    for reduced_row, i in enumerate(sources):
+        in_row = r == i
+        entry_rows.append(np.full(np.count_nonzero(in_row), reduced_row))
+        entry_cols.append(new_column[c[in_row]])
+        entry_values.append(a[in_row])
+
+    # Bounds that are left go to the solver as variable bounds, relative to the shift
+    reduced_lb = np.where(np.isfinite(lower[kept_columns]), 0.0, -np.inf)
+    reduced_ub = upper[kept_columns] - lower_bounds
+    if np.all(reduced_lb == 0) and not np.any(np.isfinite(reduced_ub)):
+        reduced_lb = reduced_ub = None
+
+    reduced = sp.coo_matrix(
+        (np.concatenate(entry_values), (np.concatenate(entry_rows), np.concatenate(entry_cols))),
+        shape=(len(new_senses), kept_columns.size)
+    )
+    reduced_matrix = reduced.asformat(constraint_matrix.format) if sp.issparse(constraint_matrix) else reduced.toarray()
+
+    return PresolvedProblem(
+        'reduced', objective_coeffs[kept_columns], reduced_matrix, np.array(new_rhs, dtype=float), new_senses,
+        kept_rows, kept_columns, lower_bounds, fixed_values, objective_offset, reduced_lb, reduced_ub
+    )
@@ -0,0 +1,204 @@
+import numpy as np
+from typing import Callable, Optional
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# price(columns) returns the reduced costs of the given columns (an index array or slice);
+# basic and non-enterable columns report a nonnegative value.
+PriceFunction = Callable[[np.ndarray | slice], np.ndarray]
+# project(v) returns v^T B^-1 A for every column, i.e. v dotted with each updated column.
+ProjectFunction = Callable[[np.ndarray], np.ndarray]
+
+
+class PricingRule:
+    """
+    Strategy for choosing the entering column of a primal simplex iteration.
+
+    Engines call reset() at the start of a phase, select_entering() once per
+    iteration and update() after every pivot, so rules can keep state such as
+    edge weights across iterations instead of recomputing it.
+    """
+    # Whether reset() needs the squared norms of the updated columns B^-1 a_j
+    needs_column_norms = False
+
+    def reset(self, num_columns: int, column_norms: Optional[np.ndarray] = None) -> None:
+        self.num_columns = num_columns
+
+    def select_entering(self, price: PriceFunction, tol: float = 1e-9) -> Optional[int]:
+        """Returns the entering column, or None if no column has a reduced cost below -tol."""
+        raise NotImplementedError
+
+    def update(
+        self,
+        entering: int,
+        leaving_row: int,
+        leaving_column: Optional[int],
+        pivot_column: np.ndarray,
+        project: ProjectFunction
+    ) -> None:
+        """
+        Updates the rule's state after a pivot.
+
+        Args:
+            entering (int): Column that entered the basis.
+            leaving_row (int): Constraint row of the pivot (0-based, excluding the objective row).
+            leaving_column (Optional[int]): Column that left the basis, if it is a priced column.
+            pivot_column (np.ndarray): Entering column B^-1 a_q before the pivot.
+            project (ProjectFunction): Computes v^T B^-1 A for the basis before the pivot.
+        """
+        pass
+
+
+class DantzigPricing(PricingRule):
+    """Most negative reduced cost (the classic textbook rule)."""
+
+    def select_entering(self, price: PriceFunction, tol: float = 1e-9) -> Optional[int]:
+        reduced_costs = price(slice(None))
+        entering = int(np.argmin(reduced_costs))
+        return entering if reduced_costs[entering] < -tol else None
+
+
+class BlandPricing(PricingRule):
+    """Lowest-index column with a negative reduced cost. Slow, but cannot cycle together with a lowest-index ratio test."""
+
+    def select_entering(self, price: PriceFunction, tol: float = 1e-9) -> Optional[int]:
+        candidates = np.flatnonzero(price(slice(None)) < -tol)
+        return int(candidates[0]) if candidates.size else None
+
+
+class DevexPricing(PricingRule):
+    """
+    Devex pricing: approximate steepest edge with reference weights.
+
+    Weights start at 1 for the current reference framework and only grow, using
+    the pivot row alone, so an update costs one projection.
+    """
+
+    def reset(self, num_columns: int, column_norms: Optional[np.ndarray] = None) -> None:
+        super().reset(num_columns)
+        self.weights = np.ones(num_columns)
+
+    def select_entering(self, price: PriceFunction, tol: float = 1e-9) -> Optional[int]:
+        reduced_costs = price(slice(None))
+        candidates = reduced_costs < -tol
+        if not np.any(candidates):
+            return None
+        scores = np.where(candidates, reduced_costs ** 2 / self.weights, -np.inf)
+        return int(np.argmax(scores))
+
+    def update(self, entering, leaving_row, leaving_column, pivot_column, project) -> None:
+        unit = np.zeros(len(pivot_column))
+        unit[leaving_row] = 1.0
+        pivot_row = project(unit)[:self.num_columns]
+        pivot_element = pivot_column[leaving_row]
+        entering_weight = self.weights[entering]
+        self.weights = np.maximum(self.weights, (pivot_row / pivot_element) ** 2 * entering_weight)
+        if leaving_column is not None:
+            self.weights[leaving_column] = max(entering_weight / pivot_element ** 2, 1.0)
+
+
+class SteepestEdgePricing(PricingRule):
+    """
+    Steepest-edge pricing: largest reduced cost per unit length of the edge direction.
+
+    The weights gamma_j = 1 + ||B^-1 a_j||^2 are updated exactly after every
+    pivot with one extra projection instead of being recomputed. Without
+    column norms at reset the rule starts from a unit reference framework.
+    """
+    needs_column_norms = True
+
+    def reset(self, num_columns: int, column_norms: Optional[np.ndarray] = None) -> None:
+        super().reset(num_columns)
+        if column_norms is None:
+            logger.info("No column norms available, steepest edge starts from unit reference weights")
+            self.weights = np.ones(num_columns)
+        else:
+            self.weights = 1.0 + np.asarray(column_norms, dtype=float)[:num_columns]
+
+    def select_entering(self, price: PriceFunction, tol: float = 1e-9) -> Optional[int]:
+        reduced_costs = price(slice(None))
+        candidates = reduced_costs < -tol
+        if not np.any(candidates):
+            return None
+        scores = np.where(candidates, reduced_costs ** 2 / self.weights, -np.inf)
+        return int(np.argmax(scores))
+
+    def update(self, entering, leaving_row, leaving_column, pivot_column, project) -> None:
+        # After the pivot every column j becomes a_j - alpha_j (d_q - e_r) with alpha_j = a_rj / d_rq
+        direction = pivot_column.copy()
+        direction[leaving_row] -= 1.0
+        unit = np.zeros(len(pivot_column))
+        unit[leaving_row] = 1.0
+        pivot_row = project(unit)[:self.num_columns]
+        alpha = pivot_row / pivot_column[leaving_row]
+        column_dots = project(direction)[:self.num_columns]
+        self.weights = np.maximum(self.weights - 2.0 * alpha * column_dots + alpha ** 2 * (direction @ direction), 1.0)
+
+
+class PartialPricing(PricingRule):
+    """
+    Partial and multiple pricing for problems with many columns.
+
+    Only one segment of `segment_size` columns is priced per iteration, scanning
+    cyclically from where the previous search stopped; the full column range is
+    priced only when the problem is (nearly) optimal. With num_candidates > 1
+    the best candidates of a segment are kept and re-priced first in the next
+    iterations (multiple pricing).
+    """
+
+    def __init__(self, segment_size: Optional[int] = None, num_candidates: int = 1):
+        self.segment_size = segment_size
+        self.num_candidates = num_candidates
+
+    def reset(self, num_columns: int, column_norms: Optional[np.ndarray] = None) -> None:
+        super().reset(num_columns)
+        self.size = self.segment_size or max(100, -(-num_columns // 10))
+        self.start = 0
+        self.candidates = np.empty(0, dtype=int)
+
+    def select_entering(self, price: PriceFunction, tol: float = 1e-9) -> Optional[int]:
+        if self.candidates.size:
+            reduced_costs = price(self.candidates)
+            attractive = reduced_costs < -tol
+            if np.any(attractive):
+                best = int(np.argmin(reduced_costs))
+                entering = int(self.candidates[best])
+                self.candidates = self.candidates[attractive & (np.arange(self.candidates.size) != best)]
+                return entering
+            self.candidates = np.empty(0, dtype=int)
+
+        for _ in range(-(-self.num_columns // self.size)):
+            columns = (self.start + np.arange(min(self.size, self.num_columns))) % self.num_columns
+            self.start = (self.start + self.size) % self.num_columns
+            reduced_costs = price(columns)
+            attractive = np.flatnonzero(reduced_costs < -tol)
+            if attractive.size:
+                order = attractive[np.argsort(reduced_costs[attractive])][:self.num_candidates]
+                self.candidates = columns[order[1:]]
+                return int(columns[order[0]])
+        return None
+
+
+PRICING_RULES = {
+    'dantzig': DantzigPricing,
+    'bland': BlandPricing,
+    'devex': DevexPricing,
+    'steepest_edge': SteepestEdgePricing,
+    'partial': PartialPricing,
+}
+
+
+def get_pricing_rule(pricing: str | PricingRule) -> PricingRule:
+    """
+    Returns a pricing rule instance for a rule name or passes a rule object through.
+
+    Raises:
+        ValueError: If the name is not one of PRICING_RULES.
+    """
+    if not isinstance(pricing, str):
+        return pricing
+    if pricing not in PRICING_RULES:
+        raise ValueError(f"Pricing must be one of {sorted(PRICING_RULES)} or a PricingRule instance.")
+    return PRICING_RULES[pricing]()
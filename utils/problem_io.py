@@ -0,0 +1,224 @@
+import numpy as np
+import scipy.sparse as sp
+import os
+import struct
+import threading
+from dataclasses import dataclass
+from typing import BinaryIO, List, Optional
+from utils.input_validation import validate_inputs
+from utils.out_of_core import DEFAULT_MEMORY_BUDGET, row_panels
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# File layout (all little-endian): a header, a section table, then the arrays, each starting
+# on an ALIGNMENT-byte boundary so the reader can view them in place. The header is
+#   magic (8 bytes), version (u32), flags (u32), num_constraints, num_variables, nnz (u64 each)
+# and the table holds (offset, nbytes) as two u64 for every entry of SECTIONS, (0, 0) if absent.
+MAGIC = b'SIMPLXLP'
+VERSION = 1
+ALIGNMENT = 64
+SECTIONS = ('c', 'b', 'senses', 'indptr', 'indices', 'data', 'lb', 'ub')
+_HEADER = struct.Struct('<8sIIQQQ')
+_ENTRY = struct.Struct('<QQ')
+
+FLAG_MIN = 1  # problem_type is 'min'
+FLAG_INT64_INDEX = 2  # indptr and indices are int64 rather than int32
+FLAG_DENSE = 4  # data holds the dense matrix in row-major order; indptr and indices are absent
+FLAG_LB = 8
+FLAG_UB = 16
+
+SENSE_CODES = {'<=': 0, '>=': 1, '=': 2}
+SENSES = ('<=', '>=', '=')
+
+
+@dataclass
+class LinearProgram:
+    """
+    A problem read by read_problem, ready to pass to tabular_simplex (lb and ub as keywords).
+
+    The arrays are read-only: views of the memory-mapped file, or arrays read
+    straight from it. constraint_matrix is a CSR matrix whose data, indices and
+    indptr are such arrays, not copies, or for a file written with dense=True a
+    row-major 2-D array that the out-of-core tableau and the revised engine read in place.
+    """
+    objective_coeffs: np.ndarray
+    constraint_matrix: np.ndarray | sp.csr_matrix
+    rhs_values: np.ndarray
+    senses: List[str]
+    problem_type: str
+    lb: Optional[np.ndarray] = None
+    ub: Optional[np.ndarray] = None
+
+
+def _align(file: BinaryIO) -> int:
+    # Pads the file to the next section boundary and returns that offset
+    padding = -file.tell() % ALIGNMENT
+    file.write(b'\0' * padding)
+    return file.tell()
+
+
+def write_problem(
+    path: str,
+    objective_coeffs: np.ndarray,
+    constraint_matrix: np.ndarray | sp.spmatrix,
+    rhs_values: np.ndarray,
+    senses: List[str],
+    problem_type: str = 'max',
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None,
+    dense: bool = False,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET
+) -> None:
+    """
+    Writes a problem to the binary format read by read_problem.
+
+    The constraint matrix is stored as CSR (int32 indices when they fit, int64
+    otherwise), or with dense=True as the full row-major matrix, which a dense
+    matrix is written from one row panel of at most memory_budget bytes at a time.
+    The file is written next to its destination and renamed into place, so a
+    reader never sees a partial file.
+
+    Args:
+        path (str): Destination file.
+        objective_coeffs (np.ndarray): Objective function coefficients.
+        constraint_matrix (np.ndarray | sp.spmatrix): Dense or CSR/CSC constraint coefficient matrix.
+        rhs_values (np.ndarray): Right-hand side values.
+        senses (List[str]): List of strings for each constraint ('<=', '>=', '=').
+        problem_type (str): 'max' for maximization, 'min' for minimization.
+        lb (Optional[np.ndarray]): Variable lower bounds (-inf for none), default 0.
+        ub (Optional[np.ndarray]): Variable upper bounds (inf for none), default inf.
+        dense (bool): Store the dense matrix instead of CSR arrays.
+        memory_budget (int): Bytes per row panel when writing a dense matrix.
+
+    Raises:
+        ValueError: If the inputs are invalid.
+    """
+    validate_inputs(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, lb, ub)
+    num_constraints, num_variables = constraint_matrix.shape
+    flags = (FLAG_MIN if problem_type == 'min' else 0) | (FLAG_LB if lb is not None else 0) | (FLAG_UB if ub is not None else 0)
+    arrays = {
+        'c': np.asarray(objective_coeffs, dtype='<f8'),
+        'b': np.asarray(rhs_values, dtype='<f8'),
+        'senses': np.array([SENSE_CODES[sense] for sense in senses], dtype=np.int8),
+        'lb': None if lb is None else np.asarray(lb, dtype='<f8'),
+        'ub': None if ub is None else np.asarray(ub, dtype='<f8'),
+    }
+    if dense:
+        flags |= FLAG_DENSE
+        nnz = num_constraints * num_variables
+    else:
+        matrix = sp.csr_matrix(constraint_matrix, dtype=np.float64)
+        matrix.sum_duplicates()
+        nnz = matrix.nnz
+        index_dtype = '<i4' if max(nnz, num_variables) <= np.iinfo(np.int32).max else '<i8'
+        if index_dtype == '<i8':
+            flags |= FLAG_INT64_INDEX
+        arrays.update(indptr=matrix.indptr.astype(index_dtype, copy=False), indices=matrix.indices.astype(index_dtype, copy=False),
+                      data=matrix.data.astype('<f8', copy=False))
+
+    temporary_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(temporary_path, 'wb') as file:
+        file.write(b'\0' * (_HEADER.size + _ENTRY.size * len(SECTIONS)))
+        table = {}
+        for name in SECTIONS:
+            table[name] = (0, 0)
+            if name == 'data' and dense:
+                table[name] = (_align(file), 8 * nnz)
+                for rows in row_panels(num_constraints, num_variables, 8, memory_budget):
+                    panel = constraint_matrix[rows]
+                    panel = panel.toarray() if sp.issparse(panel) else panel
+                    np.ascontiguousarray(panel, dtype='<f8').tofile(file)
+            elif arrays.get(name) is not None:
+                # tofile writes the array buffer directly, without an intermediate bytes copy
+                table[name] = (_align(file), arrays[name].nbytes)
+                np.ascontiguousarray(arrays[name]).tofile(file)
+        file.seek(0)
+        file.write(_HEADER.pack(MAGIC, VERSION, flags, num_constraints, num_variables, nnz))
+        for name in SECTIONS:
+            file.write(_ENTRY.pack(*table[name]))
+    os.replace(temporary_path, path)
+    logger.info("Wrote a %dx%d problem with %d stored entries to %s", num_constraints, num_variables, nnz, path)
+
+
+def read_problem(path: str, mmap: bool = True) -> LinearProgram:
+    """
+    Reads a problem written by write_problem without copying its arrays.
+
+    With mmap the file is memory-mapped and every array is a read-only view of the
+    mapping, so loading costs O(1) in the matrix size and pages are read from disk
+    as the solver touches them. Without it every section is read once into its own
+    read-only array, which the matrix then uses as is (scipy would copy CSR arrays
+    that view one buffer holding the whole file). Only the senses are converted, to
+    the list of strings the solver takes.
+
+    Args:
+        path (str): File written by write_problem.
+        mmap (bool): Memory-map the file instead of reading it into memory.
+
+    Returns:
+        LinearProgram: The problem.
+
+    Raises:
+        ValueError: If the file is not a problem file of a supported version or is truncated.
+    """
+    table_end = _HEADER.size + _ENTRY.size * len(SECTIONS)
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size < table_end:
+            raise ValueError(f"{path} is too short to be a problem file.")
+        head = file.read(table_end)
+        magic, version, flags, num_constraints, num_variables, nnz = _HEADER.unpack_from(head)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a problem file.")
+        if version != VERSION:
+            raise ValueError(f"Unsupported problem file version {version}.")
+
+        index_dtype = np.dtype('<i8' if flags & FLAG_INT64_INDEX else '<i4')
+        dense = bool(flags & FLAG_DENSE)
+        expected = {
+            'c': ('<f8', num_variables),
+            'b': ('<f8', num_constraints),
+            'senses': (np.int8, num_constraints),
+            'indptr': (index_dtype, 0 if dense else num_constraints + 1),
+            'indices': (index_dtype, 0 if dense else nnz),
+            'data': ('<f8', nnz),
+            'lb': ('<f8', num_variables if flags & FLAG_LB else 0),
+            'ub': ('<f8', num_variables if flags & FLAG_UB else 0),
+        }
+        raw = np.memmap(path, dtype=np.uint8, mode='r') if mmap else None
+        arrays = {}
+        for position, name in enumerate(SECTIONS):
+            offset, nbytes = _ENTRY.unpack_from(head, _HEADER.size + _ENTRY.size * position)
+            dtype, count = np.dtype(expected[name][0]), expected[name][1]
+            if nbytes != count * dtype.itemsize or offset + nbytes > size:
+                raise ValueError(f"Section {name!r} of {path} is truncated or inconsistent with the header.")
+            if mmap:
+                arrays[name] = raw[offset:offset + nbytes].view(dtype)
+            else:
+                array = np.empty(count, dtype=dtype)
+                file.seek(offset)
+                if file.readinto(array) != nbytes:
+                    raise ValueError(f"Section {name!r} of {path} is truncated.")
+                array.flags.writeable = False
+                arrays[name] = array
+
+    if dense:
+        constraint_matrix = arrays['data'].reshape(num_constraints, num_variables)
+    else:
+        constraint_matrix = sp.csr_matrix((arrays['data'], arrays['indices'], arrays['indptr']),
+                                          shape=(num_constraints, num_variables), copy=False)
+    codes = arrays['senses']
+    if codes.size and codes.max() >= len(SENSES):
+        raise ValueError(f"{path} holds an unknown constraint sense code.")
+    logger.info("Read a %dx%d problem with %d stored entries from %s", num_constraints, num_variables, nnz, path)
+    return LinearProgram(
+        objective_coeffs=arrays['c'],
+        constraint_matrix=constraint_matrix,
+        rhs_values=arrays['b'],
+        senses=[SENSES[code] for code in codes.tolist()],
+        problem_type='min' if flags & FLAG_MIN else 'max',
+        lb=arrays['lb'] if flags & FLAG_LB else None,
+        ub=arrays['ub'] if flags & FLAG_UB else None,
+    )
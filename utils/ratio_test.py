@@ -0,0 +1,153 @@
+import numpy as np
+from typing import Optional
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Consecutive zero-step pivots after which the right-hand side is perturbed
+DEGENERATE_PIVOT_LIMIT = 20
+
+def calculate_ratios(tableau: np.ndarray, entering_col_index: int, pivot_tol: float = 1e-9) -> np.ndarray:
+    """
+    Computes the minimum-ratio test ratios RHS / column for every constraint row.
+
+    Rows whose entry in the entering column is not larger than `pivot_tol` cannot
+    limit the step and get a ratio of np.inf.
+    """
+    logger.debug("Calculating ratios for entering column %d", entering_col_index)
+    column = tableau[1:, entering_col_index]
+    eligible = column > pivot_tol
+    ratios = np.full(column.shape, np.inf)
+    ratios[eligible] = tableau[1:, -1][eligible] / column[eligible]
+    return ratios
+
+
+def harris_ratio_test(
+    column: np.ndarray,
+    rhs: np.ndarray,
+    feasibility_tol: float = 1e-9,
+    pivot_tol: float = 1e-9,
+    blocking: Optional[np.ndarray] = None,
+    lower: Optional[np.ndarray] = None,
+    upper: Optional[np.ndarray] = None
+) -> Optional[int]:
+    """
+    Chooses the leaving row with Harris' two-pass ratio test.
+
+    The first pass computes the largest step that keeps every basic variable within
+    feasibility_tol of its bounds. The second pass picks, among the rows whose exact
+    ratio does not exceed that step, the one with the largest pivot element. Preferring
+    large pivots keeps the basis well conditioned and breaks the ties that make
+    degenerate problems stall; remaining ties go to the lowest row.
+
+    Basic variables change by -step * column: a positive entry moves the variable
+    towards its lower bound and a negative entry towards its upper bound.
+
+    Args:
+        column (np.ndarray): Entering column in the current basis (constraint rows only).
+        rhs (np.ndarray): Current values of the basic variables.
+        feasibility_tol (float): How far a basic variable may move past a bound.
+        pivot_tol (float): Smallest entry accepted as a pivot.
+        blocking (Optional[np.ndarray]): Rows that must leave if their entry is nonzero
+            (e.g. artificial variables basic at zero in Phase II).
+        lower (Optional[np.ndarray]): Lower bounds of the basic variables (default 0; -inf never blocks).
+        upper (Optional[np.ndarray]): Upper bounds of the basic variables (default inf).
+
+    Returns:
+        Optional[int]: Index of the leaving row among the constraint rows, or None if no
+        basic variable limits the step (the problem is unbounded in that direction).
+    """
+    if blocking is not None:
+        blocked = blocking & (np.abs(column) > pivot_tol)
+        if np.any(blocked):
+            return int(np.argmax(np.where(blocked, np.abs(column), -np.inf)))
+
+    decreasing = column > pivot_tol
+    if lower is not None:
+        decreasing &= np.isfinite(lower)
+    increasing = column < -pivot_tol
+    increasing = increasing & np.isfinite(upper) if upper is not None else np.zeros_like(increasing)
+    eligible = decreasing | increasing
+    if not np.any(eligible):
+        return None
+
+    # Distance of each blocking basic variable to the bound it moves towards
+    distance = np.full(column.shape, np.inf)
+    distance[decreasing] = np.maximum(rhs[decreasing] - (0.0 if lower is None else lower[decreasing]), 0.0)
+    if upper is not None:
+        distance[increasing] = np.maximum(upper[increasing] - rhs[increasing], 0.0)
+    magnitude = np.abs(column)
+
+    # Pass 1: step bound with every basic variable allowed slightly past its bound
+    relaxed = np.full(column.shape, np.inf)
+    relaxed[eligible] = (distance[eligible] + feasibility_tol) / magnitude[eligible]
+    max_step = relaxed.min()
+
+    # Pass 2: the largest pivot among the rows that block within that bound
+    ratios = np.full(column.shape, np.inf)
+    ratios[eligible] = distance[eligible] / magnitude[eligible]
+    candidates = ratios <= max_step
+    return int(np.argmax(np.where(candidates, magnitude, -np.inf)))
+
+
+class Perturbation:
+    """
+    Right-hand side perturbation against cycling and stalling on degenerate vertices.
+
+    After DEGENERATE_PIVOT_LIMIT consecutive zero-step pivots, every basic variable
+    is shifted by a small random positive amount, which makes ties in the ratio test
+    vanish. The shift is tracked through each pivot like any tableau column, so it can
+    be subtracted exactly at the end of the phase; any basic variable that is then
+    slightly negative is repaired with dual simplex.
+    """
+
+    def __init__(self, scale: float = 1e-7, seed: int = 0):
+        self.scale = scale
+        self.rng = np.random.default_rng(seed)
+        self.shift: Optional[np.ndarray] = None
+        self.degenerate_pivots = 0
+
+    @property
+    def active(self) -> bool:
+        return self.shift is not None
+
+    def record_step(self, step: float, feasibility_tol: float) -> bool:
+        """Counts consecutive degenerate pivots. Returns True when the limit is reached and no perturbation is active."""
+        self.degenerate_pivots = self.degenerate_pivots + 1 if step <= feasibility_tol else 0
+        return not self.active and self.degenerate_pivots >= DEGENERATE_PIVOT_LIMIT
+
+    def apply(self, values: np.ndarray, upper: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Shifts the basic values (constraint rows only) and returns the shift that was added.
+
+        Values are moved away from the nearer of their bounds: up from zero, or down from
+        `upper` for basic variables closer to their upper bound.
+        """
+        shift = self.scale * (1.0 + np.abs(values)) * self.rng.uniform(0.5, 1.0, values.shape)
+        if upper is not None:
+            shift = np.where(upper - values < values, -shift, shift)
+        self.shift = np.concatenate([[0.0], shift])
+        self.degenerate_pivots = 0
+        logger.info("Degenerate stall detected, perturbing %d right-hand side values", len(values))
+        return shift
+
+    def pivot(self, entering_column: np.ndarray, leaving_row: int) -> None:
+        """Applies a pivot on `leaving_row` (tableau row index) to the tracked shift, given the entering column before the pivot."""
+        if self.shift is None:
+            return
+        self.shift[leaving_row] /= entering_column[leaving_row]
+        step = self.shift[leaving_row]
+        self.shift -= entering_column * step
+        self.shift[leaving_row] = step
+
+    def negate(self, row: int) -> None:
+        """Follows a row of the tableau (tableau row index) being multiplied by -1."""
+        if self.shift is not None:
+            self.shift[row] = -self.shift[row]
+
+    def remove(self) -> np.ndarray:
+        """Returns the tracked shift for all tableau rows (objective row first) and deactivates the perturbation."""
+        shift, self.shift = self.shift, None
+        self.degenerate_pivots = 0
+        return shift
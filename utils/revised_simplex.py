@@ -0,0 +1,500 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import lu_factor, lu_solve, LinAlgWarning
+from scipy.sparse.linalg import splu
+from typing import List, Optional, Tuple
+from utils.basis import Basis
+from utils.bounds import transform_bounds
+from utils.pricing import PricingRule, get_pricing_rule
+from utils.out_of_core import DEFAULT_MEMORY_BUDGET, column_norms as structural_column_norms
+from utils.ratio_test import Perturbation, harris_ratio_test
+import warnings
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class BasisFactorization:
+    """
+    LU factorization of the basis matrix with product-form (eta) updates.
+
+    Instead of updating a full tableau, the revised simplex method only keeps
+    B = LU for the current basis. Each basis change appends one eta vector, and
+    after `refactor_frequency` updates the basis is factorized from scratch to
+    bound both the eta file length and the accumulated rounding error.
+    Sparse basis matrices are factorized with SuperLU so fill-in stays sparse.
+    """
+
+    def __init__(self, basis_matrix: np.ndarray | sp.spmatrix, refactor_frequency: int = 50):
+        self.refactor_frequency = refactor_frequency
+        self.factorize(basis_matrix)
+
+    def factorize(self, basis_matrix: np.ndarray | sp.spmatrix) -> None:
+        """Factorizes the basis from scratch. Raises np.linalg.LinAlgError if it is singular."""
+        if sp.issparse(basis_matrix):
+            try:
+                self.lu = splu(sp.csc_matrix(basis_matrix))
+            except RuntimeError as e:
+                raise np.linalg.LinAlgError(str(e)) from e
+        else:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', LinAlgWarning)
+                self.lu = lu_factor(basis_matrix)
+            if np.any(np.abs(np.diag(self.lu[0])) <= 1e-12 * max(1.0, np.abs(self.lu[0]).max())):
+                raise np.linalg.LinAlgError("Basis matrix is singular")
+        self.etas: List[Tuple[int, np.ndarray]] = []
+        logger.debug("Basis factorized (%d x %d)", basis_matrix.shape[0], basis_matrix.shape[1])
+
+    @property
+    def needs_refactor(self) -> bool:
+        return len(self.etas) >= self.refactor_frequency
+
+    def ftran(self, column: np.ndarray) -> np.ndarray:
+        """Solves B d = column."""
+        result = self._solve(column, transpose=False)
+        for row, eta in self.etas:
+            pivot_value = result[row]
+            if pivot_value != 0:
+                result += eta * pivot_value
+                result[row] -= pivot_value
+        return result
+
+    def btran(self, row_vector: np.ndarray) -> np.ndarray:
+        """Solves y^T B = row_vector^T."""
+        result = np.array(row_vector, dtype=float)
+        for row, eta in reversed(self.etas):
+            result[row] = eta @ result
+        return self._solve(result, transpose=True)
+
+    def _solve(self, vector: np.ndarray, transpose: bool) -> np.ndarray:
+        if isinstance(self.lu, tuple):
+            return lu_solve(self.lu, vector, trans=1 if transpose else 0)
+        return self.lu.solve(np.asarray(vector, dtype=float), trans='T' if transpose else 'N')
+
+    def update(self, leaving_row: int, entering_column: np.ndarray) -> None:
+        """Records the basis change where `entering_column` (= B^-1 a_q) replaces row `leaving_row`."""
+        pivot_element = entering_column[leaving_row]
+        eta = -entering_column / pivot_element
+        eta[leaving_row] = 1.0 / pivot_element
+        self.etas.append((leaving_row, eta))
+
+
+def revised_simplex(
+    objective_coeffs: np.ndarray,
+    constraint_matrix: np.ndarray | sp.spmatrix,
+    rhs_values: np.ndarray,
+    senses: List[str],
+    problem_type: str = 'max',
+    refactor_frequency: int = 50,
+    tol: float = 1e-9,
+    initial_basis: Optional[Basis] = None,
+    return_basis: bool = False,
+    pricing: str | PricingRule = 'dantzig',
+    pivot_tol: float = 1e-9,
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET
+) -> tuple:
+    """
+    Solves a linear programming problem with the two-phase revised simplex method.
+
+    Only an LU factorization of the basis is maintained. Reduced costs and the
+    entering column are computed on demand from the original constraint matrix,
+    so each iteration costs a few triangular solves plus one pass over A for
+    pricing instead of a dense (m+1) x (n+m) tableau update. A scipy.sparse
+    constraint matrix stays sparse throughout, including the basis matrix. A float64
+    np.memmap (e.g. from np.load with mmap_mode='r') is used in place and only read,
+    so a dense matrix larger than RAM is streamed from disk once per pricing pass.
+
+    Variable bounds are handled by the bounded-variable method: a nonbasic variable
+    sits at its lower or its upper bound, the ratio test also stops basic variables
+    at their upper bounds, and an entering variable that reaches its own opposite
+    bound first simply flips without a basis change. Free variables are never split.
+
+    Args:
+        objective_coeffs (np.ndarray): Objective function coefficients.
+        constraint_matrix (np.ndarray | sp.spmatrix): Dense or CSR/CSC constraint coefficient matrix.
+        rhs_values (np.ndarray): Right-hand side values.
+        senses (List[str]): List of strings for each constraint ('<=', '>=', '=').
+        problem_type (str): 'max' for maximization, 'min' for minimization.
+        refactor_frequency (int): Number of eta updates before the basis is refactorized.
+        tol (float): Tolerance used for pricing and feasibility; basic variables may drop
+            this far below zero in the Harris ratio test.
+        initial_basis (Optional[Basis]): Basis from an earlier solve. If it is primal
+            feasible the solve continues with primal simplex, if it is only dual feasible
+            (e.g. after an RHS change) with dual simplex; otherwise it is ignored.
+        return_basis (bool): Append the optimal Basis (None if not optimal) to the result.
+        pricing (str | PricingRule): Entering-column rule, see utils.pricing. With partial
+            pricing only the requested segment of A^T y is computed per iteration.
+        pivot_tol (float): Smallest entry of the entering column accepted as a pivot.
+        lb (Optional[np.ndarray]): Variable lower bounds (-inf for none), default 0.
+        ub (Optional[np.ndarray]): Variable upper bounds (inf for none), default inf.
+        memory_budget (int): Scratch bytes per row panel when computing steepest-edge norms.
+
+    Returns:
+        tuple: Status ('optimal', 'unbounded' or 'infeasible'), the optimal solution and
+        the optimal objective value, followed by the Basis if return_basis is True.
+    """
+    logger.info("Starting revised simplex method")
+
+    # Bounds are shifted or mirrored so every variable is in [0, u] or free, see utils.bounds
+    transform = None
+    if lb is not None or ub is not None:
+        objective_coeffs, constraint_matrix, rhs_values, transform = transform_bounds(
+            objective_coeffs, constraint_matrix, rhs_values, lb, ub
+        )
+    original_costs = np.asarray(objective_coeffs, dtype=float) if transform is None else objective_coeffs * transform.sign
+
+    is_sparse = sp.issparse(constraint_matrix)
+    if is_sparse:
+        # Column access dominates (entering columns, basis assembly), so keep CSC
+        constraint_matrix = sp.csc_matrix(constraint_matrix, dtype=float)
+    else:
+        constraint_matrix = np.asarray(constraint_matrix, dtype=float)
+    rhs_values = np.asarray(rhs_values, dtype=float)
+    num_constraints, num_original_vars = constraint_matrix.shape
+
+    # Work with a minimization objective internally
+    costs = np.asarray(objective_coeffs, dtype=float)
+    if problem_type == 'max':
+        costs = -costs
+
+    # Column layout: structural [0, n), logical (slack/surplus) [n, n+m), artificial [n+m, n+2m).
+    # Logical and artificial columns are signed unit vectors and never stored as matrices.
+    logical_signs = np.array([1.0 if sense == '<=' else -1.0 if sense == '>=' else 0.0 for sense in senses])
+    artificial_signs = np.where(rhs_values >= 0, 1.0, -1.0)
+    logical_start = num_original_vars
+    artificial_start = num_original_vars + num_constraints
+
+    def column(j: int) -> np.ndarray:
+        if j < logical_start:
+            if is_sparse:
+                start, end = constraint_matrix.indptr[j], constraint_matrix.indptr[j + 1]
+                dense_column = np.zeros(num_constraints)
+                dense_column[constraint_matrix.indices[start:end]] = constraint_matrix.data[start:end]
+                return dense_column
+            return constraint_matrix[:, j]
+        unit = np.zeros(num_constraints)
+        if j < artificial_start:
+            unit[j - logical_start] = logical_signs[j - logical_start]
+        else:
+            unit[j - artificial_start] = artificial_signs[j - artificial_start]
+        return unit
+
+    def basis_matrix(basis: np.ndarray) -> np.ndarray | sp.csc_matrix:
+        if not is_sparse:
+            return np.column_stack([column(j) for j in basis])
+        # Assemble B in CSC form: structural columns are sliced from A, logicals are single entries
+        rows, cols, values = [], [], []
+        for position, j in enumerate(basis):
+            if j < logical_start:
+                start, end = constraint_matrix.indptr[j], constraint_matrix.indptr[j + 1]
+                rows.append(constraint_matrix.indices[start:end])
+                values.append(constraint_matrix.data[start:end])
+            elif j < artificial_start:
+                rows.append([j - logical_start])
+                values.append([logical_signs[j - logical_start]])
+            else:
+                rows.append([j - artificial_start])
+                values.append([artificial_signs[j - artificial_start]])
+            cols.append(np.full(len(rows[-1]), position))
+        return sp.csc_matrix(
+            (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(num_constraints, num_constraints)
+        )
+
+    # Start from the slack basis wherever the slack can absorb the RHS, artificials elsewhere
+    basis = np.empty(num_constraints, dtype=int)
+    for i in range(num_constraints):
+        if logical_signs[i] != 0 and rhs_values[i] * logical_signs[i] >= 0:
+            basis[i] = logical_start + i
+        else:
+            basis[i] = artificial_start + i
+
+    factorization = BasisFactorization(basis_matrix(basis), refactor_frequency)
+    basic_values = factorization.ftran(rhs_values)
+    cold_start = (basis.copy(), factorization, basic_values)
+
+    phase_two_costs = np.zeros(artificial_start + num_constraints)
+    phase_two_costs[:num_original_vars] = costs
+
+    # Bounds of every column (only structural ones can be boxed or free) and which
+    # nonbasic columns sit at their upper bound instead of zero
+    column_upper = np.full(artificial_start + num_constraints, np.inf)
+    column_free = np.zeros(artificial_start + num_constraints, dtype=bool)
+    if transform is not None:
+        column_upper[:num_original_vars] = transform.upper
+        column_free[:num_original_vars] = transform.free
+    at_upper = np.zeros(artificial_start + num_constraints, dtype=bool)
+    boxed = np.isfinite(column_upper) & (column_upper > 0)
+
+    # Candidates for entering the basis: structural columns that can move and existing logicals
+    enterable = np.concatenate([column_upper[:num_original_vars] > 0, logical_signs != 0])
+
+    def bounded_rhs() -> np.ndarray:
+        # b minus the contribution of the nonbasic variables at their upper bound
+        if not np.any(at_upper):
+            return rhs_values
+        columns = np.flatnonzero(at_upper)
+        return rhs_values - constraint_matrix[:, columns] @ column_upper[columns]
+
+    def basic_bounds() -> Tuple[np.ndarray, np.ndarray]:
+        return np.where(column_free[basis], -np.inf, 0.0), column_upper[basis]
+
+    def primal_infeasible() -> bool:
+        lower, upper = basic_bounds()
+        return bool(np.any(basic_values < lower - tol) or np.any(basic_values > upper + tol))
+
+    def result(status: str, solution: Optional[np.ndarray] = None, objective_value: Optional[float] = None) -> tuple:
+        if not return_basis:
+            return status, solution, objective_value
+        optimal_basis = None
+        if status == 'optimal':
+            upper_variables = np.flatnonzero(at_upper[:num_original_vars]) if transform is not None else None
+            optimal_basis = Basis(basis.copy(), num_original_vars, num_constraints, upper_variables)
+        return status, solution, objective_value, optimal_basis
+
+    def reduced_costs_of(phase_costs: np.ndarray, duals: np.ndarray, columns: np.ndarray | slice) -> np.ndarray:
+        if isinstance(columns, slice):
+            reduced_costs = np.empty(artificial_start)
+            reduced_costs[:logical_start] = phase_costs[:logical_start] - constraint_matrix.T @ duals
+            reduced_costs[logical_start:] = -logical_signs * duals
+            return reduced_costs[columns]
+        reduced_costs = np.empty(len(columns))
+        structural = columns < logical_start
+        reduced_costs[structural] = phase_costs[columns[structural]] - constraint_matrix[:, columns[structural]].T @ duals
+        logical_rows = columns[~structural] - logical_start
+        reduced_costs[~structural] = -logical_signs[logical_rows] * duals[logical_rows]
+        return reduced_costs
+
+    def pricer(phase_costs: np.ndarray):
+        # Duals from the basis once per iteration, reduced costs of any subset of candidate columns on demand.
+        # Prices are signed so that negative means improving: a variable at its upper bound improves
+        # by decreasing, and a free variable in whichever direction its reduced cost favours.
+        duals = factorization.btran(phase_costs[basis])
+        eligible = enterable.copy()
+        eligible[basis[basis < artificial_start]] = False
+
+        def price(columns: np.ndarray | slice) -> np.ndarray:
+            if not isinstance(columns, slice):
+                columns = np.asarray(columns)
+            reduced_costs = reduced_costs_of(phase_costs, duals, columns)
+            if transform is not None:
+                reduced_costs = np.where(at_upper[:artificial_start][columns], -reduced_costs, reduced_costs)
+                reduced_costs = np.where(column_free[:artificial_start][columns], -np.abs(reduced_costs), reduced_costs)
+            return np.where(eligible[columns], reduced_costs, 0.0)
+        price.duals = duals
+        return price
+
+    def project(vector: np.ndarray) -> np.ndarray:
+        # v^T B^-1 A for the structural and logical columns, from one BTRAN
+        multipliers = factorization.btran(vector)
+        return np.concatenate([constraint_matrix.T @ multipliers, logical_signs * multipliers])
+
+    # Degenerate stalls perturb the basic values; the shift is tracked in basis coordinates
+    perturbation = Perturbation()
+
+    def refactor() -> None:
+        nonlocal basic_values
+        factorization.factorize(basis_matrix(basis))
+        basic_values = factorization.ftran(bounded_rhs())
+        if perturbation.active:
+            basic_values += perturbation.shift[1:]
+
+    def nonbasic_value(j: int) -> float:
+        return column_upper[j] if at_upper[j] else 0.0
+
+    def flip_dual_infeasible(phase_costs: np.ndarray) -> None:
+        # A boxed nonbasic variable can sit at either bound, so it is moved to the one its reduced cost favours
+        nonlocal basic_values
+        if not np.any(boxed):
+            return
+        reduced_costs = np.zeros(artificial_start + num_constraints)
+        reduced_costs[:artificial_start] = pricer(phase_costs)(slice(None))
+        flips = boxed & (reduced_costs < -tol)
+        flips[basis] = False
+        if np.any(flips):
+            at_upper[flips] = ~at_upper[flips]
+            basic_values = factorization.ftran(bounded_rhs())
+
+    def run_dual(phase_costs: np.ndarray) -> str:
+        nonlocal basic_values
+        iteration = 0
+        while True:
+            iteration += 1
+            if factorization.needs_refactor:
+                refactor()
+
+            # The basic variable furthest outside its bounds leaves at the bound it violates
+            lower, upper = basic_bounds()
+            below, above = lower - basic_values, basic_values - upper
+            leaving_row = int(np.argmax(np.maximum(below, above)))
+            if max(below[leaving_row], above[leaving_row]) <= tol:
+                logger.debug("Dual simplex finished after %d iterations", iteration)
+                return 'optimal'
+            increase = below[leaving_row] > above[leaving_row]
+
+            # Row of B^-1 A for the leaving variable, from one BTRAN. The entering variable
+            # must move within its bounds in the direction that pushes the leaving one back.
+            unit = np.zeros(num_constraints)
+            unit[leaving_row] = 1.0
+            pivot_row = project(unit) if increase else -project(unit)
+            moves_up = ~at_upper[:artificial_start]
+            candidates = enterable & (
+                (moves_up & (pivot_row < -tol)) | ((at_upper[:artificial_start] | column_free[:artificial_start]) & (pivot_row > tol))
+            )
+            candidates[basis[basis < artificial_start]] = False
+            if not np.any(candidates):
+                logger.warning("Problem is infeasible: no eligible entry in dual pivot row %d", leaving_row)
+                return 'infeasible'
+
+            # Dual ratio test keeps every reduced cost on the side its bound status requires
+            price = pricer(phase_costs)
+            reduced_costs = reduced_costs_of(phase_costs, price.duals, slice(None))
+            ratios = np.full(artificial_start, np.inf)
+            ratios[candidates] = np.abs(reduced_costs[candidates]) / np.abs(pivot_row[candidates])
+            entering = int(np.argmin(ratios))
+            logger.debug("Dual step: entering column %d, leaving row %d", entering, leaving_row)
+
+            direction = factorization.ftran(column(entering))
+            target = lower[leaving_row] if increase else upper[leaving_row]
+            change = (basic_values[leaving_row] - target) / direction[leaving_row]
+            leaving_column = basis[leaving_row]
+            basic_values -= change * direction
+            basic_values[leaving_row] = nonbasic_value(entering) + change
+            at_upper[entering] = False
+            at_upper[leaving_column] = not increase
+            basis[leaving_row] = entering
+            factorization.update(leaving_row, direction)
+
+    # Warm start: factorize the given basis and continue from whichever side is feasible
+    if initial_basis is not None:
+        if initial_basis.matches(num_original_vars, num_constraints) and np.all(
+            (initial_basis.basic_variables >= 0) & (initial_basis.basic_variables < artificial_start + num_constraints)
+        ):
+            try:
+                basis[:] = initial_basis.basic_variables
+                if initial_basis.at_upper is not None:
+                    at_upper[np.asarray(initial_basis.at_upper, dtype=int)] = True
+                    at_upper &= boxed
+                    at_upper[basis] = False
+                factorization = BasisFactorization(basis_matrix(basis), refactor_frequency)
+                basic_values = factorization.ftran(bounded_rhs())
+                if primal_infeasible():
+                    flip_dual_infeasible(phase_two_costs)
+                    if np.any(pricer(phase_two_costs)(slice(None)) < -tol):
+                        raise ValueError("neither primal nor dual feasible")
+                    if run_dual(phase_two_costs) == 'infeasible':
+                        return result('infeasible')
+                    if np.any(basic_values[basis >= artificial_start] > tol):
+                        raise ValueError("artificial variables left nonzero")
+                logger.info("Warm start from the given basis")
+            except (np.linalg.LinAlgError, ValueError) as e:
+                logger.warning("Initial basis cannot be used (%s), starting from scratch", e)
+                basis[:], factorization, basic_values = cold_start
+                at_upper[:] = False
+        else:
+            logger.warning("Initial basis does not match the problem, starting from scratch")
+
+    # Pricing state (e.g. edge weights) carries over from Phase I to Phase II since the basis does
+    # not change in between. Steepest-edge norms are exact when the start basis is all logical/artificial.
+    pricing_rule = get_pricing_rule(pricing)
+    column_norms = None
+    if pricing_rule.needs_column_norms and np.all(basis >= logical_start):
+        column_norms = np.concatenate([structural_column_norms(constraint_matrix, memory_budget), np.abs(logical_signs)])
+    pricing_rule.reset(artificial_start, column_norms)
+
+    def run_phase(phase_costs: np.ndarray, allow_artificial_basis: bool) -> str:
+        nonlocal basic_values
+        iteration = 0
+        while True:
+            iteration += 1
+            if factorization.needs_refactor:
+                refactor()
+
+            entering = pricing_rule.select_entering(pricer(phase_costs), tol)
+            if entering is None:
+                if perturbation.active:
+                    # Remove the perturbation and repair what it was hiding with dual simplex steps
+                    basic_values -= perturbation.remove()[1:]
+                    if primal_infeasible():
+                        if run_dual(phase_costs) == 'infeasible':
+                            return 'infeasible'
+                        continue
+                logger.debug("Phase finished after %d iterations", iteration)
+                return 'optimal'
+
+            # Ratio column computed only for the entering variable. Artificials left in the
+            # basis at zero must leave before they can turn nonzero.
+            direction = factorization.ftran(column(entering))
+            if column_free[entering]:
+                sign = 1.0 if reduced_costs_of(phase_costs, factorization.btran(phase_costs[basis]), np.array([entering]))[0] < 0 else -1.0
+            else:
+                sign = -1.0 if at_upper[entering] else 1.0
+            # Basic variables change by -step * moving as the entering variable moves by sign * step
+            moving = sign * direction
+            lower, upper = basic_bounds()
+            blocking = None if allow_artificial_basis else basis >= artificial_start
+            leaving_row = harris_ratio_test(moving, basic_values, tol, pivot_tol, blocking, lower, upper)
+            entering_range = np.inf if column_free[entering] else column_upper[entering]
+
+            if leaving_row is None:
+                step = np.inf
+            elif not allow_artificial_basis and basis[leaving_row] >= artificial_start:
+                step = max(basic_values[leaving_row], 0.0) / moving[leaving_row] if moving[leaving_row] > 0 else 0.0
+            elif moving[leaving_row] > 0:
+                step = max(basic_values[leaving_row] - lower[leaving_row], 0.0) / moving[leaving_row]
+            else:
+                step = max(upper[leaving_row] - basic_values[leaving_row], 0.0) / -moving[leaving_row]
+
+            if np.isfinite(entering_range) and entering_range <= step:
+                # The entering variable reaches its opposite bound first: no basis change
+                logger.debug("Bound flip of column %d", entering)
+                basic_values -= entering_range * moving
+                at_upper[entering] = not at_upper[entering]
+                continue
+            if leaving_row is None:
+                logger.warning("Problem is unbounded: no basic variable limits the entering column")
+                return 'unbounded'
+            logger.debug("Entering column %d, leaving row %d, step %s", entering, leaving_row, step)
+
+            leaving_column = basis[leaving_row]
+            pricing_rule.update(entering, leaving_row, leaving_column if leaving_column < artificial_start else None, direction, project)
+            perturbation.pivot(np.concatenate([[0.0], direction]), leaving_row + 1)
+
+            basic_values -= step * moving
+            basic_values[leaving_row] = nonbasic_value(entering) + sign * step
+            at_upper[entering] = False
+            at_upper[leaving_column] = moving[leaving_row] < 0 and bool(boxed[leaving_column])
+            basis[leaving_row] = entering
+            factorization.update(leaving_row, direction)
+            if perturbation.record_step(step, tol):
+                basic_values += perturbation.apply(basic_values, basic_bounds()[1])
+
+    # Phase I: minimize the sum of artificial variables (artificials basic at zero can stay for phase II)
+    if np.any(basic_values[basis >= artificial_start] > tol):
+        phase_one_costs = np.zeros(artificial_start + num_constraints)
+        phase_one_costs[artificial_start:] = 1.0
+        if run_phase(phase_one_costs, allow_artificial_basis=True) == 'infeasible':
+            return result('infeasible')
+        infeasibility = np.sum(basic_values[basis >= artificial_start])
+        if infeasibility > tol * max(1.0, np.abs(rhs_values).max()):
+            logger.warning("Problem is infeasible: phase I objective %s", infeasibility)
+            return result('infeasible')
+
+    # Phase II: optimize the real objective, artificials can only leave the basis
+    status = run_phase(phase_two_costs, allow_artificial_basis=False)
+    if status != 'optimal':
+        return result(status)
+
+    optimal_solution = np.where(at_upper[:num_original_vars], column_upper[:num_original_vars], 0.0)
+    structural = basis < logical_start
+    optimal_solution[basis[structural]] = basic_values[structural]
+    if transform is not None:
+        optimal_solution = transform.restore(optimal_solution)
+    optimal_objective_value = float(np.dot(original_costs, optimal_solution))
+
+    logger.info("Optimal solution: %s", optimal_solution)
+    logger.info("Optimal objective value: %s", optimal_objective_value)
+    return result('optimal', optimal_solution, optimal_objective_value)
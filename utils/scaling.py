@@ -0,0 +1,131 @@
+import numpy as np
+import scipy.sparse as sp
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+SCALING_METHODS = ('geometric', 'equilibrate', 'auto')
+
+@dataclass
+class Scaling:
+    """
+    Row and column scale factors for a constraint matrix, with the statistics of the scaling run.
+
+    The scaled problem has A' = R A S, b' = R b and c' = S c with R = diag(row_scale)
+    and S = diag(col_scale); variable bounds become S^-1 lb and S^-1 ub. Its solution maps back as x = S x' and its duals as
+    y = R y'; the objective value c'x' = c x needs no unscaling. All factors are
+    powers of two, so scaling and unscaling introduce no rounding error.
+    """
+    row_scale: np.ndarray
+    col_scale: np.ndarray
+    method: str
+    passes: int
+    ratio_before: float  # max |a_ij| / min |a_ij| over the nonzero entries
+    ratio_after: float
+
+    def apply(
+        self,
+        objective_coeffs: np.ndarray,
+        constraint_matrix: np.ndarray | sp.spmatrix,
+        rhs_values: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray | sp.spmatrix, np.ndarray]:
+        """Returns the scaled objective coefficients, constraint matrix (same format as the input) and right-hand sides."""
+        if sp.issparse(constraint_matrix):
+            scaled_matrix = (sp.diags(self.row_scale) @ constraint_matrix @ sp.diags(self.col_scale)).asformat(constraint_matrix.format)
+        else:
+            scaled_matrix = constraint_matrix * self.row_scale[:, None] * self.col_scale
+        return objective_coeffs * self.col_scale, scaled_matrix, rhs_values * self.row_scale
+
+    def scale_bounds(self, lb: Optional[np.ndarray], ub: Optional[np.ndarray]) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """Returns the variable bounds of the scaled problem (x' = x / col_scale); None stays None."""
+        return (None if lb is None else np.asarray(lb, dtype=float) / self.col_scale,
+                None if ub is None else np.asarray(ub, dtype=float) / self.col_scale)
+
+    def unscale_solution(self, solution: np.ndarray) -> np.ndarray:
+        """Maps a solution of the scaled problem back to the original variables."""
+        return solution * self.col_scale
+
+    def unscale_duals(self, duals: np.ndarray) -> np.ndarray:
+        """Maps dual values (one per constraint) of the scaled problem back to the original constraints."""
+        return duals * self.row_scale
+
+
+def _extremes(indices: np.ndarray, magnitudes: np.ndarray, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    # Largest and smallest entry magnitude per row (or column); empty ones report 1
+    largest = np.zeros(size)
+    smallest = np.full(size, np.inf)
+    np.maximum.at(largest, indices, magnitudes)
+    np.minimum.at(smallest, indices, magnitudes)
+    empty = largest == 0
+    largest[empty], smallest[empty] = 1.0, 1.0
+    return largest, smallest
+
+
+def _power_of_two(factors: np.ndarray) -> np.ndarray:
+    return np.exp2(np.round(np.log2(factors)))
+
+
+def compute_scaling(constraint_matrix: np.ndarray | sp.spmatrix, method: str = 'auto', max_passes: int = 20) -> Scaling:
+    """
+    Computes row and column scale factors that bring the matrix entries close to 1.
+
+    'geometric' alternately divides every row and then every column by the geometric
+    mean of its largest and smallest entry, until a pass improves the ratio between
+    the largest and smallest entry by less than 10%. 'equilibrate' scales every row
+    and then every column so its largest entry is 1. 'auto' runs the geometric passes
+    followed by one equilibration pass, which is the usual combination.
+
+    Args:
+        constraint_matrix (np.ndarray | sp.spmatrix): Dense or CSR/CSC constraint coefficient matrix.
+        method (str): 'geometric', 'equilibrate' or 'auto'.
+        max_passes (int): Maximum number of geometric scaling passes.
+
+    Returns:
+        Scaling: The scale factors and statistics.
+
+    Raises:
+        ValueError: If the method is not one of SCALING_METHODS.
+    """
+    if method not in SCALING_METHODS:
+        raise ValueError(f"Scaling must be one of {SCALING_METHODS}.")
+    num_constraints, num_variables = constraint_matrix.shape
+    entries = sp.coo_matrix(constraint_matrix)
+    nonzero = entries.data != 0
+    rows, cols = entries.row[nonzero], entries.col[nonzero]
+    magnitudes = np.abs(entries.data[nonzero]).astype(float)
+
+    row_scale = np.ones(num_constraints)
+    col_scale = np.ones(num_variables)
+
+    def scaled() -> np.ndarray:
+        return magnitudes * row_scale[rows] * col_scale[cols]
+
+    def ratio() -> float:
+        values = scaled()
+        return float(values.max() / values.min()) if values.size else 1.0
+
+    ratio_before = ratio()
+    passes = 0
+    if method in ('geometric', 'auto'):
+        current = ratio_before
+        while passes < max_passes:
+            passes += 1
+            largest, smallest = _extremes(rows, scaled(), num_constraints)
+            row_scale /= np.sqrt(largest * smallest)
+            largest, smallest = _extremes(cols, scaled(), num_variables)
+            col_scale /= np.sqrt(largest * smallest)
+            previous, current = current, ratio()
+            if current > 0.9 * previous:
+                break
+    if method in ('equilibrate', 'auto'):
+        passes += 1
+        row_scale /= _extremes(rows, scaled(), num_constraints)[0]
+        col_scale /= _extremes(cols, scaled(), num_variables)[0]
+
+    row_scale, col_scale = _power_of_two(row_scale), _power_of_two(col_scale)
+    scaling = Scaling(row_scale, col_scale, method, passes, ratio_before, ratio())
+    logger.info("Scaling (%s, %d passes): entry ratio %.3g -> %.3g", method, passes, scaling.ratio_before, scaling.ratio_after)
+    return scaling
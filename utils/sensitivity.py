@@ -0,0 +1,192 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import lu_factor, lu_solve, LinAlgWarning
+from scipy.sparse.linalg import splu
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from utils.basis import Basis, variable_columns
+import warnings
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+@dataclass
+class SensitivityReport:
+    """
+    Dual values and ranging information of an optimal basis.
+
+    Duals and reduced costs are derivatives of the objective value in the sense of
+    the problem: duals[i] is dz/db_i and reduced_costs[j] is dz/dx_j for a nonbasic
+    x_j leaving its bound (0 for basic variables). Slacks are the distance of each
+    constraint to its right-hand side in the feasible direction (b - Ax for '<=',
+    Ax - b for '>=', 0 for '='). The ranges are the intervals over which a single
+    b_i or c_j can move while the basis stays optimal; within them the objective
+    value changes linearly with slope duals[i] or x_j. On a degenerate vertex the
+    ranges are valid but may be narrower than the true ranges of the optimal value.
+    """
+    duals: np.ndarray
+    reduced_costs: np.ndarray
+    slacks: np.ndarray
+    rhs_ranges: np.ndarray  # Shape (m, 2): lowest and highest b_i
+    objective_ranges: np.ndarray  # Shape (n, 2): lowest and highest c_j
+
+
+def _step_range(direction: np.ndarray, lower_room: np.ndarray, upper_room: np.ndarray, tol: float) -> Tuple[float, float]:
+    # Interval of t for which -lower_room <= t * direction <= upper_room (rooms are nonnegative)
+    low, high = -np.inf, np.inf
+    rising, falling = direction > tol, direction < -tol
+    if np.any(rising):
+        high = min(high, np.min(upper_room[rising] / direction[rising]))
+        low = max(low, np.max(-lower_room[rising] / direction[rising]))
+    if np.any(falling):
+        high = min(high, np.min(-lower_room[falling] / direction[falling]))
+        low = max(low, np.max(upper_room[falling] / direction[falling]))
+    return low, high
+
+
+def sensitivity_analysis(
+    objective_coeffs: np.ndarray,
+    constraint_matrix: np.ndarray | sp.spmatrix,
+    rhs_values: np.ndarray,
+    senses: List[str],
+    problem_type: str,
+    basis: Basis,
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None,
+    tol: float = 1e-9
+) -> SensitivityReport:
+    """
+    Computes duals, reduced costs, slacks and RHS and objective ranging from an optimal basis.
+
+    Everything follows from one LU factorization of the basis matrix B of the
+    original (unscaled) problem, so no second solve of the primal or the dual is
+    needed: y = B^-T c_B, d_N = c_N - N^T y, RHS ranging moves x_B along B^-1 e_i
+    until a basic variable reaches a bound, and objective ranging moves d_N along
+    the row of B^-1 N of a basic variable until a nonbasic reduced cost changes sign.
+    A sparse problem is factorized with SuperLU, and B^-1 is never formed: its
+    columns and rows are solved for one at a time, and rows of B^-1 N only for
+    basic structural variables.
+
+    Args:
+        objective_coeffs (np.ndarray): Objective function coefficients.
+        constraint_matrix (np.ndarray | sp.spmatrix): Dense or CSR/CSC constraint coefficient matrix.
+        rhs_values (np.ndarray): Right-hand side values.
+        senses (List[str]): List of strings for each constraint ('<=', '>=', '=').
+        problem_type (str): 'max' for maximization, 'min' for minimization.
+        basis (Basis): Optimal basis returned by a solver with return_basis=True.
+        lb (Optional[np.ndarray]): Variable lower bounds (-inf allowed), default 0.
+        ub (Optional[np.ndarray]): Variable upper bounds (inf allowed), default inf.
+        tol (float): Entries of B^-1 columns and rows below this are treated as zero.
+
+    Returns:
+        SensitivityReport: The dual values and ranging information.
+    """
+    logger.info("Starting sensitivity analysis")
+    num_constraints, num_original_vars = constraint_matrix.shape
+    if not basis.matches(num_original_vars, num_constraints):
+        raise ValueError("The basis does not match the dimensions of the problem.")
+    lb = np.zeros(num_original_vars) if lb is None else np.asarray(lb, dtype=float)
+    ub = np.full(num_original_vars, np.inf) if ub is None else np.asarray(ub, dtype=float)
+    rhs_values = np.asarray(rhs_values, dtype=float)
+    logical_signs = np.array([1.0 if sense == '<=' else -1.0 if sense == '>=' else 0.0 for sense in senses])
+
+    # Min-form costs; slacks and artificials cost nothing
+    sense_sign = -1.0 if problem_type == 'max' else 1.0
+    costs = sense_sign * np.asarray(objective_coeffs, dtype=float)
+    basic = np.asarray(basis.basic_variables, dtype=int)
+    basic_costs = np.where(basic < num_original_vars, costs[np.minimum(basic, num_original_vars - 1)], 0.0)
+
+    # Nonbasic variables: structural ones and the slacks of inequality rows (nonbasic artificials are fixed at zero)
+    is_basic = np.zeros(num_original_vars + num_constraints, dtype=bool)
+    is_basic[basic[basic < num_original_vars + num_constraints]] = True
+    at_upper = np.zeros(num_original_vars, dtype=bool)
+    if basis.at_upper is not None:
+        at_upper[np.asarray(basis.at_upper, dtype=int)] = True
+    at_upper |= ~np.isfinite(lb) & np.isfinite(ub)  # Mirrored variables sit at their upper bound
+    free = ~np.isfinite(lb) & ~np.isfinite(ub)
+    nonbasic_values = np.where(at_upper, ub, np.where(free, 0.0, lb))
+
+    # Lower and upper bounds of every variable in the layout-independent numbering
+    lower = np.concatenate([lb, np.zeros(num_constraints), np.zeros(num_constraints)])
+    upper = np.concatenate([ub, np.full(num_constraints, np.inf), np.zeros(num_constraints)])
+
+    is_sparse = sp.issparse(constraint_matrix)
+    basis_matrix = variable_columns(basic, constraint_matrix, senses, sparse=is_sparse)
+    if is_sparse:
+        lu = splu(basis_matrix)
+    else:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', LinAlgWarning)
+            lu = lu_factor(basis_matrix)
+
+    def solve(vector: np.ndarray, transpose: bool = False) -> np.ndarray:
+        # B x = vector, or B^T x = vector
+        if is_sparse:
+            return lu.solve(np.asarray(vector, dtype=float), trans='T' if transpose else 'N')
+        return lu_solve(lu, vector, trans=1 if transpose else 0)
+
+    nonbasic_structural = np.flatnonzero(~is_basic[:num_original_vars])
+    shifted_rhs = rhs_values - constraint_matrix[:, nonbasic_structural] @ nonbasic_values[nonbasic_structural]
+    basic_values = solve(np.asarray(shifted_rhs, dtype=float).ravel())
+    solution = nonbasic_values.copy()
+    structural_rows = np.flatnonzero(basic < num_original_vars)
+    solution[basic[structural_rows]] = basic_values[structural_rows]
+
+    # Duals and reduced costs, in min form first
+    duals = solve(basic_costs, transpose=True)
+    reduced_costs = costs - np.asarray(constraint_matrix.T @ duals).ravel()
+    reduced_costs[basic[structural_rows]] = 0.0
+    activity = np.asarray(constraint_matrix @ solution).ravel()
+    slacks = np.where(logical_signs != 0, logical_signs * (rhs_values - activity), 0.0)
+
+    # RHS ranging: x_B + t B^-1 e_i must stay within the bounds of the basic variables
+    lower_room = np.maximum(basic_values - lower[basic], 0.0)
+    upper_room = np.maximum(upper[basic] - basic_values, 0.0)
+    rhs_ranges = np.empty((num_constraints, 2))
+    unit = np.zeros(num_constraints)
+    for i in range(num_constraints):
+        unit[i] = 1.0
+        low, high = _step_range(solve(unit), lower_room, upper_room, tol)
+        unit[i] = 0.0
+        rhs_ranges[i] = rhs_values[i] + low, rhs_values[i] + high
+
+    # Objective ranging, in min form: a nonbasic column at its lower bound needs d >= 0, at its upper bound d <= 0
+    movable_structural = nonbasic_structural[lb[nonbasic_structural] < ub[nonbasic_structural]]
+    slack_rows = np.flatnonzero((logical_signs != 0) & ~is_basic[num_original_vars:])
+    nonbasic = np.concatenate([movable_structural, num_original_vars + slack_rows])
+    nonbasic_reduced_costs = np.concatenate([reduced_costs[movable_structural],
+                                             -logical_signs[slack_rows] * duals[slack_rows]])
+    nonbasic_at_upper = np.concatenate([at_upper[movable_structural], np.zeros(len(slack_rows), dtype=bool)])
+    nonbasic_free = np.concatenate([free[movable_structural], np.zeros(len(slack_rows), dtype=bool)])
+    # Room of each reduced cost before it changes sign: d - t alpha >= 0 (lower) or <= 0 (upper)
+    room_down = np.where(nonbasic_at_upper, np.inf, np.maximum(nonbasic_reduced_costs, 0.0))
+    room_up = np.where(nonbasic_at_upper, np.maximum(-nonbasic_reduced_costs, 0.0), np.inf)
+    room_down[nonbasic_free] = room_up[nonbasic_free] = 0.0
+    nonbasic_rows = variable_columns(nonbasic, constraint_matrix, senses, sparse=is_sparse).T  # N^T, CSR when sparse
+
+    objective_ranges = np.empty((num_original_vars, 2))
+    row_of = {variable: row for row, variable in enumerate(basic)}
+    for j in range(num_original_vars):
+        if j in row_of:
+            # Reduced costs move by -t alpha when c_j moves by t, where alpha = (e_r^T B^-1) N
+            unit[row_of[j]] = 1.0
+            tableau_row = np.asarray(nonbasic_rows @ solve(unit, transpose=True)).ravel()
+            unit[row_of[j]] = 0.0
+            low, high = _step_range(tableau_row, room_up, room_down, tol)
+        elif lb[j] == ub[j]:
+            low, high = -np.inf, np.inf
+        elif free[j]:
+            low, high = 0.0, 0.0
+        elif at_upper[j]:
+            low, high = -np.inf, max(-reduced_costs[j], 0.0)
+        else:
+            low, high = -max(reduced_costs[j], 0.0), np.inf
+        objective_ranges[j] = costs[j] + low, costs[j] + high
+
+    if problem_type == 'max':
+        # Adding 0.0 turns the -0.0 of negated zeros into 0.0
+        duals, reduced_costs = -duals + 0.0, -reduced_costs + 0.0
+        objective_ranges = -objective_ranges[:, ::-1] + 0.0
+    logger.info("Sensitivity analysis complete")
+    return SensitivityReport(duals, reduced_costs, slacks, rhs_ranges, objective_ranges)
@@ -1,5 +1,7 @@
 import numpy as np
-from typing import List
+import scipy.sparse as sp
+from typing import List, Optional
+from utils.out_of_core import DEFAULT_MEMORY_BUDGET, memmap_array, row_panels
 import logging
 
 # Set up logging
@@ -10,8 +12,21 @@ def setup_tableau(
     constraint_matrix: np.ndarray,
     rhs_values: np.ndarray,
     senses: List[str],
-    problem_type: str = 'max'
+    problem_type: str = 'max',
+    dtype: np.dtype | type = np.float64,
+    row_signs: Optional[np.ndarray] = None,
+    memmap_dir: Optional[str] = None,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET
 ) -> np.ndarray:
+    """
+    Builds the initial tableau [c | 0; A | slack/surplus | artificial | b].
+
+    row_signs (+1/-1 per constraint, see rhs_sign_flips) are applied to the rows of
+    the constraint matrix as they are copied in, so a row-normalized problem needs
+    no normalized copy of the matrix. With memmap_dir the tableau is a np.memmap
+    backed by a temporary file in that directory (see utils.out_of_core), and a
+    dense matrix is copied in row panels of at most memory_budget bytes.
+    """
     logger.info("Setting up the initial tableau")
     
     num_constraints, num_original_vars = constraint_matrix.shape
@@ -27,31 +42,69 @@ def setup_tableau(
     num_artificial_vars = senses.count('=') + num_surplus_vars
 
     # Calculate the total number of variables in the tableau
-    num_total_vars = num_original_vars + num_slack_vars + num_artificial_vars
+    num_total_vars = num_original_vars + num_slack_vars + num_surplus_vars + num_artificial_vars
 
-    # Initialize the tableau with zeros
-    tableau = np.zeros((num_constraints + 1, num_total_vars + 1))
+    # Initialize the tableau with zeros; integer inputs are converted on assignment
+    shape = (num_constraints + 1, num_total_vars + 1)
+    tableau = np.zeros(shape, dtype=dtype) if memmap_dir is None else memmap_array(shape, dtype, memmap_dir)
 
     # Objective function row
     tableau[0, :num_original_vars] = -objective_coeffs  # Negate objective coefficients here
     tableau[0, -1] = 0  # Objective value
 
     # Constraint rows
+    if sp.issparse(constraint_matrix):
+        # Scatter the nonzeros directly instead of densifying the matrix first
+        coo = constraint_matrix.tocoo()
+        tableau[coo.row + 1, coo.col] = coo.data if row_signs is None else coo.data * row_signs[coo.row]
+    else:
+        for rows in row_panels(num_constraints, num_original_vars, np.dtype(np.float64).itemsize, memory_budget):
+            panel = constraint_matrix[rows] if row_signs is None else constraint_matrix[rows] * row_signs[rows, None]
+            tableau[rows.start + 1:rows.stop + 1, :num_original_vars] = panel
+    tableau[1:, -1] = rhs_values
+
     slack_surplus_index = num_original_vars
-    artificial_index = num_original_vars + num_slack_vars + num_surplus_vars # Modified artificial index calculation
+    artificial_index = num_original_vars + num_slack_vars + num_surplus_vars # Artificial columns follow all slack/surplus columns
     for i in range(num_constraints):
-        tableau[i + 1, :num_original_vars] = constraint_matrix[i, :]
-        tableau[i + 1, -1] = rhs_values[i]
-
         if senses[i] == '<=':
             tableau[i + 1, slack_surplus_index] = 1
             slack_surplus_index += 1
         elif senses[i] == '>=' or senses[i] == '=':
-            tableau[i + 1, artificial_index - num_surplus_vars] = 1 # Modified artificial variable placement
+            tableau[i + 1, artificial_index] = 1
             artificial_index += 1
             if senses[i] == '>=':
                 tableau[i + 1, slack_surplus_index] = -1
                 slack_surplus_index += 1
     
     logger.info("Initial tableau setup complete")
-    return tableau
\ No newline at end of file
+    return tableau
+
+
+def tableau_variable_indices(num_original_vars: int, senses: List[str]) -> np.ndarray:
+    """
+    Maps every tableau column built by setup_tableau to a layout-independent variable index.
+
+    Original variables keep their index j, the slack/surplus variable of row i is
+    num_original_vars + i and the artificial variable of row i is
+    num_original_vars + num_constraints + i. This is the layout used by the
+    revised engine, so a basis expressed in it can be reused by either engine.
+    """
+    num_constraints = len(senses)
+    slack_rows = [i for i, sense in enumerate(senses) if sense in ('<=', '>=')]
+    artificial_rows = [i for i, sense in enumerate(senses) if sense in ('>=', '=')]
+    return np.concatenate([
+        np.arange(num_original_vars),
+        num_original_vars + np.array(slack_rows, dtype=int),
+        num_original_vars + num_constraints + np.array(artificial_rows, dtype=int),
+    ])
+
+
+def starting_basis(num_original_vars: int, senses: List[str]) -> np.ndarray:
+    """Returns the tableau column that is basic in each constraint row of the tableau from setup_tableau."""
+    num_constraints = len(senses)
+    variable_indices = tableau_variable_indices(num_original_vars, senses)
+    column_of = {variable: column for column, variable in enumerate(variable_indices)}
+    return np.array([
+        column_of[num_original_vars + i] if sense == '<=' else column_of[num_original_vars + num_constraints + i]
+        for i, sense in enumerate(senses)
+    ], dtype=int)
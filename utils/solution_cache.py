@@ -0,0 +1,161 @@
+import numpy as np
+import scipy.sparse as sp
+import contextlib
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+def problem_key(
+    objective_coeffs: np.ndarray,
+    constraint_matrix: np.ndarray | sp.spmatrix,
+    rhs_values: np.ndarray,
+    senses: List[str],
+    problem_type: str,
+    **options: Any
+) -> str:
+    """
+    Stable hash of a problem and the solver options that affect its result.
+
+    The matrix is hashed in canonical CSR form (float64, sorted indices, no explicit
+    zeros), so a dense matrix and any sparse format of it, or integer and float
+    inputs, give the same key. Options are hashed by name; arrays by their float64
+    values, everything else by repr (so an object option such as a PricingRule
+    instance only matches itself).
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+
+    def feed(label: str, value: Any) -> None:
+        digest.update(label.encode())
+        if isinstance(value, np.ndarray) or (isinstance(value, (list, tuple)) and value and not isinstance(value[0], str)):
+            array = np.ascontiguousarray(value, dtype=np.float64) + 0.0  # Adding 0.0 turns -0.0 into 0.0
+            digest.update(repr(array.shape).encode())
+            digest.update(array.tobytes())
+        else:
+            digest.update(repr(value).encode())
+
+    matrix = sp.csr_matrix(constraint_matrix, dtype=np.float64)
+    matrix.sum_duplicates()
+    matrix.eliminate_zeros()
+    matrix.sort_indices()
+    feed('c', np.asarray(objective_coeffs))
+    feed('shape', matrix.shape)
+    feed('data', matrix.data)
+    feed('indices', matrix.indices.astype(np.int64))
+    feed('indptr', matrix.indptr.astype(np.int64))
+    feed('b', np.asarray(rhs_values))
+    feed('senses', [str(sense) for sense in senses])
+    feed('problem_type', str(problem_type))
+    for name in sorted(options):
+        feed(f'option:{name}', options[name])
+    return digest.hexdigest()
+
+
+class SolutionCache:
+    """
+    Memoized solve results: an in-memory LRU in front of an optional on-disk store.
+
+    The memory tier keeps the max_entries most recently used results. With a
+    directory, results are also pickled there (one file per key) and the least
+    recently used files are deleted once the store exceeds max_disk_bytes; a disk
+    hit is promoted back into memory. Results are returned as stored, so callers
+    should treat them as read-only. Only point the directory at a trusted
+    location, since the files are unpickled. All methods are thread-safe.
+    """
+
+    def __init__(self, max_entries: int = 128, directory: Optional[str] = None, max_disk_bytes: int = 256 * 2 ** 20):
+        if max_entries < 0:
+            raise ValueError("max_entries must be nonnegative.")
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def _remember(self, key: str, result: Any) -> None:
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached result for key, or None on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            if self.directory is not None:
+                try:
+                    with open(self._path(key), 'rb') as file:
+                        result = pickle.load(file)
+                    os.utime(self._path(key))  # Mark as recently used for eviction
+                except FileNotFoundError:
+                    result = None
+                except Exception as e:
+                    # Corrupt or stale (e.g. pickled by an older version of the code): a miss, and the file goes
+                    logger.warning("Discarding unreadable solution cache entry %s: %s", key, e)
+                    result = None
+                    with contextlib.suppress(OSError):
+                        os.remove(self._path(key))
+                if result is not None:
+                    self.hits += 1
+                    self.disk_hits += 1
+                    self._remember(key, result)
+                    return result
+            self.misses += 1
+            return None
+
+    def put(self, key: str, result: Any) -> None:
+        with self._lock:
+            self._remember(key, result)
+            if self.directory is not None:
+                # Write to a temporary file first so readers never see a partial pickle
+                temporary_path = f"{self._path(key)}.{threading.get_ident()}.tmp"
+                with open(temporary_path, 'wb') as file:
+                    pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temporary_path, self._path(key))
+                self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        files = [entry for entry in os.scandir(self.directory) if entry.name.endswith('.pkl')]
+        total = sum(entry.stat().st_size for entry in files)
+        for entry in sorted(files, key=lambda entry: entry.stat().st_mtime):
+            if total <= self.max_disk_bytes:
+                break
+            total -= entry.stat().st_size
+            os.remove(entry.path)
+            logger.debug("Evicted %s from the solution cache", entry.name)
+
+    def clear(self) -> None:
+        """Empties both tiers and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            if self.directory is not None:
+                for entry in os.scandir(self.directory):
+                    if entry.name.endswith('.pkl'):
+                        os.remove(entry.path)
+            self.hits = self.disk_hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Hit and miss counters and the number of results held in memory."""
+        with self._lock:
+            return {'hits': self.hits, 'disk_hits': self.disk_hits, 'misses': self.misses, 'entries': len(self._entries)}
+
@@ -1,5 +1,5 @@
 import numpy as np
-from typing import Tuple
+from typing import Optional, Tuple
 import logging
 
 # Set up logging
@@ -9,25 +9,47 @@ def extract_solution(
     tableau: np.ndarray,
     num_original_vars: int,
     num_constraints: int,
-    problem_type: str = 'max'
+    problem_type: str = 'max',
+    basis: Optional[np.ndarray] = None
 ) -> Tuple[np.ndarray, float]:
+    """
+    Reads the values of the original variables and the objective value off the tableau.
+
+    Args:
+        tableau (np.ndarray): Final tableau, original variables in the first columns.
+        num_original_vars (int): Number of original variables.
+        num_constraints (int): Number of constraints.
+        problem_type (str): 'max' for maximization, 'min' for minimization.
+        basis (Optional[np.ndarray]): Tableau column that is basic in each constraint row, as
+            maintained by the engines. Without it the basic columns are found by scanning
+            for unit columns, which costs O(m*n) and can miss columns that are unit vectors
+            only up to rounding.
+
+    Returns:
+        Tuple[np.ndarray, float]: The solution and the objective value.
+    """
     logger.info("Extracting solution from the tableau")
     
     optimal_solution = np.zeros(num_original_vars)
-    
-    # Iterate through each of the original variables
-    for i in range(num_original_vars):
-        # Check if the column corresponds to a basic variable (i.e., it has a 1 and the rest are 0)
-        column = tableau[:, i]
-        
-        # Check if the column is a unit vector
-        if np.sum(np.abs(column)) == 1 and np.count_nonzero(column == 1) == 1:
-            # If it is a unit vector, find the row where the 1 is located
-            basic_variable_row = np.where(column == 1)[0][0]
-            
-            # The value of the basic variable is the value in the right-hand side of the tableau
-            optimal_solution[i] = tableau[basic_variable_row, -1]
-            logger.debug(f"Variable x_{i+1} is basic with value {optimal_solution[i]}")
+
+    if basis is not None:
+        # Basic values straight from the basis array, O(m)
+        structural_rows = np.flatnonzero(basis < num_original_vars)
+        optimal_solution[basis[structural_rows]] = tableau[structural_rows + 1, -1]
+    else:
+        # Iterate through each of the original variables
+        for i in range(num_original_vars):
+            # Check if the column corresponds to a basic variable (i.e., it has a 1 and the rest are 0)
+            column = tableau[:, i]
+
+            # Check if the column is a unit vector
+            if np.sum(np.abs(column)) == 1 and np.count_nonzero(column == 1) == 1:
+                # If it is a unit vector, find the row where the 1 is located
+                basic_variable_row = np.where(column == 1)[0][0]
+
+                # The value of the basic variable is the value in the right-hand side of the tableau
+                optimal_solution[i] = tableau[basic_variable_row, -1]
+                logger.debug("Variable x_%d is basic with value %s", i + 1, optimal_solution[i])
             
     # Extract the optimal objective value from the tableau
     optimal_objective_value = tableau[0, -1]
@@ -37,7 +59,7 @@ def extract_solution(
         optimal_objective_value = -optimal_objective_value
         logger.debug("Negating objective value for minimization problem")
         
-    logger.info(f"Optimal solution: {optimal_solution}")
-    logger.info(f"Optimal objective value: {optimal_objective_value}")
+    logger.info("Optimal solution: %s", optimal_solution)
+    logger.info("Optimal objective value: %s", optimal_objective_value)
     
     return optimal_solution, optimal_objective_value
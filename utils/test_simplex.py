@@ -1,12 +1,42 @@
 import unittest
+from unittest import mock
 import numpy as np
 from typing import List, Tuple
 from .transform_constraints import transform_constraints
 from .setup_tableau import setup_tableau
 from .pivot import select_entering_variable, select_leaving_variable, pivot, calculate_ratios
 from .solution_extraction import extract_solution
+from .revised_simplex import revised_simplex
+from .basis import Basis
+from .dual_simplex import dual_simplex
+from .pricing import PartialPricing, get_pricing_rule
+from .ratio_test import harris_ratio_test
+from .presolve import presolve_problem
+from .scaling import compute_scaling
+from .bounds import transform_bounds
+from .precision import resolve_dtype
+from .exact import exact_solve
+from .sensitivity import sensitivity_analysis
+from .history import PivotLog, LastKHistory, EveryKHistory
+from .solution_cache import SolutionCache, problem_key
+from .out_of_core import memmap_array
+from .problem_io import write_problem, read_problem
+from fractions import Fraction
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from ..simplex_solver import simplex_solver  # Import the simplex_solver
+from ..simplex import tabular_simplex, iter_simplex
+from ..batch_solver import solve_batch
+from ..parallel_solver import ParallelSolver
+from ..parametric_solver import parametric_solve
+from ..webapp.logic.solve_async import solve_async, solve_progress
+import scipy.sparse as sp
+import asyncio
+import io
+import os
+import pickle
+import tempfile
+import contextlib
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -118,7 +148,27 @@ class TestSimplex(unittest.TestCase):
                                      [-0.5, 0, 1, -0.5, 2.0],
                                      [0.75, 1, 0, 0.25, 1.5]])
         self.assertTrue(np.allclose(pivoted_tableau1, expected_tableau1))
-    
+
+    def test_pivot_rank_one_update(self):
+        # Column 1 enters at row 2: row 2 is divided by 4, then 5x and -2x of it are added to rows 0 and 1
+        tableau = np.array([[-3, -5, 0, 0, 0],
+                            [1, 2, 1, 0, 5],
+                            [3, 4, 0, 1, 6]])
+        expected = np.array([[0.75, 0.0, 0.0, 1.25, 7.5],
+                             [-0.5, 0.0, 1.0, -0.5, 2.0],
+                             [0.75, 1.0, 0.0, 0.25, 1.5]])
+        # The integer tableau is promoted to float; 1 byte and 80 bytes force panels of one and two rows
+        for memory_budget in [None, 1, 80]:
+            options = {} if memory_budget is None else {'memory_budget': memory_budget}
+            pivoted = pivot(tableau.copy(), 1, 2, **options)
+            self.assertTrue(np.issubdtype(pivoted.dtype, np.floating))
+            self.assertTrue(np.array_equal(pivoted, expected))
+
+        # A float tableau is updated in place
+        floating = tableau.astype(float)
+        self.assertIs(pivot(floating, 1, 2, memory_budget=1), floating)
+        self.assertTrue(np.array_equal(floating, expected))
+
     def test_extract_solution(self):
         # Test case 1: Maximization problem
         tableau1 = np.array([[0, 0, 1.25, 0.75, 31.25],
@@ -176,5 +226,718 @@ class TestSimplex(unittest.TestCase):
         self.assertTrue(np.allclose(optimal_solution2, expected_solution2))
         self.assertAlmostEqual(optimal_objective_value2, expected_objective_value2)
 
+    def test_simplex_solver_iteration_limit(self):
+        # The textbook problem needs two pivots; stopping after one must not report the intermediate vertex
+        c, A, b = np.array([3.0, 5.0]), np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]]), np.array([4.0, 12.0, 18.0])
+        self.assertEqual(simplex_solver(c, A, b, ['<='] * 3, 'max', max_iterations=1), (None, None))
+        self.assertEqual(simplex_solver(c, A, b, ['<='] * 3, 'max', max_iterations=1, return_basis=True), (None, None, None))
+        x, z = simplex_solver(c, A, b, ['<='] * 3, 'max')
+        self.assertAlmostEqual(z, 36.0)
+
+    def test_tabular_simplex_quiet(self):
+        objective_coeffs = np.array([3.0, 5.0])
+        constraint_matrix = np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]])
+        rhs_values = np.array([4.0, 12.0, 18.0])
+        senses = ['<=', '<=', '<=']
+
+        # Silent mode must not write anything to stdout
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            status, x, z, _ = tabular_simplex(objective_coeffs, constraint_matrix, rhs_values, senses, 'max', verbose=False)
+        self.assertEqual(stdout.getvalue(), "")
+        self.assertEqual(status, 'optimal')
+        self.assertTrue(np.allclose(x, [2.0, 6.0]))
+        self.assertAlmostEqual(z, 36.0)
+
+        # Subscribers still receive the narration as events
+        events = []
+        tabular_simplex(objective_coeffs, constraint_matrix, rhs_values, senses, 'max', verbose=False,
+                        callback=lambda event, data: events.append(event))
+        self.assertEqual(events[0], 'problem')
+        self.assertEqual(events[-1], 'optimal')
+        self.assertEqual(events.count('pivot'), 2)
+
+    def test_revised_simplex(self):
+        # Test case 1: Maximization problem with all '<=' constraints
+        c1 = np.array([3.0, 5.0])
+        A1 = np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]])
+        b1 = np.array([4.0, 12.0, 18.0])
+        status1, x1, z1 = revised_simplex(c1, A1, b1, ['<=', '<=', '<='], 'max', refactor_frequency=1)
+        self.assertEqual(status1, 'optimal')
+        self.assertTrue(np.allclose(x1, [2.0, 6.0]))
+        self.assertAlmostEqual(z1, 36.0)
+
+        # Test case 2: Minimization problem with mixed constraints needs phase I
+        c2 = np.array([2.0, 3.0])
+        A2 = np.array([[1.0, 1.0], [1.0, -1.0]])
+        b2 = np.array([10.0, 5.0])
+        status2, x2, z2 = revised_simplex(c2, A2, b2, ['>=', '='], 'min')
+        self.assertEqual(status2, 'optimal')
+        self.assertTrue(np.allclose(x2, [7.5, 2.5]))
+        self.assertAlmostEqual(z2, 22.5)
+
+        # Test case 3: Infeasible and unbounded problems
+        A3 = np.array([[1.0, 1.0], [1.0, 1.0]])
+        status3, _, _ = revised_simplex(np.array([3.0, 2.0]), A3, np.array([5.0, 10.0]), ['<=', '>='], 'min')
+        self.assertEqual(status3, 'infeasible')
+        A4 = np.array([[1.0, -1.0]])
+        status4, _, _ = revised_simplex(np.array([1.0, 1.0]), A4, np.array([1.0]), ['<='], 'max')
+        self.assertEqual(status4, 'unbounded')
+
+        # The engine is selectable from tabular_simplex
+        status5, x5, z5, history5 = tabular_simplex(c1, A1, b1, ['<=', '<=', '<='], 'max', verbose=False, engine='revised')
+        self.assertEqual(status5, 'optimal')
+        self.assertTrue(np.allclose(x5, [2.0, 6.0]))
+        self.assertEqual(history5, [])
+
+    def test_sparse_constraint_matrix(self):
+        # transform_constraints keeps the sparse format
+        A1 = sp.csr_matrix(np.array([[1.0, 2.0], [3.0, 4.0]]))
+        A1_trans, b1_trans = transform_constraints(A1, np.array([5.0, 6.0]), ['<=', '>='])
+        self.assertTrue(sp.issparse(A1_trans))
+        self.assertEqual(A1_trans.format, 'csr')
+        self.assertTrue(np.array_equal(A1_trans.toarray(), np.array([[1, 2], [-3, -4]])))
+        self.assertTrue(np.array_equal(b1_trans, np.array([5, -6])))
+
+        # Sparse input is solved by the revised engine and matches the dense result
+        c2 = np.array([2.0, 3.0])
+        A2 = np.array([[1.0, 1.0], [1.0, -1.0]])
+        b2 = np.array([10.0, 5.0])
+        for matrix in (sp.csr_matrix(A2), sp.csc_matrix(A2)):
+            status, x, z, _ = tabular_simplex(c2, matrix, b2, ['>=', '='], 'min', verbose=False)
+            self.assertEqual(status, 'optimal')
+            self.assertTrue(np.allclose(x, [7.5, 2.5]))
+            self.assertAlmostEqual(z, 22.5)
+
+    def test_two_phase(self):
+        # Mixed constraints start with artificials that Phase I must drive out
+        events = []
+        status, x, z, _ = tabular_simplex(np.array([2.0, 3.0]), np.array([[1.0, 1.0], [1.0, -1.0]]), np.array([10.0, 5.0]),
+                                          ['>=', '='], 'min', verbose=False, callback=lambda event, data: events.append((event, data)))
+        self.assertEqual(status, 'optimal')
+        self.assertTrue(np.allclose(x, [7.5, 2.5]))
+        self.assertAlmostEqual(z, 22.5)
+        # Phase II runs on a tableau without artificial columns
+        phase_two = [data['tableau'] for event, data in events if event == 'phase_two']
+        self.assertEqual(len(phase_two), 1)
+        self.assertEqual(phase_two[0].shape, (3, 4))
+
+        # A negative right-hand side is handled by flipping the row
+        status2, x2, z2, _ = tabular_simplex(np.array([1.0, 1.0]), np.array([[-1.0, -2.0], [1.0, 0.0]]), np.array([-4.0, 3.0]),
+                                             ['<=', '<='], 'min', verbose=False)
+        self.assertEqual(status2, 'optimal')
+        self.assertAlmostEqual(z2, 2.0)
+
+        # Phase I proves infeasibility
+        status3, x3, _, _ = tabular_simplex(np.array([1.0, 1.0]), np.array([[1.0, 1.0], [1.0, 1.0]]), np.array([1.0, 3.0]),
+                                            ['<=', '>='], 'max', verbose=False)
+        self.assertEqual(status3, 'infeasible')
+        self.assertIsNone(x3)
+
+    def test_warm_start(self):
+        c = np.array([3.0, 5.0])
+        A = np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]])
+        b = np.array([4.0, 12.0, 18.0])
+        senses = ['<=', '<=', '<=']
+
+        for engine in ('tableau', 'revised'):
+            status, x, z, _, basis = tabular_simplex(c, A, b, senses, 'max', verbose=False, engine=engine, return_basis=True)
+            self.assertEqual(status, 'optimal')
+            self.assertEqual(sorted(basis.basic_variables), [0, 1, 2])
+
+            # Re-solving the same problem from its optimal basis needs no pivots
+            status2, x2, z2, history2, _ = tabular_simplex(c, A, b, senses, 'max', verbose=False, engine=engine,
+                                                           initial_basis=basis, return_basis=True)
+            self.assertEqual(status2, 'optimal')
+            self.assertTrue(np.allclose(x2, x))
+            if engine == 'tableau':
+                self.assertEqual(len(history2), 1)
+
+            # After an RHS change the old basis is only dual feasible and dual simplex repairs it
+            b3 = np.array([4.0, 12.0, 9.0])
+            events = []
+            status3, x3, z3, _, basis3 = tabular_simplex(c, A, b3, senses, 'max', verbose=False, engine=engine,
+                                                         callback=lambda event, data: events.append(event),
+                                                         initial_basis=basis, return_basis=True)
+            cold_status, cold_x, cold_z, _ = tabular_simplex(c, A, b3, senses, 'max', verbose=False, engine=engine)
+            self.assertEqual(status3, cold_status)
+            self.assertTrue(np.allclose(x3, cold_x))
+            self.assertAlmostEqual(z3, cold_z)
+            if engine == 'tableau':
+                self.assertIn('dual_pivot', events)
+
+        # A basis that does not fit the problem is ignored
+        status4, x4, _ = revised_simplex(c, A, b, senses, 'max', initial_basis=Basis(np.array([0, 1]), 2, 2))
+        self.assertEqual(status4, 'optimal')
+        self.assertTrue(np.allclose(x4, [2.0, 6.0]))
+
+    def test_dual_simplex(self):
+        # Minimization with nonnegative costs starts dual feasible on the slack basis
+        c = np.array([2.0, 3.0])
+        A = np.array([[1.0, 1.0], [1.0, -1.0]])
+        b = np.array([10.0, 5.0])
+        events = []
+        status, x, z, history = dual_simplex(c, A, b, ['>=', '='], 'min', verbose=False,
+                                             callback=lambda event, data: events.append(event))
+        self.assertEqual(status, 'optimal')
+        self.assertTrue(np.allclose(x, [7.5, 2.5]))
+        self.assertAlmostEqual(z, 22.5)
+        self.assertIn('dual_pivot', events)
+        self.assertNotIn('pivot', events)
+        self.assertEqual(len(history), events.count('dual_pivot') + 1)
+
+        # Sparse input gives the same result
+        status_sparse, x_sparse, _, _ = dual_simplex(c, sp.csr_matrix(A), b, ['>=', '='], 'min', verbose=False)
+        self.assertEqual(status_sparse, 'optimal')
+        self.assertTrue(np.allclose(x_sparse, x))
+
+        # A negative RHS row without a negative entry proves infeasibility
+        status2, x2, z2, _ = dual_simplex(np.array([1.0, 1.0]), np.array([[1.0, 1.0], [1.0, 1.0]]),
+                                          np.array([1.0, 3.0]), ['<=', '>='], 'min', verbose=False)
+        self.assertEqual(status2, 'infeasible')
+        self.assertIsNone(x2)
+
+    def test_pricing_rules(self):
+        c = np.array([2.0, 3.0, 1.0, 4.0])
+        A = np.array([[1.0, 1.0, 1.0, 1.0], [2.0, 1.0, 0.0, 3.0], [1.0, 0.0, 2.0, 1.0], [0.0, 1.0, 1.0, 0.0]])
+        b = np.array([10.0, 15.0, 8.0, 6.0])
+        senses = ['<=', '<=', '>=', '<=']
+        expected_status, expected_x, expected_z, _ = tabular_simplex(c, A, b, senses, 'max', verbose=False)
+        self.assertEqual(expected_status, 'optimal')
+
+        for engine in ('tableau', 'revised'):
+            for pricing in ('dantzig', 'bland', 'devex', 'steepest_edge', 'partial', PartialPricing(segment_size=2, num_candidates=2)):
+                status, x, z, _ = tabular_simplex(c, A, b, senses, 'max', verbose=False, engine=engine, pricing=pricing)
+                self.assertEqual(status, 'optimal')
+                self.assertAlmostEqual(z, expected_z)
+
+        # The rule can also be chosen for simplex_solver
+        x2, z2 = simplex_solver(c, A, b, senses, 'max', pricing='steepest_edge')
+        self.assertAlmostEqual(z2, expected_z)
+
+        with self.assertRaises(ValueError):
+            get_pricing_rule('largest_increase')
+
+    def test_harris_ratio_test(self):
+        # Rows 0 and 2 tie within the tolerance; the larger pivot wins
+        column = np.array([1.0, 0.5, 4.0, -1.0])
+        rhs = np.array([1.0, 3.0, 4.0 + 1e-12, 0.0])
+        self.assertEqual(harris_ratio_test(column, rhs), 2)
+        self.assertIsNone(harris_ratio_test(np.array([-1.0, 1e-12]), np.array([1.0, 1.0])))
+        # A blocking row with a nonzero entry leaves regardless of its sign
+        self.assertEqual(harris_ratio_test(column, rhs, blocking=np.array([False, False, False, True])), 3)
+
+    def test_degenerate_cycling_example(self):
+        # Beale's example cycles with the textbook ratio test; the solvers must still terminate
+        c = np.array([-0.75, 20.0, -0.5, 6.0])
+        A = np.array([[0.25, -8.0, -1.0, 9.0], [0.5, -12.0, -0.5, 3.0], [0.0, 0.0, 1.0, 0.0]])
+        b = np.array([0.0, 0.0, 1.0])
+        senses = ['<=', '<=', '<=']
+        for engine in ('tableau', 'revised'):
+            status, x, z, _ = tabular_simplex(c, A, b, senses, 'min', verbose=False, engine=engine)
+            self.assertEqual(status, 'optimal')
+            self.assertAlmostEqual(z, -1.25)
+        x2, z2 = simplex_solver(c, A, b, senses, 'min', max_iterations=50)
+        self.assertTrue(np.allclose(x2, [1.0, 0.0, 1.0, 0.0]))
+
+    def test_presolve(self):
+        # Row 3 duplicates row 2, row 4 is a singleton fixing x3 = 0, rows 0 and 1 become the bounds x1 <= 4 and x2 <= 6
+        c = np.array([3.0, 5.0, 1.0])
+        A = np.array([[1.0, 0.0, 0.0], [0.0, 2.0, 1.0], [3.0, 2.0, 0.0], [6.0, 4.0, 0.0], [0.0, 0.0, 1.0]])
+        b = np.array([4.0, 12.0, 18.0, 36.0, 0.0])
+        senses = ['<=', '<=', '<=', '<=', '<=']
+        presolved = presolve_problem(c, A, b, senses, 'max')
+        self.assertEqual(presolved.status, 'reduced')
+        self.assertEqual(list(presolved.kept_columns), [0, 1])
+        self.assertEqual(presolved.constraint_matrix.shape, (1, 2))
+        self.assertTrue(np.allclose(presolved.ub, [4.0, 6.0]))
+
+        status, x, z, _ = tabular_simplex(c, A, b, senses, 'max', verbose=False, presolve=True)
+        self.assertEqual(status, 'optimal')
+        self.assertTrue(np.allclose(x, [2.0, 6.0, 0.0]))
+        self.assertAlmostEqual(z, 36.0)
+        x2, z2 = simplex_solver(c, sp.csr_matrix(A), b, senses, 'max', presolve=True)
+        self.assertAlmostEqual(z2, 36.0)
+
+        # Presolve alone proves infeasibility and solves fully determined problems
+        self.assertEqual(presolve_problem(c, A[:2], np.array([-1.0, 1.0]), ['>=', '<='], 'max').status, 'reduced')
+        self.assertEqual(presolve_problem(c, A[[0, 4]], np.array([4.0, 1.0]), ['<=', '>='], 'min').status, 'optimal')
+        self.assertEqual(presolve_problem(c, A[[0, 0]], np.array([4.0, 5.0]), ['<=', '>='], 'max').status, 'infeasible')
+
+    def test_scaling(self):
+        # The first example with rows and columns scaled by powers of ten
+        c = np.array([3.0e4, 5.0e-2])
+        A = np.array([[1.0e4, 0.0], [0.0, 2.0e-2], [3.0e8, 2.0e2]])
+        b = np.array([4.0, 12.0, 18.0e4])
+        scaling = compute_scaling(A, 'auto')
+        self.assertLess(scaling.ratio_after, scaling.ratio_before)
+        self.assertTrue(np.allclose(np.log2(scaling.row_scale), np.round(np.log2(scaling.row_scale))))
+
+        for method in ('geometric', 'equilibrate', 'auto'):
+            status, x, z, _ = tabular_simplex(c, A, b, ['<=', '<=', '<='], 'max', verbose=False, scaling=method)
+            self.assertEqual(status, 'optimal')
+            self.assertTrue(np.allclose(x, [2.0e-4, 600.0]))
+            self.assertAlmostEqual(z, 36.0)
+        x2, z2 = simplex_solver(c, sp.csc_matrix(A), b, ['<=', '<=', '<='], 'max', scaling='auto')
+        self.assertTrue(np.allclose(x2, [2.0e-4, 600.0]))
+
+        with self.assertRaises(ValueError):
+            compute_scaling(A, 'curtis_reid')
+
+    def test_bounds(self):
+        # The first example with x1 <= 4 as a bound instead of a row
+        c = np.array([3.0, 5.0])
+        A = np.array([[0.0, 2.0], [3.0, 2.0]])
+        b = np.array([12.0, 18.0])
+        lb, ub = np.zeros(2), np.array([4.0, np.inf])
+        for engine in ('tableau', 'revised'):
+            status, x, z, _ = tabular_simplex(c, A, b, ['<=', '<='], 'max', verbose=False, engine=engine, lb=lb, ub=ub)
+            self.assertEqual(status, 'optimal')
+            self.assertTrue(np.allclose(x, [2.0, 6.0]))
+            self.assertAlmostEqual(z, 36.0)
+
+        # Both variables stop at their upper bounds through bound flips; a warm start keeps them there
+        A, b = np.array([[1.0, 1.0]]), np.array([10.0])
+        lb, ub = np.array([-1.0, 0.0]), np.array([2.0, 3.0])
+        for engine in ('tableau', 'revised'):
+            status, x, z, _, basis = tabular_simplex(np.ones(2), A, b, ['<='], 'max', verbose=False, engine=engine,
+                                                     lb=lb, ub=ub, return_basis=True)
+            self.assertTrue(np.allclose(x, [2.0, 3.0]))
+            self.assertEqual(list(basis.at_upper), [0, 1])
+            status, x, z, _ = tabular_simplex(np.ones(2), A, np.array([4.0]), ['<='], 'max', verbose=False,
+                                              engine=engine, lb=lb, ub=ub, initial_basis=basis)
+            self.assertEqual(status, 'optimal')
+            self.assertAlmostEqual(z, 4.0)
+
+        # A free variable and one with only an upper bound, without splitting or extra rows
+        A = np.array([[1.0, -1.0], [0.0, 1.0]])
+        b = np.array([-3.0, 2.0])
+        lb, ub = np.array([-np.inf, 0.0]), np.array([np.inf, np.inf])
+        x, z = simplex_solver(np.array([1.0, 0.0]), A, b, ['>=', '<='], 'min', lb=lb, ub=ub)
+        self.assertAlmostEqual(z, -3.0)
+        x, z = simplex_solver(np.ones(2), np.array([[-1.0, 1.0]]), np.array([1.0]), ['<='], 'max',
+                              lb=np.array([-np.inf, 0.0]), ub=np.array([1.0, 2.0]))
+        self.assertTrue(np.allclose(x, [1.0, 2.0]))
+        _, _, _, transform = transform_bounds(np.ones(2), A, b, lb=np.array([-np.inf, 1.0]), ub=np.array([1.0, np.inf]))
+        self.assertTrue(np.allclose(transform.restore(np.array([0.5, 2.0])), [0.5, 3.0]))
+        with self.assertRaises(ValueError):
+            simplex_solver(np.ones(2), A, b, ['>=', '<='], 'max', lb=np.array([1.0, 0.0]), ub=np.array([0.0, 1.0]))
+
+    def test_dtype(self):
+        # Integer inputs give a tableau of the requested dtype; negating integer rows no longer truncates
+        tableau = setup_tableau(np.array([3, 5]), np.array([[1, 0], [0, 2]]), np.array([4, 12]), ['<=', '<='], 'max', dtype=np.float32)
+        self.assertEqual(tableau.dtype, np.float32)
+        transformed_matrix, transformed_rhs = transform_constraints(np.array([[1, 2]]), np.array([3]), ['>='])
+        self.assertTrue(np.issubdtype(transformed_matrix.dtype, np.floating))
+        self.assertTrue(np.array_equal(transformed_rhs, [-3.0]))
+        self.assertEqual(resolve_dtype('longdouble'), np.dtype(np.longdouble))
+        with self.assertRaises(ValueError):
+            resolve_dtype('int64')
+
+        # A float32 solve is refactorized in float64 and matches the float64 solve to float64 accuracy
+        rng = np.random.default_rng(0)
+        A = rng.uniform(0.0, 10.0, (60, 60))
+        b = rng.uniform(50.0, 100.0, 60)
+        c = rng.uniform(1.0, 5.0, 60)
+        events = []
+        status, x64, z64, _ = tabular_simplex(c, A, b, ['<='] * 60, 'max', verbose=False)
+        status, x32, z32, history = tabular_simplex(c, A, b, ['<='] * 60, 'max', verbose=False, dtype='float32',
+                                                    callback=lambda event, data: events.append(event))
+        self.assertEqual(status, 'optimal')
+        self.assertEqual(history[-1].dtype, np.float32)
+        self.assertIn('refactor', events)
+        self.assertAlmostEqual(z32, z64, places=9)
+        self.assertTrue(np.allclose(x32, x64, atol=1e-9))
+        x, z = simplex_solver(c, A, b, ['<='] * 60, 'max', dtype='longdouble')
+        self.assertAlmostEqual(z, z64, places=9)
+
+    def test_basis_tracking(self):
+        # With the basis array a column that is a unit vector only up to rounding is still read as basic
+        tableau = np.array([[0.0, 0.0, 1.0, 1.0, 10.0],
+                            [1.0 + 1e-16, 0.0, 0.5, 0.0, 2.0],
+                            [1e-17, 1.0, 0.0, 0.5, 3.0]])
+        solution, objective_value = extract_solution(tableau, 2, 2, 'max', basis=np.array([0, 1]))
+        self.assertTrue(np.array_equal(solution, [2.0, 3.0]))
+        self.assertEqual(objective_value, 10.0)
+        solution, _ = extract_solution(tableau, 2, 2, 'max', basis=np.array([2, 1]))
+        self.assertTrue(np.array_equal(solution, [0.0, 3.0]))
+
+        # The engines publish the basis with every iteration
+        events = []
+        tabular_simplex(np.array([3.0, 5.0]), np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]]), np.array([4.0, 12.0, 18.0]),
+                        ['<=', '<=', '<='], 'max', verbose=False,
+                        callback=lambda event, data: events.append(data['basis'].copy()) if event == 'iteration' else None)
+        self.assertTrue(np.array_equal(events[0], [2, 3, 4]))
+        self.assertTrue(np.array_equal(np.sort(events[-1]), [0, 1, 2]))
+
+    def test_exact(self):
+        # The float basis is certified without pivots and gives the exact rational vertex and duals
+        c, A, b = np.array([1.0, 1.0]), np.array([[3.0, 1.0], [1.0, 3.0]]), np.array([1.0, 1.0])
+        status, x, z, _, basis = tabular_simplex(c, A, b, ['<=', '<='], 'max', verbose=False, return_basis=True)
+        certificate = exact_solve(c, A, b, ['<=', '<='], 'max', initial_basis=basis)
+        self.assertTrue(certificate.verified)
+        self.assertEqual(certificate.pivots, 0)
+        self.assertEqual(certificate.solution, [Fraction(1, 4), Fraction(1, 4)])
+        self.assertEqual(certificate.objective_value, Fraction(1, 2))
+        self.assertEqual(certificate.duals, [Fraction(1, 4), Fraction(1, 4)])
+
+        # A basis that is optimal for other costs is only primal feasible and is pivoted exactly to the optimum
+        certificate = exact_solve(np.array([1.0, 0.0]), A, b, ['<=', '<='], 'max', initial_basis=basis)
+        self.assertFalse(certificate.verified)
+        self.assertGreater(certificate.pivots, 0)
+        self.assertEqual(certificate.objective_value, Fraction(1, 3))
+        self.assertTrue(exact_solve(np.array([1.0, 0.0]), A, b, ['<=', '<='], 'max', initial_basis=certificate.basis).verified)
+
+        # Bounds and free variables, through both solvers
+        lb, ub = np.array([-np.inf, 0.0]), np.array([np.inf, 0.1])
+        status, x, z, _, certificate = tabular_simplex(np.array([1.0, 2.0]), np.array([[1.0, 1.0]]), np.array([0.3]), ['<='], 'max',
+                                                       verbose=False, lb=lb, ub=ub, exact=True)
+        self.assertEqual(status, 'optimal')
+        self.assertEqual(z, float(Fraction(0.3) + Fraction(0.1)))
+        self.assertEqual(certificate.objective_value, Fraction(0.3) + Fraction(0.1))
+        x, z, certificate = simplex_solver(np.array([1.0, 2.0]), np.array([[1.0, 1.0]]), np.array([0.3]), ['<='], 'max',
+                                           lb=lb, ub=ub, exact=True)
+        self.assertTrue(np.allclose(x, [0.2, 0.1]))
+        self.assertEqual(certificate.status, 'optimal')
+        self.assertEqual(list(x), [float(value) for value in certificate.solution])
+
+        # The certificate follows the SensitivityReport, and is None when the float solve fails
+        *_, report, certificate = tabular_simplex(c, A, b, ['<=', '<='], 'max', verbose=False, sensitivity=True, exact=True)
+        self.assertIsNotNone(report)
+        self.assertEqual(certificate.objective_value, Fraction(1, 2))
+        x, z, certificate = simplex_solver(c, A, np.array([5.0, 1.0]), ['>=', '<='], 'max', exact=True)
+        self.assertIsNone(x)
+        self.assertIsNone(certificate)
+        with self.assertRaises(ValueError):
+            simplex_solver(c, A, b, ['<=', '<='], 'max', presolve=True, exact=True)
+
+    def test_sensitivity(self):
+        # Textbook example (Hillier & Lieberman): shadow prices 0, 1.5, 1 and the classic ranges
+        c, A, b = np.array([3.0, 5.0]), np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]]), np.array([4.0, 12.0, 18.0])
+        status, x, z, _, report = tabular_simplex(c, A, b, ['<='] * 3, 'max', verbose=False, sensitivity=True)
+        self.assertTrue(np.allclose(report.duals, [0.0, 1.5, 1.0]))
+        self.assertTrue(np.allclose(report.slacks, [2.0, 0.0, 0.0]))
+        self.assertTrue(np.allclose(report.reduced_costs, [0.0, 0.0]))
+        self.assertTrue(np.allclose(report.rhs_ranges, [[2.0, np.inf], [6.0, 18.0], [12.0, 24.0]]))
+        self.assertTrue(np.allclose(report.objective_ranges, [[0.0, 7.5], [2.0, np.inf]]))
+
+        # Nonbasic variable of a minimization: its cost can rise freely and fall by its reduced cost
+        status, x, z, _, basis = tabular_simplex(np.array([2.0, 3.0]), np.array([[1.0, 1.0]]), np.array([4.0]), ['>='], 'min',
+                                                 verbose=False, return_basis=True)
+        report = sensitivity_analysis(np.array([2.0, 3.0]), np.array([[1.0, 1.0]]), np.array([4.0]), ['>='], 'min', basis)
+        self.assertTrue(np.allclose(report.duals, [2.0]))
+        self.assertTrue(np.allclose(report.reduced_costs, [0.0, 1.0]))
+        self.assertTrue(np.allclose(report.objective_ranges, [[0.0, 3.0], [2.0, np.inf]]))
+
+        # The revised engine and simplex_solver return the same report
+        x, z, solver_report = simplex_solver(c, sp.csr_matrix(A), b, ['<='] * 3, 'max', sensitivity=True)
+        self.assertTrue(np.allclose(solver_report.rhs_ranges, [[2.0, np.inf], [6.0, 18.0], [12.0, 24.0]]))
+
+        # A sparse problem is factorized with SuperLU and gives the same report as the dense one
+        c, A, b = np.array([2.0, 1.0, 3.0]), np.array([[1.0, 0.0, 2.0], [0.0, 1.0, 1.0], [1.0, 1.0, 0.0]]), np.array([8.0, 3.0, 2.0])
+        senses = ['<=', '>=', '=']
+        status, x, z, _, basis = tabular_simplex(c, A, b, senses, 'max', verbose=False, return_basis=True)
+        dense_report = sensitivity_analysis(c, A, b, senses, 'max', basis)
+        sparse_report = sensitivity_analysis(c, sp.csr_matrix(A), b, senses, 'max', basis)
+        for field in ('duals', 'reduced_costs', 'slacks', 'rhs_ranges', 'objective_ranges'):
+            self.assertTrue(np.allclose(getattr(dense_report, field), getattr(sparse_report, field)), field)
+
+    def test_history(self):
+        # Phase I, phase change and Phase II: every policy agrees with the full history on what it keeps
+        c, A, b = np.array([2.0, 3.0, 1.0]), np.array([[1.0, 1.0, 1.0], [2.0, 1.0, -1.0], [1.0, 3.0, 0.0]]), np.array([10.0, 4.0, 15.0])
+        senses = ['<=', '>=', '<=']
+        status, x, z, full = tabular_simplex(c, A, b, senses, 'max', verbose=False)
+        self.assertGreater(len(full), 3)
+
+        for checkpoint_interval in [None, 2]:
+            status, x2, z2, log = tabular_simplex(c, A, b, senses, 'max', verbose=False, history=PivotLog(checkpoint_interval))
+            self.assertEqual(len(log), len(full))
+            self.assertLess(len(log.checkpoints), len(full))
+            # Replayed tableaux are bit-identical, in any order
+            for i in [len(full) - 1, 0, 2, 1]:
+                self.assertTrue(np.array_equal(log[i], full[i]))
+            self.assertTrue(np.allclose(x2, x))
+
+        # A cached log is read by several sessions at once, and survives pickling to the disk cache
+        order = [i % len(full) for i in range(7 * len(full))][::-1] * 20
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            tableaux = list(pool.map(log.__getitem__, order))
+        self.assertTrue(all(np.array_equal(tableau, full[i]) for i, tableau in zip(order, tableaux)))
+        self.assertTrue(all(np.array_equal(mine, theirs) for mine, theirs in zip(pickle.loads(pickle.dumps(log)), full)))
+
+        status, _, _, last = tabular_simplex(c, A, b, senses, 'max', verbose=False, history=LastKHistory(2))
+        self.assertEqual(last.iterations, [len(full) - 2, len(full) - 1])
+        self.assertTrue(np.array_equal(last[-1], full[-1]))
+        status, _, _, every = tabular_simplex(c, A, b, senses, 'max', verbose=False, history=EveryKHistory(3))
+        self.assertEqual(every.iterations, sorted({*range(0, len(full), 3), len(full) - 1}))
+        status, _, _, every = tabular_simplex(c, A, b, senses, 'max', verbose=False, history='every')
+        self.assertEqual(every.iterations, sorted({*range(0, len(full), 10), len(full) - 1}))
+        self.assertTrue(np.array_equal(every[-1], full[-1]))
+        status, _, _, none = tabular_simplex(c, A, b, senses, 'max', verbose=False, history='none')
+        self.assertEqual(len(none), 0)
+        with self.assertRaises(ValueError):
+            tabular_simplex(c, A, b, senses, 'max', verbose=False, history='some')
+
+    def test_iter_simplex(self):
+        c, A, b = np.array([3.0, 5.0]), np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]]), np.array([4.0, 12.0, 18.0])
+        states = []
+        for state in iter_simplex(c, A, b, ['<='] * 3, 'max'):
+            self.assertFalse(state.tableau.flags.writeable)
+            states.append((state.status, state.entering, state.leaving, state.objective_value))
+        # Two pivots raise the objective 0 -> 30 -> 36, then the final state
+        self.assertEqual([status for status, *_ in states], ['running', 'running', 'optimal'])
+        self.assertEqual(states[0][1:3], (1, 2))
+        self.assertEqual([value for *_, value in states], [30.0, 36.0, 36.0])
+        self.assertTrue(np.allclose(state.solution, [2.0, 6.0]))
+        self.assertEqual(list(state.optimal_basis.basic_variables), list(tabular_simplex(c, A, b, ['<='] * 3, 'max', verbose=False,
+                                                                                            return_basis=True)[4].basic_variables))
+
+        # Leaving the loop early stops the solve
+        steps = 0
+        for state in iter_simplex(c, A, b, ['<='] * 3, 'max'):
+            steps += 1
+            break
+        self.assertEqual((steps, state.status), (1, 'running'))
+
+        # Invalid inputs are reported at the call, not on the first step
+        with self.assertRaises(ValueError):
+            iter_simplex(c, A, b, ['<='] * 2, 'max')
+
+    def test_solution_cache(self):
+        c, A, b = np.array([3.0, 5.0]), np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]]), np.array([4.0, 12.0, 18.0])
+        senses = ['<='] * 3
+        key = problem_key(c, A, b, senses, 'max')
+        # The key ignores the storage format, integer inputs and the sign of zero, but not the data or options
+        self.assertEqual(key, problem_key([3, 5], sp.csc_matrix(A.astype(int)), b, senses, 'max'))
+        self.assertEqual(key, problem_key(c, np.where(A == 0, -0.0, A), b, senses, 'max'))
+        self.assertNotEqual(key, problem_key(c, A, b, senses, 'min'))
+        self.assertNotEqual(key, problem_key(c, A, b, senses, 'max', engine='revised'))
+        self.assertNotEqual(key, problem_key(c, A + 1e-12, b, senses, 'max'))
+
+        with tempfile.TemporaryDirectory() as directory:
+            cache = SolutionCache(max_entries=1, directory=directory, max_disk_bytes=10 ** 6)
+            self.assertIsNone(cache.get(key))
+            result = tabular_simplex(c, A, b, senses, 'max', verbose=False, history='none')
+            cache.put(key, result)
+            self.assertIs(cache.get(key), result)
+            # The second entry pushes the first out of memory; it comes back from disk
+            cache.put('other', ('optimal', None, 1.0, None))
+            self.assertEqual(cache.get(key)[2], 36.0)
+            self.assertEqual(cache.stats(), {'hits': 2, 'disk_hits': 1, 'misses': 1, 'entries': 1})
+
+            # Size-based eviction deletes the least recently used files first
+            os.utime(os.path.join(directory, f'{key}.pkl'), (0, 0))
+            limited = SolutionCache(max_entries=0, directory=directory,
+                                    max_disk_bytes=2 * os.path.getsize(os.path.join(directory, 'other.pkl')))
+            limited.put('last', ('optimal', None, 2.0, None))
+            self.assertEqual(sorted(os.listdir(directory)), ['last.pkl', 'other.pkl'])
+
+            # Entries pickled by other code (a class or module that no longer exists) are misses and are deleted
+            for name, stale in [('renamed', b'cutils.solution_cache\nNoSuchClass\n.'), ('moved', b'cno_such_module\nResult\n.')]:
+                with open(os.path.join(directory, f'{name}.pkl'), 'wb') as file:
+                    file.write(stale)
+                with self.assertLogs(level='WARNING'):
+                    self.assertIsNone(limited.get(name))
+                self.assertFalse(os.path.exists(os.path.join(directory, f'{name}.pkl')))
+
+    def test_solve_async(self):
+        c, A, b = np.array([3.0, 5.0]), np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]]), np.array([4.0, 12.0, 18.0])
+        senses = ['<='] * 3
+        status, x, z, log = asyncio.run(solve_async(c, A, b, senses, 'max'))
+        expected_status, expected_x, expected_z, full = tabular_simplex(c, A, b, senses, 'max', verbose=False)
+        self.assertEqual((status, z), (expected_status, expected_z))
+        self.assertTrue(np.array_equal(x, expected_x))
+        self.assertTrue(np.array_equal(log[len(full) - 1], full[-1]))
+
+        # One state per batch, the final one last
+        async def progress_states(**options):
+            return [(state.status, state.iteration) async for state in solve_progress(c, A, b, senses, 'max', **options)]
+        self.assertEqual(asyncio.run(progress_states(batch_size=1)), [('running', 1), ('running', 2), ('optimal', 3)])
+        self.assertEqual(asyncio.run(progress_states(batch_size=2)), [('running', 2), ('optimal', 3)])
+
+        # The deadline ends a batch after the step that passes it; history objects bypass the cache
+        states = []
+        status, x, z, _ = asyncio.run(solve_async(c, A, b, senses, 'max', history=LastKHistory(), timeout=0,
+                                                  progress=states.append))
+        self.assertEqual((status, x, z), ('timeout', None, None))
+        self.assertEqual([state.iteration for state in states], [1])
+
+        # Cancelling the consuming task stops the solve at the end of the batch
+        async def cancel_after_first_batch():
+            states = []
+            def progress(state):
+                states.append(state)
+                task.cancel()
+            task = asyncio.create_task(solve_async(c, A, b, senses, 'max', history=LastKHistory(), batch_size=1,
+                                                   progress=progress))
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            return states
+        self.assertEqual(len(asyncio.run(cancel_after_first_batch())), 1)
+
+        # Invalid input is reported, not raised
+        with self.assertLogs(level='ERROR'):
+            self.assertEqual(asyncio.run(solve_async(c, A, b, ['<='] * 2, 'max')), ('error', None, None, None))
+
+    def test_solve_batch(self):
+        # Three copies of the same shape: optimal, infeasible and unbounded
+        objective_coeffs = np.array([[3.0, 5.0], [3.0, 5.0], [1.0, 1.0]])
+        constraint_matrix = np.array([
+            [[1.0, 0.0], [0.0, 2.0]],
+            [[1.0, 1.0], [-1.0, -1.0]],
+            [[1.0, -1.0], [0.0, 0.0]],
+        ])
+        rhs_values = np.array([[4.0, 12.0], [5.0, -10.0], [1.0, 0.0]])
+        senses = ['<=', '<=']
+
+        status, solutions, objective_values = solve_batch(objective_coeffs, constraint_matrix, rhs_values, senses, 'max')
+        self.assertEqual(list(status), ['optimal', 'infeasible', 'unbounded'])
+        self.assertTrue(np.allclose(solutions[0], [4.0, 6.0]))
+        self.assertAlmostEqual(objective_values[0], 42.0)
+        self.assertTrue(np.all(np.isnan(solutions[1:])))
+
+        # Each problem matches a single solve
+        c2 = np.array([[2.0, 3.0], [1.0, 1.0]])
+        A2 = np.array([[[1.0, 1.0], [1.0, -1.0]], [[1.0, 1.0], [1.0, -1.0]]])
+        b2 = np.array([[10.0, 5.0], [4.0, 0.0]])
+        status2, solutions2, objective_values2 = solve_batch(c2, A2, b2, ['>=', '='], 'min')
+        self.assertEqual(list(status2), ['optimal', 'optimal'])
+        self.assertTrue(np.allclose(solutions2[0], [7.5, 2.5]))
+        self.assertTrue(np.allclose(objective_values2, [22.5, 4.0]))
+
+    def test_parallel_solver(self):
+        problems = [
+            (np.array([3.0, 5.0]), np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]]), np.array([4.0, 12.0, 18.0]), ['<=', '<=', '<='], 'max'),
+            (np.array([2.0, 3.0]), sp.csr_matrix(np.array([[1.0, 1.0], [1.0, -1.0]])), np.array([10.0, 5.0]), ['>=', '='], 'min'),
+            (np.array([1.0, 1.0]), np.array([[1.0, -1.0]]), np.array([1.0]), ['<='], 'max'),
+        ]
+        with ParallelSolver(max_workers=2, chunksize=2) as solver:
+            results = solver.solve_all(iter(problems))
+            unordered = sorted(index for index, *_ in solver.solve(problems, ordered=False))
+
+        self.assertEqual([status for status, _, _ in results], ['optimal', 'optimal', 'unbounded'])
+        self.assertAlmostEqual(results[0][2], 36.0)
+        self.assertTrue(np.allclose(results[1][1], [7.5, 2.5]))
+        self.assertEqual(unordered, [0, 1, 2])
+
+    def test_out_of_core(self):
+        c, A, b = np.array([2.0, 3.0, 1.0]), np.array([[1.0, 1.0, 1.0], [2.0, 1.0, -1.0], [1.0, 3.0, 0.0]]), np.array([10.0, 4.0, 15.0])
+        senses = ['<=', '>=', '<=']
+        status, x, z, full = tabular_simplex(c, A, b, senses, 'max', verbose=False)
+
+        # Panelled pivots do the same arithmetic as one full-size update
+        tableau = setup_tableau(c, A, b, senses)
+        self.assertTrue(np.array_equal(pivot(tableau.copy(), 0, 1, memory_budget=1), pivot(tableau.copy(), 0, 1)))
+
+        with tempfile.TemporaryDirectory() as directory:
+            # A one-row-per-panel budget on a memory-mapped tableau, and a memory-mapped constraint matrix
+            mapped = memmap_array(A.shape, np.float64, directory)
+            mapped[:] = A
+            status2, x2, z2, history = tabular_simplex(c, mapped, b, senses, 'max', verbose=False, engine='tableau',
+                                                       memmap_dir=directory, memory_budget=1)
+            self.assertEqual(status2, status)
+            self.assertTrue(np.allclose(x2, x))
+            self.assertAlmostEqual(z2, z)
+            self.assertEqual(len(history), 0)  # No history is kept by default out of core
+            states = list(iter_simplex(c, A, b, senses, 'max', memmap_dir=directory))
+            self.assertIsInstance(states[0].tableau, np.memmap)
+            self.assertTrue(np.allclose(revised_simplex(c, mapped, b, senses, 'max', pricing='steepest_edge')[1], x))
+            del mapped, states
+            # The backing files are unlinked as soon as they are mapped
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_problem_io(self):
+        c, A, b = np.array([2.0, 3.0, 1.0]), np.array([[1.0, 1.0, 1.0], [2.0, 1.0, -1.0], [1.0, 3.0, 0.0]]), np.array([10.0, 4.0, 15.0])
+        senses, ub = ['<=', '>=', '<='], np.array([np.inf, 2.0, np.inf])
+        expected = tabular_simplex(c, A, b, senses, 'min', verbose=False, ub=ub)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'problem.lp')
+            for dense in (False, True):
+                write_problem(path, c, sp.csc_matrix(A), b, senses, 'min', ub=ub, dense=dense)
+                problem = read_problem(path)
+                # The arrays are read-only views of the mapped file
+                self.assertIsInstance(problem.rhs_values, np.memmap)
+                self.assertFalse(problem.rhs_values.flags.writeable)
+                matrix = problem.constraint_matrix
+                self.assertTrue(np.array_equal(matrix.toarray() if sp.issparse(matrix) else matrix, A))
+                self.assertEqual((problem.senses, problem.problem_type, problem.lb), (senses, 'min', None))
+                status, x, z, _ = tabular_simplex(problem.objective_coeffs, matrix, problem.rhs_values, problem.senses,
+                                                  problem.problem_type, verbose=False, lb=problem.lb, ub=problem.ub)
+                self.assertEqual(status, expected[0])
+                self.assertAlmostEqual(z, expected[2])
+                del problem, matrix
+
+            # scipy uses the CSR arrays as read: views of the mapping, or one array per section read from the file
+            write_problem(path, c, A, b, senses, 'min', ub=ub)
+            for mmap in (True, False):
+                matrix = read_problem(path, mmap=mmap).constraint_matrix
+                for array in (matrix.data, matrix.indices, matrix.indptr):
+                    # A copy would be writeable; the buffer behind the array is the mapping or a section of the file
+                    self.assertFalse(array.flags.writeable)
+                    buffer = array
+                    while isinstance(buffer.base, np.ndarray):
+                        buffer = buffer.base
+                    self.assertEqual(isinstance(buffer, np.memmap), mmap)
+                    self.assertTrue(np.shares_memory(array, buffer))
+                del matrix
+
+            # A truncated file is rejected rather than read into partly filled arrays
+            size = os.path.getsize(path)
+            with open(path, 'r+b') as file:
+                file.truncate(size - 8)
+            for mmap in (True, False):
+                with self.assertRaises(ValueError):
+                    read_problem(path, mmap=mmap)
+            # A file that shrinks after its size was checked fails on the short read itself
+            with mock.patch('os.fstat', return_value=os.stat_result((0,) * 6 + (size,) + (0,) * 3)):
+                with self.assertRaisesRegex(ValueError, 'truncated'):
+                    read_problem(path, mmap=False)
+
+            with open(path, 'r+b') as file:
+                file.write(b'NOTALP')
+            with self.assertRaises(ValueError):
+                read_problem(path, mmap=False)
+
+    def test_parametric(self):
+        # Textbook example with b_2 = 12 + theta: the dual of row 2 is 1.5 on [6, 18], then 0, and infeasible below 0
+        c, A, b = np.array([3.0, 5.0]), np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]]), np.array([4.0, 12.0, 18.0])
+        result = parametric_solve(c, A, b, ['<='] * 3, 'max', rhs_direction=np.array([0.0, 1.0, 0.0]), theta_range=(-15.0, 15.0))
+        self.assertEqual([piece.status for piece in result.pieces], ['infeasible', 'optimal', 'optimal', 'optimal'])
+        self.assertTrue(np.allclose(result.breakpoints, [-12.0, -6.0, 6.0]))
+        self.assertTrue(np.allclose([piece.objective_slope for piece in result.pieces[1:]], [2.5, 1.5, 0.0]))
+        self.assertIsNone(result.objective_value(-13.0))
+        for theta in [-12.0, -8.0, 0.0, 10.0]:
+            _, x, z, _ = tabular_simplex(c, A, b + theta * np.array([0.0, 1.0, 0.0]), ['<='] * 3, 'max', verbose=False)
+            self.assertAlmostEqual(result.objective_value(theta), z)
+            self.assertTrue(np.allclose(result.solution(theta), x))
+
+        # Objective sweep c_1 = 3 + theta: the basis changes where c_1 leaves its range [0, 7.5]
+        result = parametric_solve(c, A, b, ['<='] * 3, 'max', objective_direction=np.array([1.0, 0.0]), theta_range=(-5.0, 10.0))
+        self.assertTrue(np.allclose(result.breakpoints, [-3.0, 4.5]))
+        self.assertTrue(np.allclose(result.solution(-4.0), [0.0, 6.0]))
+        self.assertTrue(np.allclose(result.solution(8.0), [4.0, 3.0]))
+        self.assertAlmostEqual(result.objective_value(8.0), 59.0)
+
+        # Breakpoints carry round-off (1.5000000000000004, 2.9999999999999996): values at them and at the
+        # exact theta agree with a cold solve, and no zero-length infeasible piece is left at the end
+        c, A = np.array([-3.0, 0.0, 0.0]), np.array([[3.0, -1.0, -2.0], [1.0, 0.0, -3.0], [1.0, -2.0, -1.0], [-3.0, 5.0, 2.0]])
+        b, d = np.array([6.0, 0.0, 6.0, 4.0]), np.array([2.0, 2.0, -2.0, -1.0])
+        for senses, lb, theta_range in [(['>=', '<=', '>=', '<='], 0.0, (-1.0, 3.0)), (['=', '>=', '<=', '<='], -3.0, (-3.0, 3.0))]:
+            lb, ub = np.full(3, lb), np.full(3, 3.0)
+            result = parametric_solve(c, A, b, senses, 'min', rhs_direction=d, theta_range=theta_range, lb=lb, ub=ub)
+            self.assertFalse(any(piece.status != 'optimal' and piece.end - piece.start <= 1e-9 for piece in result.pieces))
+            for theta in [*result.breakpoints, *np.round(result.breakpoints, 6), 1.5, theta_range[1]]:
+                status, _, z, _ = tabular_simplex(c, A, b + theta * d, senses, 'min', verbose=False, lb=lb, ub=ub)
+                if status == 'optimal':
+                    self.assertAlmostEqual(result.objective_value(theta), z)
+                else:
+                    self.assertIsNone(result.objective_value(theta))
+            self.assertAlmostEqual(result.objective_value(1.5), -9.0)
+
+        # Only one direction may be given
+        with self.assertRaises(ValueError):
+            parametric_solve(c, A, b, ['<='] * 3, 'max')
+
 if __name__ == '__main__':
     unittest.main()
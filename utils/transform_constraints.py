@@ -1,4 +1,5 @@
 import numpy as np
+import scipy.sparse as sp
 from typing import List, Tuple
 import logging
 
@@ -11,9 +12,18 @@ def transform_constraints(
     senses: List[str]
 ) -> Tuple[np.ndarray, np.ndarray]:
     logger.info("Transforming constraints to standard form (<=)")
+
+    if sp.issparse(constraint_matrix):
+        # Flip the '>=' rows with a diagonal scaling so the result keeps its sparse format
+        signs = np.where(np.array(senses) == '>=', -1.0, 1.0)
+        transformed_constraint_matrix = (sp.diags(signs) @ constraint_matrix).asformat(constraint_matrix.format)
+        transformed_rhs_values = rhs_values * signs
+        logger.info("Constraints transformed successfully")
+        return transformed_constraint_matrix, transformed_rhs_values
     
-    transformed_constraint_matrix = constraint_matrix.copy()
-    transformed_rhs_values = rhs_values.copy()
+    # Work on floating-point copies so negating integer rows cannot overflow or truncate
+    transformed_constraint_matrix = constraint_matrix.astype(np.result_type(constraint_matrix.dtype, float))
+    transformed_rhs_values = rhs_values.astype(np.result_type(rhs_values.dtype, float))
     transformed_senses = senses.copy()  # Create a copy of the senses list
     
     for i, sense in enumerate(senses):
@@ -26,3 +36,43 @@ def transform_constraints(
             
     logger.info("Constraints transformed successfully")
     return transformed_constraint_matrix, transformed_rhs_values
+
+
+def rhs_sign_flips(rhs_values: np.ndarray, senses: List[str]) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    Row signs that make every right-hand side nonnegative, without touching the constraint matrix.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, List[str]]: The sign (+1 or -1) of each row, the
+        normalized right-hand side and the normalized senses.
+    """
+    rhs_values = np.asarray(rhs_values, dtype=float)
+    signs = np.where(rhs_values < 0, -1.0, 1.0)
+    flipped = {'<=': '>=', '>=': '<=', '=': '='}
+    normalized_senses = [flipped[sense] if sign < 0 else sense for sense, sign in zip(senses, signs)]
+    logger.debug("Normalized senses: %s", normalized_senses)
+    return signs, rhs_values * signs, normalized_senses
+
+
+def normalize_rhs_signs(
+    constraint_matrix: np.ndarray,
+    rhs_values: np.ndarray,
+    senses: List[str]
+) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    Negates every constraint with a negative right-hand side and flips its sense.
+
+    With all right-hand sides nonnegative, the slack and artificial columns from
+    setup_tableau form a feasible starting basis for Phase I.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, List[str]]: The normalized constraint matrix, right-hand side and senses.
+    """
+    logger.info("Normalizing right-hand side signs")
+    signs, normalized_rhs_values, normalized_senses = rhs_sign_flips(rhs_values, senses)
+
+    if sp.issparse(constraint_matrix):
+        normalized_constraint_matrix = (sp.diags(signs) @ constraint_matrix).asformat(constraint_matrix.format)
+    else:
+        normalized_constraint_matrix = constraint_matrix * signs[:, None]
+    return normalized_constraint_matrix, normalized_rhs_values, normalized_senses
@@ -0,0 +1,95 @@
+import numpy as np
+from typing import Tuple
+from utils.pivot import pivot
+from utils.out_of_core import DEFAULT_MEMORY_BUDGET, take_columns
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+def set_phase_one_objective(tableau: np.ndarray, basis: np.ndarray, artificial_columns: np.ndarray) -> np.ndarray:
+    """
+    Replaces the objective row with the Phase I objective: maximize -sum(artificials).
+
+    The row is priced out against the current basis, so its RHS entry is minus the
+    total infeasibility. Phase I has driven every artificial to zero exactly when
+    that entry reaches zero.
+
+    Args:
+        tableau (np.ndarray): Tableau whose constraint rows are in canonical form for `basis`.
+        basis (np.ndarray): Tableau column that is basic in each constraint row.
+        artificial_columns (np.ndarray): Boolean mask of the artificial tableau columns.
+
+    Returns:
+        np.ndarray: The tableau with the Phase I objective row.
+    """
+    tableau[0, :] = 0.0
+    tableau[0, :-1][artificial_columns] = 1.0
+    tableau[0, :] -= tableau[0, basis] @ tableau[1:, :]
+    logger.debug("Phase I objective row: %s", tableau[0])
+    return tableau
+
+
+def remove_artificial_variables(
+    tableau: np.ndarray,
+    basis: np.ndarray,
+    variable_indices: np.ndarray,
+    artificial_columns: np.ndarray,
+    tol: float = 1e-9,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Ends Phase I: pivots artificials that are basic at zero out of the basis and drops the artificial columns.
+
+    An artificial that cannot be pivoted out sits in a row with no nonzero entry in
+    any other column, i.e. a redundant constraint. Its column is kept; no later
+    pivot can change that row.
+
+    Args:
+        tableau (np.ndarray): Tableau at the end of Phase I.
+        basis (np.ndarray): Tableau column that is basic in each constraint row (updated in place).
+        variable_indices (np.ndarray): Layout-independent variable index of each tableau column.
+        artificial_columns (np.ndarray): Boolean mask of the artificial tableau columns.
+        tol (float): Entries with a smaller magnitude are not used as pivots.
+        memory_budget (int): Scratch bytes per row panel for the pivots and the column drop.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The reduced tableau, its basis and its variable indices.
+    """
+    for row in np.flatnonzero(artificial_columns[basis]):
+        candidates = np.flatnonzero(~artificial_columns & (np.abs(tableau[row + 1, :-1]) > tol))
+        if candidates.size == 0:
+            logger.info("Constraint %d is redundant, its artificial variable stays basic at zero", row)
+            continue
+        # The artificial is zero, so this pivot does not move the solution
+        entering = candidates[np.argmax(np.abs(tableau[row + 1, candidates]))]
+        tableau = pivot(tableau, entering, row + 1, memory_budget)
+        basis[row] = entering
+
+    keep = ~artificial_columns
+    keep[basis] = True
+    new_column = np.cumsum(keep) - 1
+    logger.info("Dropping %d artificial columns after Phase I", np.count_nonzero(~keep))
+    tableau = take_columns(tableau, np.append(keep, True), memory_budget)
+    return tableau, new_column[basis], variable_indices[keep]
+
+
+def set_phase_two_objective(tableau: np.ndarray, basis: np.ndarray, objective_row: np.ndarray) -> np.ndarray:
+    """
+    Restores the real objective row and prices it out against the current basis.
+
+    Args:
+        tableau (np.ndarray): Tableau at the end of Phase I.
+        basis (np.ndarray): Tableau column that is basic in each constraint row.
+        objective_row (np.ndarray): Objective row entries of the original variables as
+            built by setup_tableau (slack and surplus variables have zero cost).
+
+    Returns:
+        np.ndarray: The tableau with the Phase II objective row.
+    """
+    tableau[0, :] = 0.0
+    tableau[0, :len(objective_row)] = objective_row
+    tableau[0, :] -= tableau[0, basis] @ tableau[1:, :]
+    tableau[0, basis] = 0.0
+    logger.debug("Phase II objective row: %s", tableau[0])
+    return tableau
@@ -2,6 +2,7 @@ import streamlit as st
 import pandas as pd
 from webapp.logic.visualize_2d import visualize_2d
 import numpy as np  # Import numpy
+from utils.ratio_test import calculate_ratios
 
 def display_results(status, solution, objective_value, tableau_history, objective_coeffs, constraint_matrix, rhs_values, senses):
     st.header("Results")
@@ -12,16 +13,19 @@ def display_results(status, solution, objective_value, tableau_history, objectiv
 
         # Display tableau history
         st.header("Tableau History")
-        if tableau_history is not None:
-            for i, tableau in enumerate(tableau_history):
-                st.subheader(f"Iteration {i + 1}")
-                st.dataframe(pd.DataFrame(tableau))  # Display tableau as a dataframe
+        if tableau_history is not None and len(tableau_history) > 0:
+            # Only the selected tableau is fetched, so a pivot log rebuilds one tableau per rerun instead of all of them
+            iterations = getattr(tableau_history, 'iterations', range(len(tableau_history)))
+            i = st.number_input("Iteration", min_value=1, max_value=len(tableau_history), value=1, step=1) - 1
+            tableau = tableau_history[i]
+            st.subheader(f"Iteration {iterations[i] + 1}")
+            st.dataframe(pd.DataFrame(tableau))  # Display tableau as a dataframe
 
-                # Calculate and display ratios
-                if i < len(tableau_history) - 1:
-                    entering_col_index = np.argmin(tableau_history[i][0, :-1])
-                    ratios = calculate_ratios_from_tableau(tableau_history[i], entering_col_index)
-                    st.write(f"Ratios for Iteration {i + 1}: {ratios}")
+            # Calculate and display ratios
+            if i < len(tableau_history) - 1:
+                entering_col_index = np.argmin(tableau[0, :-1])
+                ratios = calculate_ratios_from_tableau(tableau, entering_col_index)
+                st.write(f"Ratios for Iteration {iterations[i] + 1}: {ratios}")
 
         # Display 2D graph if the problem has two variables
         if len(objective_coeffs) == 2:
@@ -34,13 +38,8 @@ def display_results(status, solution, objective_value, tableau_history, objectiv
         st.write("The problem is infeasible.")
         if len(objective_coeffs) == 2:
             visualize_2d(objective_coeffs, constraint_matrix, rhs_values, solution, senses)
+    elif status == 'timeout':
+        st.write("The solve did not finish within the time limit.")
 
 def calculate_ratios_from_tableau(tableau: np.ndarray, entering_col_index: int) -> np.ndarray:
-    ratios = []
-    for i in range(1, tableau.shape[0]):
-        if tableau[i, entering_col_index] > 0:
-            ratio = tableau[i, -1] / tableau[i, entering_col_index]
-            ratios.append(ratio)
-        else:
-            ratios.append(np.inf)
-    return np.array(ratios)
+    return calculate_ratios(tableau, entering_col_index)
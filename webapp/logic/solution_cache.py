@@ -0,0 +1,5 @@
+import os
+from utils.solution_cache import SolutionCache
+
+# One cache per server process, shared by every session; SIMPLEX_CACHE_DIR adds an on-disk store
+solution_cache = SolutionCache(max_entries=256, directory=os.environ.get('SIMPLEX_CACHE_DIR'))
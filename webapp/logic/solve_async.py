@@ -0,0 +1,109 @@
+import asyncio
+import itertools
+import logging
+import time
+from concurrent.futures import Executor
+from typing import AsyncIterator, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+def _advance(steps: Iterator, batch_size: int, deadline: float | None = None):
+    # Runs in the executor: up to batch_size engine steps, stopping early at the final state or
+    # the deadline (a time.monotonic() value); None if the engine ended without yielding a state
+    state = None
+    for state in itertools.islice(steps, batch_size):
+        if state.status != 'running' or (deadline is not None and time.monotonic() >= deadline):
+            break
+    return state
+
+async def solve_progress(
+        objective_coeffs,
+        constraint_matrix,
+        rhs_values,
+        senses,
+        problem_type,
+        verbose=False,
+        history='none',
+        batch_size=50,
+        timeout=None,
+        executor: Executor | None = None
+        ) -> AsyncIterator:
+    """
+    Async iterator over the progress of a tableau simplex solve.
+
+    The engine (iter_simplex) runs in an executor, batch_size steps at a time, and
+    control returns to the event loop after every batch, so one heavy problem does
+    not starve the other sessions served by the same loop. The state after each
+    batch is yielded; the last one has the final status. The deadline is checked
+    after every step, so a batch ends early when it passes. Cancelling the consuming
+    task stops the solve after the batch in progress.
+
+    Raises:
+        TimeoutError: If the solve has not finished `timeout` seconds after it started.
+        RuntimeError: If the engine stops without a final state.
+    """
+    from webapp.simplex import iter_simplex
+
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    steps = iter_simplex(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type,
+                         verbose=verbose, history=history)
+    while True:
+        state = await loop.run_in_executor(executor, _advance, steps, batch_size, deadline)
+        if state is None:
+            raise RuntimeError("The solver stopped without reporting a final state.")
+        yield state
+        if state.status != 'running':
+            return
+        if deadline is not None and time.monotonic() >= deadline:
+            logger.warning("Solve stopped at its deadline after %d iterations", state.iteration)
+            raise TimeoutError(f"The solve did not finish within {timeout} seconds.")
+
+async def solve_async(
+        objective_coeffs,
+        constraint_matrix,
+        rhs_values,
+        senses,
+        problem_type,
+        verbose=False,
+        history='pivots',
+        batch_size=50,
+        timeout=None,
+        progress: Callable | None = None,
+        executor: Executor | None = None
+        ):
+    """
+    Awaitable counterpart of solve_simplex, built on solve_progress.
+
+    `progress` is called with the state after every batch. Returns the same tuple as
+    solve_simplex, with status 'timeout' when the deadline passes and 'error' when
+    the solve fails; cancellation propagates to the caller. Finished solves are kept
+    in the webapp's solution cache, which solve_simplex shares.
+    """
+    from utils.history import get_history_policy
+    from webapp.logic.solution_cache import solution_cache
+    from utils.solution_cache import problem_key
+
+    tableau_history = get_history_policy(history)
+    try:
+        # A history object is not part of the key, so only named history policies are cached
+        key = None
+        if isinstance(history, str):
+            key = problem_key(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type,
+                              solver='solve_async', history=history)
+            cached = solution_cache.get(key)
+            if cached is not None:
+                return cached
+        async for state in solve_progress(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type,
+                                          verbose, tableau_history, batch_size, timeout, executor):
+            if progress is not None:
+                progress(state)
+        results = state.status, state.solution, state.objective_value, tableau_history
+        if key is not None:
+            solution_cache.put(key, results)
+        return results
+    except TimeoutError:
+        return "timeout", None, None, tableau_history
+    except Exception as e:
+        logger.exception(f"An error occurred: {e}")
+        return "error", None, None, None
@@ -1,5 +1,7 @@
 import logging
 import numpy as np
+from utils.solution_cache import problem_key
+from webapp.logic.solution_cache import solution_cache
 
 logger = logging.getLogger(__name__)
 
@@ -12,25 +14,19 @@ def solve_simplex(
         verbose=True
         ):
     try:
+        # Unchanged inputs (reruns, example problems) are answered from the cache
+        key = problem_key(objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, solver='solve_simplex')
+        cached = solution_cache.get(key)
+        if cached is not None:
+            return cached
+
         # Call the tabular simplex method
         from webapp.simplex import tabular_simplex
-        from webapp.logic.dual_simplex import dual_simplex # Import dual_simplex
-
-        # Check if the initial solution is optimal for a minimization problem
-        if problem_type == 'min':
-            # Check if all objective coefficients are non-negative
-            is_optimal = all(c >= 0 for c in objective_coeffs)
 
-            if is_optimal:
-                status, solution, objective_value, tableau_history = dual_simplex(objective_coeffs, constraint_matrix, rhs_values, senses, verbose)
-            else:
-                status, solution, objective_value, tableau_history = tabular_simplex(
-                    objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, verbose
-                )
-        else:
-            status, solution, objective_value, tableau_history = tabular_simplex(
-                objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, verbose
-            )
+        status, solution, objective_value, tableau_history = tabular_simplex(
+            objective_coeffs, constraint_matrix, rhs_values, senses, problem_type, verbose, history='pivots'
+        )
+        solution_cache.put(key, (status, solution, objective_value, tableau_history))
         return status, solution, objective_value, tableau_history
     except Exception as e:
         logger.exception(f"An error occurred: {e}")